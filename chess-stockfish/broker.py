@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""Job broker and engine workers for the Stockfish web UI.
+
+A single ``serve.py`` process can only drive the engines of one machine.
+In split mode the HTTP frontends (``serve.py --broker ADDR``) submit search
+jobs to a broker, and engine workers on the same or other hosts pull jobs,
+run them on their local Stockfish and send the results back.
+
+Everything speaks newline-delimited JSON over a TCP (``host:port``) or Unix
+(``unix:/path/to.sock``) socket::
+
+    python chess-stockfish/broker.py broker --listen 127.0.0.1:9000
+    python chess-stockfish/broker.py worker --connect 127.0.0.1:9000 --processes 4
+    python chess-stockfish/serve.py --port 8000 --broker 127.0.0.1:9000
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import json
+import multiprocessing
+import os
+import pathlib
+import select
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+
+Address = Union[Tuple[str, int], str]
+
+DEFAULT_JOB_TIMEOUT = 120.0
+DEFAULT_READY_TIMEOUT = 30.0
+# Workers a job may take down (disconnect mid-job) before it is failed.
+MAX_JOB_ATTEMPTS = 3
+RECONNECT_DELAY = 1.0
+# How often an idle worker connection is checked for a peer that went away.
+WORKER_IDLE_CHECK = 0.5
+
+
+class EngineNotReady(RuntimeError):
+    """Raised when no engine (or broker) became available within the wait timeout."""
+
+
+def parse_address(spec: str) -> Address:
+    """Parse ``host:port`` or ``unix:/path`` into a socket address."""
+    if spec.startswith("unix:"):
+        return spec[len("unix:"):]
+    host, _, port = spec.rpartition(":")
+    return (host or "127.0.0.1", int(port))
+
+
+def connect(address: Address) -> socket.socket:
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.connect(address)
+    return sock
+
+
+class _Channel:
+    """Line-delimited JSON framing over a connected socket."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._reader = sock.makefile("rb")
+        self._write_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def send(self, message: Dict[str, object]) -> None:
+        data = json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._write_lock:
+            self.sock.sendall(data)
+
+    # ------------------------------------------------------------------
+    def recv(self) -> Optional[Dict[str, object]]:
+        line = self._reader.readline()
+        if not line:
+            return None
+        return json.loads(line)
+
+    # ------------------------------------------------------------------
+    def peer_closed(self) -> bool:
+        """Whether the peer has closed a connection that has no unread data."""
+        readable, _, _ = select.select([self.sock], [], [], 0)
+        if not readable:
+            return False
+        try:
+            return not self.sock.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._reader.close()
+        self.sock.close()
+
+
+class _Job:
+    __slots__ = ("job_id", "payload", "frontend", "attempts")
+
+    def __init__(self, job_id: object, payload: Dict[str, object], frontend: _Channel):
+        self.job_id = job_id
+        self.payload = payload
+        self.frontend = frontend
+        # Workers that went away while running this job.
+        self.attempts = 0
+
+
+class _JobQueue:
+    """FIFO of pending jobs; jobs lost by a dying worker go back to the front."""
+
+    def __init__(self) -> None:
+        self._jobs: Deque[_Job] = collections.deque()
+        self._cond = threading.Condition()
+
+    def put(self, job: _Job) -> None:
+        with self._cond:
+            self._jobs.append(job)
+            self._cond.notify()
+
+    def requeue(self, job: _Job) -> None:
+        with self._cond:
+            self._jobs.appendleft(job)
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[_Job]:
+        """Next job, or ``None`` if none arrived within ``timeout`` seconds."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._jobs, timeout):
+                return None
+            return self._jobs.popleft()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+
+class _BrokerHandler(socketserver.BaseRequestHandler):
+    server: "_BrokerServerMixin"
+
+    def handle(self) -> None:
+        channel = _Channel(self.request)
+        try:
+            hello = channel.recv()
+            if not hello or hello.get("op") != "hello":
+                return
+            if hello.get("role") == "worker":
+                self._serve_worker(channel)
+            else:
+                self._serve_frontend(channel)
+        except (OSError, ValueError):
+            pass
+        finally:
+            channel.close()
+
+    # ------------------------------------------------------------------
+    def _serve_frontend(self, channel: _Channel) -> None:
+        while True:
+            message = channel.recv()
+            if message is None:
+                return
+            if message.get("op") == "submit":
+                self.server.jobs.put(_Job(message["id"], message["job"], channel))
+            elif message.get("op") == "stats":
+                channel.send({"op": "stats", "id": message.get("id"), **self.server.stats()})
+
+    # ------------------------------------------------------------------
+    def _serve_worker(self, channel: _Channel) -> None:
+        with self.server.stats_lock:
+            self.server.workers += 1
+        try:
+            while True:
+                job = self.server.jobs.get(timeout=WORKER_IDLE_CHECK)
+                if job is None:
+                    # Idle workers send nothing, so a readable socket means the
+                    # worker hung up; stop counting it right away.
+                    if channel.peer_closed():
+                        return
+                    continue
+                try:
+                    channel.send({"op": "job", "id": job.job_id, "job": job.payload})
+                    reply = channel.recv()
+                    # Streamed search info goes straight through to the frontend.
+                    while reply is not None and reply.get("op") == "info":
+                        reply["id"] = job.job_id
+                        try:
+                            job.frontend.send(reply)
+                        except OSError:
+                            pass
+                        reply = channel.recv()
+                except (OSError, ValueError):
+                    reply = None
+                if reply is None:
+                    # Worker went away mid-job: hand the job to someone else,
+                    # unless it keeps taking workers down with it.
+                    job.attempts += 1
+                    if job.attempts < MAX_JOB_ATTEMPTS:
+                        self.server.jobs.requeue(job)
+                        return
+                    try:
+                        job.frontend.send(
+                            {
+                                "op": "error",
+                                "id": job.job_id,
+                                "error": f"Job failed on {job.attempts} workers; giving up",
+                            }
+                        )
+                    except OSError:
+                        pass
+                    return
+                reply["id"] = job.job_id
+                try:
+                    job.frontend.send(reply)
+                except OSError:
+                    pass  # Frontend disconnected; nobody is waiting for it.
+        finally:
+            with self.server.stats_lock:
+                self.server.workers -= 1
+
+
+class _BrokerServerMixin:
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def init_broker(self) -> None:
+        self.jobs = _JobQueue()
+        self.stats_lock = threading.Lock()
+        self.workers = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self.stats_lock:
+            return {"workers": self.workers, "queued": len(self.jobs)}
+
+
+class _TCPBrokerServer(_BrokerServerMixin, socketserver.ThreadingTCPServer):
+    pass
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixBrokerServer(_BrokerServerMixin, socketserver.ThreadingUnixStreamServer):
+        pass
+
+
+def make_broker(address: Address) -> socketserver.BaseServer:
+    """Create (but do not start) a broker bound to ``address``."""
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.unlink(address)
+        server: _BrokerServerMixin = _UnixBrokerServer(address, _BrokerHandler)
+    else:
+        server = _TCPBrokerServer(address, _BrokerHandler)
+    server.init_broker()
+    return server  # type: ignore[return-value]
+
+
+def _exit_on_sigterm() -> None:
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+
+def run_broker(address: Address) -> None:
+    _exit_on_sigterm()
+    server = make_broker(address)
+    print(f"Broker listening on {address}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if isinstance(address, str) and os.path.exists(address):
+            os.unlink(address)
+
+
+class BrokerClient:
+    """Frontend side of the broker: drop-in for ``StockfishEngine.best_move``.
+
+    One connection is shared by all HTTP handler threads; replies are
+    matched to waiting callers by job id.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        timeout: float = DEFAULT_JOB_TIMEOUT,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT,
+    ):
+        self._address = address
+        self._timeout = timeout
+        self._ready_timeout = ready_timeout
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pending: Dict[
+            int, Tuple[threading.Event, Dict[str, object], Optional[Callable]]
+        ] = {}
+        self._channel: Optional[_Channel] = None
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Connect to the broker in the background."""
+        threading.Thread(
+            target=self.wait_ready, args=(float("inf"),), daemon=True
+        ).start()
+
+    # ------------------------------------------------------------------
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Retry connecting to the broker for up to ``timeout`` seconds."""
+        deadline = time.monotonic() + (self._ready_timeout if timeout is None else timeout)
+        while True:
+            try:
+                self._ensure_connected()
+                return True
+            except OSError:
+                if time.monotonic() + RECONNECT_DELAY > deadline:
+                    return False
+                time.sleep(RECONNECT_DELAY)
+
+    # ------------------------------------------------------------------
+    def status(self) -> Dict[str, object]:
+        """Readiness for load balancers: connected and at least one worker."""
+        try:
+            stats = self.stats(timeout=2.0)
+        except (OSError, RuntimeError) as exc:
+            return {"ready": False, "error": str(exc)}
+        return {"ready": stats["workers"] > 0, **stats}
+
+    # ------------------------------------------------------------------
+    def _ensure_connected(self) -> _Channel:
+        with self._lock:
+            if self._channel is None:
+                channel = _Channel(connect(self._address))
+                channel.send({"op": "hello", "role": "frontend"})
+                threading.Thread(
+                    target=self._read_replies, args=(channel,), daemon=True
+                ).start()
+                self._channel = channel
+            return self._channel
+
+    # ------------------------------------------------------------------
+    def _read_replies(self, channel: _Channel) -> None:
+        try:
+            while True:
+                message = channel.recv()
+                if message is None:
+                    break
+                waiter = self._pending.get(message.get("id"))  # type: ignore[arg-type]
+                if waiter is None:
+                    continue
+                event, slot, on_info = waiter
+                if message.get("op") == "info":
+                    if on_info is not None:
+                        on_info(message["info"])
+                else:
+                    slot.update(message)
+                    event.set()
+        except (OSError, ValueError):
+            pass
+        with self._lock:
+            if self._channel is channel:
+                self._channel = None
+            pending = list(self._pending.values())
+        for event, slot, _ in pending:
+            slot.setdefault("error", "Lost connection to broker")
+            event.set()
+
+    # ------------------------------------------------------------------
+    def _request(
+        self,
+        message: Dict[str, object],
+        timeout: Optional[float] = None,
+        on_info: Optional[Callable] = None,
+    ) -> Dict[str, object]:
+        job_id = next(self._ids)
+        event = threading.Event()
+        slot: Dict[str, object] = {}
+        self._pending[job_id] = (event, slot, on_info)
+        try:
+            self._ensure_connected().send({**message, "id": job_id})
+            answered = event.wait(self._timeout if timeout is None else timeout)
+        except OSError as exc:
+            with self._lock:
+                self._channel = None
+            raise RuntimeError(f"Broker unavailable: {exc}") from exc
+        finally:
+            self._pending.pop(job_id, None)
+        if not answered:
+            raise TimeoutError("Timed out waiting for the broker")
+        if "error" in slot:
+            raise RuntimeError(str(slot["error"]))
+        return slot
+
+    # ------------------------------------------------------------------
+    def best_move(
+        self,
+        fen: str,
+        skill: int = 20,
+        depth: int = 18,
+        movetime: Optional[int] = None,
+        seed: Optional[int] = None,
+        trace: Optional[Dict[str, object]] = None,
+        on_info: Optional[Callable] = None,
+    ) -> Dict[str, Optional[str]]:
+        started = time.perf_counter()
+        if not self.wait_ready():
+            raise EngineNotReady(f"Broker at {self._address} is not reachable")
+        job = {
+            "fen": fen,
+            "skill": skill,
+            "depth": depth,
+            "movetime": movetime,
+            "seed": seed,
+            "trace": trace is not None,
+            "info": on_info is not None,
+        }
+        reply = self._request({"op": "submit", "job": job}, on_info=on_info)
+        if trace is not None:
+            trace.update(reply.get("trace") or {})
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            # Everything not spent in the worker's engine: queueing plus transport.
+            trace["wait_ms"] = round(elapsed_ms - float(trace.get("engine_ms", 0.0)), 1)
+        return reply["result"]  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    def stats(self, timeout: Optional[float] = None) -> Dict[str, object]:
+        reply = self._request({"op": "stats"}, timeout)
+        return {key: reply[key] for key in ("workers", "queued")}
+
+    # ------------------------------------------------------------------
+    def shutdown(self) -> None:
+        with self._lock:
+            channel, self._channel = self._channel, None
+        if channel is not None:
+            channel.close()
+
+
+def _worker_loop(address: Address, engine_path: pathlib.Path) -> None:
+    """Pull jobs from the broker forever, reconnecting when it goes away."""
+    from serve import StockfishEngine  # Imported lazily: serve imports this module.
+
+    engine = StockfishEngine(engine_path)
+    try:
+        while True:
+            try:
+                channel = _Channel(connect(address))
+            except OSError:
+                time.sleep(RECONNECT_DELAY)
+                continue
+            try:
+                channel.send({"op": "hello", "role": "worker", "pid": os.getpid()})
+                while True:
+                    message = channel.recv()
+                    if message is None:
+                        break
+                    if message.get("op") != "job":
+                        continue
+                    job = message["job"]
+                    trace: Optional[Dict[str, object]] = {} if job.get("trace") else None
+                    on_info = None
+                    if job.get("info"):
+                        on_info = lambda info: channel.send({"op": "info", "info": info})
+                    try:
+                        result = engine.best_move(
+                            job["fen"],
+                            skill=job.get("skill", 20),
+                            depth=job.get("depth", 18),
+                            movetime=job.get("movetime"),
+                            seed=job.get("seed"),
+                            trace=trace,
+                            on_info=on_info,
+                        )
+                        channel.send({"op": "result", "result": result, "trace": trace})
+                    except Exception as exc:  # pylint: disable=broad-except
+                        traceback.print_exc()
+                        channel.send({"op": "error", "error": str(exc)})
+            except (OSError, ValueError):
+                pass
+            finally:
+                channel.close()
+            time.sleep(RECONNECT_DELAY)
+    finally:
+        engine.shutdown()
+
+
+def run_workers(address: Address, engine_path: pathlib.Path, processes: int = 1) -> None:
+    """Run ``processes`` engine worker processes until interrupted."""
+    _exit_on_sigterm()
+    workers = [
+        multiprocessing.Process(
+            target=_worker_loop, args=(address, engine_path), daemon=True
+        )
+        for _ in range(max(1, processes))
+    ]
+    for proc in workers:
+        proc.start()
+    print(f"Started {len(workers)} engine worker(s) for broker {address}")
+    try:
+        for proc in workers:
+            proc.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for proc in workers:
+            if proc.is_alive():
+                proc.terminate()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from serve import ENGINE_PATH
+
+    parser = argparse.ArgumentParser(description="Stockfish job broker and engine workers")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    broker_parser = sub.add_parser("broker", help="Run the job broker")
+    broker_parser.add_argument(
+        "--listen", default="127.0.0.1:9000", help="host:port or unix:/path (default: 127.0.0.1:9000)"
+    )
+
+    worker_parser = sub.add_parser("worker", help="Run engine worker processes")
+    worker_parser.add_argument(
+        "--connect", default="127.0.0.1:9000", help="Broker address (default: 127.0.0.1:9000)"
+    )
+    worker_parser.add_argument(
+        "--processes", type=int, default=1, help="Number of worker processes (default: 1)"
+    )
+    worker_parser.add_argument(
+        "--engine", type=pathlib.Path, default=ENGINE_PATH, help="UCI engine binary"
+    )
+
+    args = parser.parse_args()
+    if args.command == "broker":
+        run_broker(parse_address(args.listen))
+    else:
+        run_workers(parse_address(args.connect), args.engine, args.processes)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Engine session recording and deterministic replay.
+
+``serve.py --record session.jsonl`` appends one compact JSON object per
+``/api/best-move`` call: the request (FEN, parameters and RNG seed), the UCI
+transcript and timings. This tool feeds a recorded session back at the
+original or an accelerated pace, against a real engine or a fake one that
+answers from the recorded transcripts, and reports latency statistics so
+scheduler and cache changes can be compared on real traffic::
+
+    python chess-stockfish/replay.py session.jsonl --engines 2
+    python chess-stockfish/replay.py session.jsonl --fake --speed 4
+    python chess-stockfish/replay.py session.jsonl --broker 127.0.0.1:9000 --speed 0
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import pathlib
+import threading
+import time
+from typing import Deque, Dict, List, Optional, Tuple
+
+REQUEST_KEYS = ("fen", "skill", "depth", "movetime", "seed")
+
+
+class SessionRecorder:
+    """Thread-safe JSONL writer for engine requests."""
+
+    def __init__(self, path: pathlib.Path):
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def call(
+        self, engine, request: Dict[str, object], started: float, **options
+    ) -> Dict[str, object]:
+        """Run ``engine.best_move(**request, **options)`` and record it.
+
+        ``started`` is the ``time.perf_counter()`` value at which the HTTP
+        request arrived, so ``total_ms`` includes body parsing and queueing.
+        """
+        record: Dict[str, object] = {
+            "ts": round(time.time() - (time.perf_counter() - started), 3),
+            **request,
+        }
+        trace: Dict[str, object] = {}
+        try:
+            result = engine.best_move(**request, trace=trace, **options)
+        except Exception as exc:
+            record["error"] = str(exc)
+            raise
+        else:
+            record["result"] = result
+            return result
+        finally:
+            record["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            record.update(trace)
+            self.write(record)
+
+    # ------------------------------------------------------------------
+    def write(self, record: Dict[str, object]) -> None:
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def load_session(path: pathlib.Path) -> List[Dict[str, object]]:
+    with open(path, encoding="utf-8") as handle:
+        records = [json.loads(line) for line in handle if line.strip()]
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+def _request_of(record: Dict[str, object]) -> Dict[str, object]:
+    return {key: record.get(key) for key in REQUEST_KEYS}
+
+
+class _AnswerBook:
+    """Recorded answers keyed by request, shared by all fake engines."""
+
+    def __init__(self, records: List[Dict[str, object]]):
+        self._lock = threading.Lock()
+        self._answers: Dict[Tuple[object, ...], Deque[Dict[str, object]]] = (
+            collections.defaultdict(collections.deque)
+        )
+        for record in records:
+            self._answers[self.key(_request_of(record))].append(record)
+
+    @staticmethod
+    def key(request: Dict[str, object]) -> Tuple[object, ...]:
+        return tuple(request.get(name) for name in REQUEST_KEYS)
+
+    def take(self, request: Dict[str, object]) -> Dict[str, object]:
+        with self._lock:
+            answers = self._answers.get(self.key(request))
+            if not answers:
+                raise RuntimeError("No recorded answer for this request")
+            # Keep the last answer around so repeated positions still resolve.
+            return answers.popleft() if len(answers) > 1 else answers[0]
+
+
+class TranscriptEngine:
+    """Fake engine: answers from the session, taking the recorded engine time."""
+
+    def __init__(self, book: _AnswerBook, time_scale: float = 1.0):
+        self._book = book
+        self._time_scale = time_scale
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def best_move(
+        self,
+        fen: str,
+        skill: int = 20,
+        depth: int = 18,
+        movetime: Optional[int] = None,
+        seed: Optional[int] = None,
+        trace: Optional[Dict[str, object]] = None,
+        on_info=None,
+    ) -> Dict[str, Optional[str]]:
+        with self._lock:
+            record = self._book.take(
+                {"fen": fen, "skill": skill, "depth": depth, "movetime": movetime, "seed": seed}
+            )
+            engine_ms = float(record.get("engine_ms") or 0.0)
+            time.sleep(engine_ms * self._time_scale / 1000)
+            if trace is not None:
+                trace["uci"] = record.get("uci", [])
+                trace["engine_ms"] = round(engine_ms * self._time_scale, 1)
+            if "error" in record:
+                raise RuntimeError(str(record["error"]))
+            if on_info is not None:
+                on_info(record["result"]["info"])  # type: ignore[index]
+            return record["result"]  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    def shutdown(self) -> None:
+        pass
+
+
+def _schedule(
+    records: List[Dict[str, object]], speed: float, max_gap: Optional[float]
+) -> List[float]:
+    """Start offsets (seconds) for each record under the requested pacing."""
+    offsets: List[float] = []
+    elapsed = 0.0
+    previous = None
+    for record in records:
+        ts = float(record["ts"])  # type: ignore[arg-type]
+        if previous is not None:
+            gap = ts - previous
+            if max_gap is not None:
+                gap = min(gap, max_gap)
+            elapsed += gap
+        previous = ts
+        offsets.append(elapsed / speed if speed > 0 else 0.0)
+    return offsets
+
+
+def _summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"mean": None, "p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def percentile(pct: float) -> float:
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+        return round(ordered[rank], 1)
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 1),
+        "p50": percentile(50),
+        "p90": percentile(90),
+        "p99": percentile(99),
+        "max": round(ordered[-1], 1),
+    }
+
+
+def replay(
+    records: List[Dict[str, object]],
+    engine,
+    speed: float = 1.0,
+    max_gap: Optional[float] = None,
+) -> Dict[str, object]:
+    """Replay ``records`` against ``engine`` and return a latency report."""
+    offsets = _schedule(records, speed, max_gap)
+    outcomes: List[Optional[Dict[str, object]]] = [None] * len(records)
+
+    def run(index: int) -> None:
+        record = records[index]
+        trace: Dict[str, object] = {}
+        started = time.perf_counter()
+        outcome: Dict[str, object] = {}
+        try:
+            result = engine.best_move(**_request_of(record), trace=trace)
+            expected = record.get("result") or {}
+            outcome["mismatch"] = result.get("move") != expected.get("move")  # type: ignore[union-attr]
+        except Exception as exc:  # pylint: disable=broad-except
+            outcome["error"] = str(exc)
+        outcome["total_ms"] = (time.perf_counter() - started) * 1000
+        outcome["wait_ms"] = float(trace.get("wait_ms") or 0.0)
+        outcome["engine_ms"] = float(trace.get("engine_ms") or 0.0)
+        outcomes[index] = outcome
+
+    threads = []
+    origin = time.perf_counter()
+    for index, offset in enumerate(offsets):
+        delay = origin + offset - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        thread = threading.Thread(target=run, args=(index,), daemon=True)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    wall_s = time.perf_counter() - origin
+
+    done = [outcome for outcome in outcomes if outcome is not None]
+    ok = [outcome for outcome in done if "error" not in outcome]
+    return {
+        "requests": len(records),
+        "errors": len(done) - len(ok),
+        "mismatches": sum(1 for outcome in ok if outcome["mismatch"]),
+        "speed": speed,
+        "wall_s": round(wall_s, 3),
+        "recorded": {
+            "total_ms": _summarize([float(r["total_ms"]) for r in records if "total_ms" in r]),
+            "wait_ms": _summarize([float(r["wait_ms"]) for r in records if "wait_ms" in r]),
+            "engine_ms": _summarize([float(r["engine_ms"]) for r in records if "engine_ms" in r]),
+        },
+        "replayed": {
+            "total_ms": _summarize([float(o["total_ms"]) for o in ok]),
+            "wait_ms": _summarize([float(o["wait_ms"]) for o in ok]),
+            "engine_ms": _summarize([float(o["engine_ms"]) for o in ok]),
+        },
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from broker import BrokerClient, parse_address
+    from serve import ENGINE_PATH, EnginePool
+
+    parser = argparse.ArgumentParser(description="Replay a recorded engine session")
+    parser.add_argument("session", type=pathlib.Path, help="JSONL file written by serve.py --record")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Pacing multiplier: 1 = original, 4 = four times faster, 0 = no pacing (default: 1)",
+    )
+    parser.add_argument(
+        "--max-gap", type=float, default=None, help="Cap idle gaps between requests (seconds)"
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--fake", action="store_true", help="Answer from the recorded transcripts instead of an engine"
+    )
+    target.add_argument("--broker", help="Send the jobs to a broker (host:port or unix:/path)")
+    parser.add_argument("--engine", type=pathlib.Path, default=ENGINE_PATH, help="UCI engine binary")
+    parser.add_argument("--engines", type=int, default=1, help="Engine pool size (default: 1)")
+    parser.add_argument("--output", type=pathlib.Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    session = load_session(args.session)
+    if args.broker:
+        backend = BrokerClient(parse_address(args.broker))
+    elif args.fake:
+        book = _AnswerBook(session)
+        backend = EnginePool(
+            args.engine, args.engines, engine_factory=lambda: TranscriptEngine(book)
+        )
+    else:
+        backend = EnginePool(args.engine, args.engines)
+    backend.start()
+    if not backend.wait_ready():
+        raise SystemExit("Engine did not become ready")
+    try:
+        report = replay(session, backend, speed=args.speed, max_gap=args.max_gap)
+    finally:
+        backend.shutdown()
+
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(encoded + "\n", encoding="utf-8")
+    print(encoded)
@@ -2,7 +2,8 @@
 """Development server for the Stockfish web UI.
 
 Serves static assets from ./static and exposes a small JSON API that
-interfaces with the bundled macOS Stockfish engine.
+interfaces with the bundled macOS Stockfish engine, or with remote engine
+workers through a job broker (see broker.py).
 """
 
 from __future__ import annotations
@@ -11,16 +12,27 @@ import atexit
 import json
 import os
 import pathlib
+import queue
+import random
 import subprocess
 import threading
+import time
 import traceback
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Union
+
+from broker import DEFAULT_READY_TIMEOUT, BrokerClient, EngineNotReady, parse_address
+from replay import SessionRecorder
+from ws import WebSocket, WebSocketClosed, accept_key
 
 BASE_DIR = pathlib.Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
 ENGINE_PATH = BASE_DIR / "bin" / "stockfish-mac"
+# Engine requests a single WebSocket connection may have running at once.
+WS_MAX_IN_FLIGHT = 4
+
+InfoCallback = Callable[[Dict[str, Optional[str]]], None]
 
 
 class StockfishEngine:
@@ -28,8 +40,11 @@ class StockfishEngine:
 
     def __init__(self, engine_path: pathlib.Path):
         self._engine_path = engine_path
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
         self._process: Optional[subprocess.Popen[str]] = None
+        # UCI transcript of the current best_move() call, when tracing.
+        self._transcript: Optional[List[str]] = None
+        self._transcript_origin = 0.0
         self._start_engine()
 
     # ------------------------------------------------------------------
@@ -69,14 +84,23 @@ class StockfishEngine:
             line = self._process.stdout.readline()
             if not line:
                 raise RuntimeError("Stockfish engine closed unexpectedly")
+            if self._transcript is not None:
+                self._log_uci("<", line.rstrip("\n"))
             yield line
 
     # ------------------------------------------------------------------
     def _write_line(self, command: str) -> None:
         assert self._process is not None and self._process.stdin is not None
+        if self._transcript is not None:
+            self._log_uci(">", command)
         self._process.stdin.write(command + "\n")
         self._process.stdin.flush()
 
+    # ------------------------------------------------------------------
+    def _log_uci(self, direction: str, line: str) -> None:
+        elapsed_ms = (time.perf_counter() - self._transcript_origin) * 1000
+        self._transcript.append(f"{elapsed_ms:.1f}{direction}{line}")
+
     # ------------------------------------------------------------------
     def ensure_running(self) -> None:
         if self._process is None or self._process.poll() is not None:
@@ -89,6 +113,38 @@ class StockfishEngine:
         skill: int = 20,
         depth: int = 18,
         movetime: Optional[int] = None,
+        seed: Optional[int] = None,
+        trace: Optional[Dict[str, object]] = None,
+        on_info: Optional[InfoCallback] = None,
+    ) -> Dict[str, Optional[str]]:
+        """Search ``fen`` and return the chosen move.
+
+        ``seed`` makes the human-like mistake simulation reproducible. When
+        ``trace`` is given it receives the UCI transcript (``"uci"``) and the
+        time spent in the engine (``"engine_ms"``). ``on_info`` is called with
+        the parsed search info every time the engine reports a new PV.
+        """
+        with self._lock:
+            if trace is None:
+                return self._search(fen, skill, depth, movetime, seed, on_info)
+            started = time.perf_counter()
+            self._transcript = trace["uci"] = []
+            self._transcript_origin = started
+            try:
+                return self._search(fen, skill, depth, movetime, seed, on_info)
+            finally:
+                self._transcript = None
+                trace["engine_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    # ------------------------------------------------------------------
+    def _search(
+        self,
+        fen: str,
+        skill: int,
+        depth: int,
+        movetime: Optional[int],
+        seed: Optional[int],
+        on_info: Optional[InfoCallback],
     ) -> Dict[str, Optional[str]]:
         with self._lock:
             self.ensure_running()
@@ -98,20 +154,20 @@ class StockfishEngine:
                 movetime = max(100, int(movetime))
 
             # Add human-like mistakes based on skill level
-            import random
+            rng = random.Random(seed)
             mistake_probability = max(0.3, (20 - skill) / 20 * 0.9)  # 30% at skill 20, 90% at skill 0
             
-            if random.random() < mistake_probability:
+            if rng.random() < mistake_probability:
                 # Make a suboptimal move by using much lower depth
                 actual_depth = max(1, depth // 5)
                 # Add significant randomness to skill
-                actual_skill = max(0, skill - random.randint(5, 15))
+                actual_skill = max(0, skill - rng.randint(5, 15))
                 # Consider multiple lines to pick suboptimal moves
-                multipv = random.randint(3, 5)
+                multipv = rng.randint(3, 5)
             else:
                 actual_depth = max(1, depth // 2)
-                actual_skill = max(0, skill - random.randint(0, 5))
-                multipv = random.randint(1, 3)
+                actual_skill = max(0, skill - rng.randint(0, 5))
+                multipv = rng.randint(1, 3)
 
             # Enable UCI_LimitStrength for more human-like play
             self._write_line("setoption name UCI_LimitStrength value true")
@@ -140,6 +196,14 @@ class StockfishEngine:
                 line = raw.strip()
                 if line.startswith("info "):
                     self._parse_info_line(line, last_info)
+                    if on_info is not None and " pv " in line:
+                        try:
+                            on_info(dict(last_info))
+                        except Exception:
+                            # The engine is still searching; leave it idle so the
+                            # next search does not read this one's bestmove.
+                            self._abort_search()
+                            raise
                 elif line.startswith("bestmove"):
                     parts = line.split()
                     move = parts[1] if len(parts) > 1 else None
@@ -152,6 +216,17 @@ class StockfishEngine:
 
             raise RuntimeError("Failed to receive bestmove from Stockfish")
 
+    # ------------------------------------------------------------------
+    def _abort_search(self) -> None:
+        """Stop the running search and read its output up to ``bestmove``."""
+        try:
+            self._write_line("stop")
+            for raw in self._iter_stdout():
+                if raw.startswith("bestmove"):
+                    return
+        except (OSError, RuntimeError):
+            pass  # Engine died; ensure_running restarts it on the next search.
+
     # ------------------------------------------------------------------
     @staticmethod
     def _parse_info_line(line: str, target: Dict[str, Optional[str]]) -> None:
@@ -197,11 +272,161 @@ class StockfishEngine:
         self._process = None
 
 
-ENGINE = StockfishEngine(ENGINE_PATH)
-atexit.register(ENGINE.shutdown)
+class EnginePool:
+    """Fixed set of engines that spawn and handshake in the background.
+
+    ``start()`` returns immediately; each engine is launched on its own
+    thread so the ``uci``/``isready`` round trips run in parallel. The pool
+    is ready as soon as one engine is available. ``engine_factory`` replaces
+    the Stockfish process, e.g. with the transcript player in replay.py.
+    """
+
+    def __init__(
+        self,
+        engine_path: pathlib.Path,
+        size: int = 1,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT,
+        engine_factory: Optional[Callable[[], StockfishEngine]] = None,
+    ):
+        self._engine_factory = engine_factory or (lambda: StockfishEngine(engine_path))
+        self._size = max(1, size)
+        self._ready_timeout = ready_timeout
+        self._lock = threading.Lock()
+        self._engines: List[StockfishEngine] = []
+        self._idle: "queue.Queue[StockfishEngine]" = queue.Queue()
+        self._failed = 0
+        self._error: Optional[str] = None
+        self._ready = threading.Event()
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        for index in range(self._size):
+            threading.Thread(
+                target=self._spawn, name=f"engine-warmup-{index}", daemon=True
+            ).start()
+
+    # ------------------------------------------------------------------
+    def _spawn(self) -> None:
+        try:
+            engine = self._engine_factory()
+        except Exception as exc:  # pylint: disable=broad-except
+            traceback.print_exc()
+            with self._lock:
+                self._failed += 1
+                self._error = str(exc)
+            return
+        with self._lock:
+            self._engines.append(engine)
+        self._idle.put(engine)
+        self._ready.set()
+
+    # ------------------------------------------------------------------
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        deadline = time.monotonic() + (self._ready_timeout if timeout is None else timeout)
+        while not self._ready.is_set():
+            remaining = deadline - time.monotonic()
+            with self._lock:
+                all_failed = self._failed == self._size
+            if all_failed or remaining <= 0:
+                return False
+            self._ready.wait(min(remaining, 0.1))
+        return True
+
+    # ------------------------------------------------------------------
+    def status(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "ready": bool(self._engines),
+                "engines": len(self._engines),
+                "size": self._size,
+                "failed": self._failed,
+                "error": self._error,
+            }
+
+    # ------------------------------------------------------------------
+    def best_move(
+        self,
+        fen: str,
+        skill: int = 20,
+        depth: int = 18,
+        movetime: Optional[int] = None,
+        seed: Optional[int] = None,
+        trace: Optional[Dict[str, object]] = None,
+        on_info: Optional[InfoCallback] = None,
+    ) -> Dict[str, Optional[str]]:
+        started = time.perf_counter()
+        if not self.wait_ready():
+            raise EngineNotReady(self._error or "Engine is still starting up")
+        engine = self._idle.get()
+        if trace is not None:
+            trace["wait_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        try:
+            return engine.best_move(
+                fen,
+                skill=skill,
+                depth=depth,
+                movetime=movetime,
+                seed=seed,
+                trace=trace,
+                on_info=on_info,
+            )
+        finally:
+            self._idle.put(engine)
+
+    # ------------------------------------------------------------------
+    def shutdown(self) -> None:
+        with self._lock:
+            engines, self._engines = self._engines, []
+        for engine in engines:
+            engine.shutdown()
+
+
+# Created by run_server(): a local engine pool, or a broker client in split mode.
+ENGINE: Optional[Union[EnginePool, BrokerClient]] = None
+# Set by run_server(record=...): appends every engine request to a JSONL file.
+RECORDER: Optional[SessionRecorder] = None
+
+
+def parse_move_request(data: Dict[str, object]) -> Dict[str, object]:
+    """Normalise an API payload into ``best_move`` keyword arguments."""
+    seed = data.get("seed")
+    return {
+        "fen": data["fen"],
+        "skill": int(data.get("skill", 20)),
+        "depth": int(data.get("depth", 18)),
+        "movetime": data.get("movetime"),
+        "seed": int(seed) if seed is not None else random.getrandbits(32),
+    }
+
+
+def run_engine_request(
+    request: Dict[str, object],
+    started: float,
+    on_info: Optional[InfoCallback] = None,
+) -> Dict[str, Optional[str]]:
+    if RECORDER is None:
+        return ENGINE.best_move(**request, on_info=on_info)
+    return RECORDER.call(ENGINE, request, started, on_info=on_info)
+
+
+def _ws_push(channel: WebSocket, message: Dict[str, object]) -> None:
+    try:
+        channel.send(json.dumps(message, separators=(",", ":")))
+    except (OSError, WebSocketClosed):
+        pass
+
+
+def _ws_request_id(text: str) -> object:
+    """The ``id`` of a WebSocket request, or ``None`` if it cannot be parsed."""
+    try:
+        return json.loads(text).get("id")
+    except (ValueError, AttributeError):
+        return None
 
 
 class ChessHTTPRequestHandler(SimpleHTTPRequestHandler):
+    # Keep-alive for the JSON API; every response carries a Content-Length.
+    protocol_version = "HTTP/1.1"
     extensions_map = {
         **SimpleHTTPRequestHandler.extensions_map,
         ".js": "application/javascript",
@@ -214,10 +439,20 @@ class ChessHTTPRequestHandler(SimpleHTTPRequestHandler):
 
     # ------------------------------------------------------------------
     def do_GET(self):  # noqa: N802
+        if self.path == "/api/ready":
+            return self.handle_ready()
+        if self.path == "/api/ws":
+            return self.handle_websocket()
         if self.path in {"/", ""}:
             self.path = "/index.html"
         return super().do_GET()
 
+    # ------------------------------------------------------------------
+    def handle_ready(self) -> None:
+        status = ENGINE.status()
+        code = HTTPStatus.OK if status["ready"] else HTTPStatus.SERVICE_UNAVAILABLE
+        self._send_json(status, status=code)
+
     # ------------------------------------------------------------------
     def do_POST(self):  # noqa: N802
         if self.path == "/api/best-move":
@@ -227,20 +462,91 @@ class ChessHTTPRequestHandler(SimpleHTTPRequestHandler):
 
     # ------------------------------------------------------------------
     def handle_best_move(self) -> None:
+        started = time.perf_counter()
         length = int(self.headers.get("Content-Length", 0))
         try:
             payload = self.rfile.read(length).decode("utf-8")
             data = json.loads(payload)
-            fen = data["fen"]
-            skill = int(data.get("skill", 20))
-            depth = int(data.get("depth", 18))
-            movetime = data.get("movetime")
-            result = ENGINE.best_move(fen, skill=skill, depth=depth, movetime=movetime)
+            result = run_engine_request(parse_move_request(data), started)
             self._send_json(result)
+        except EngineNotReady as exc:
+            self._send_json({"error": str(exc)}, status=HTTPStatus.SERVICE_UNAVAILABLE)
         except Exception as exc:  # pylint: disable=broad-except
             traceback.print_exc()
             self._send_json({"error": str(exc)}, status=HTTPStatus.INTERNAL_SERVER_ERROR)
 
+    # ------------------------------------------------------------------
+    def handle_websocket(self) -> None:
+        """Engine channel: one persistent connection per game session.
+
+        Client messages are ``{"id", "fen", "skill", "depth", ...}`` (the same
+        fields as ``/api/best-move``). For each one the server pushes
+        ``{"op": "info", "id", "info"}`` as the search deepens and finally
+        ``{"op": "result", "id", "move", "ponder", "info"}`` or
+        ``{"op": "error", "id", "error"}``. Requests run concurrently, so
+        replies are matched by ``id``; at most ``WS_MAX_IN_FLIGHT`` run at
+        once per connection and further ones are answered with an error.
+        """
+        key = self.headers.get("Sec-WebSocket-Key")
+        if self.headers.get("Upgrade", "").lower() != "websocket" or not key:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Expected a WebSocket upgrade")
+            return
+        self.send_response(HTTPStatus.SWITCHING_PROTOCOLS)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept_key(key))
+        self.end_headers()
+        self.close_connection = True
+
+        channel = WebSocket(self.rfile, self.wfile)
+        in_flight = threading.BoundedSemaphore(WS_MAX_IN_FLIGHT)
+        while True:
+            text = channel.receive()
+            if text is None:
+                break
+            if not in_flight.acquire(blocking=False):
+                _ws_push(
+                    channel,
+                    {
+                        "op": "error",
+                        "id": _ws_request_id(text),
+                        "error": f"Too many requests in flight (limit {WS_MAX_IN_FLIGHT})",
+                    },
+                )
+                continue
+            threading.Thread(
+                target=self._serve_ws_request,
+                args=(channel, text, in_flight),
+                daemon=True,
+            ).start()
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _serve_ws_request(
+        channel: WebSocket, text: str, in_flight: threading.BoundedSemaphore
+    ) -> None:
+        started = time.perf_counter()
+        request_id = None
+
+        def push(message: Dict[str, object]) -> None:
+            _ws_push(channel, message)
+
+        try:
+            data = json.loads(text)
+            request_id = data.get("id")
+            result = run_engine_request(
+                parse_move_request(data),
+                started,
+                on_info=lambda info: push({"op": "info", "id": request_id, "info": info}),
+            )
+            push({"op": "result", "id": request_id, **result})
+        except Exception as exc:  # pylint: disable=broad-except
+            if not isinstance(exc, EngineNotReady):
+                traceback.print_exc()
+            push({"op": "error", "id": request_id, "error": str(exc)})
+        finally:
+            in_flight.release()
+
     # ------------------------------------------------------------------
     def _send_json(self, data: Dict[str, object], status: HTTPStatus = HTTPStatus.OK) -> None:
         encoded = json.dumps(data).encode("utf-8")
@@ -256,7 +562,28 @@ class ChessHTTPRequestHandler(SimpleHTTPRequestHandler):
         super().end_headers()
 
 
-def run_server(port: int = 8000) -> None:
+def run_server(
+    port: int = 8000,
+    engine_path: pathlib.Path = ENGINE_PATH,
+    broker: Optional[str] = None,
+    engines: int = 1,
+    ready_timeout: float = DEFAULT_READY_TIMEOUT,
+    record: Optional[pathlib.Path] = None,
+) -> None:
+    global ENGINE, RECORDER
+    if broker:
+        ENGINE = BrokerClient(parse_address(broker), ready_timeout=ready_timeout)
+        print(f"Forwarding engine jobs to broker at {broker}")
+    else:
+        ENGINE = EnginePool(engine_path, engines, ready_timeout=ready_timeout)
+    # Engines warm up in the background; the port is bound right away.
+    ENGINE.start()
+    atexit.register(ENGINE.shutdown)
+    if record:
+        RECORDER = SessionRecorder(record)
+        atexit.register(RECORDER.close)
+        print(f"Recording engine sessions to {record}")
+
     os.chdir(BASE_DIR.parent)
     address = ("", port)
     httpd = ThreadingHTTPServer(address, ChessHTTPRequestHandler)
@@ -270,5 +597,26 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Run the Stockfish web UI server")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    parser.add_argument(
+        "--engine", type=pathlib.Path, default=ENGINE_PATH, help="UCI engine binary"
+    )
+    parser.add_argument(
+        "--broker",
+        help="Send engine jobs to a broker (host:port or unix:/path) instead of a local engine",
+    )
+    parser.add_argument(
+        "--engines", type=int, default=1, help="Local engine processes to run (default: 1)"
+    )
+    parser.add_argument(
+        "--ready-timeout",
+        type=float,
+        default=DEFAULT_READY_TIMEOUT,
+        help="Seconds /api/best-move waits for an engine to become ready (default: 30)",
+    )
+    parser.add_argument(
+        "--record", type=pathlib.Path, help="Append each engine request to this JSONL file"
+    )
     args = parser.parse_args()
-    run_server(args.port)
+    run_server(
+        args.port, args.engine, args.broker, args.engines, args.ready_timeout, args.record
+    )
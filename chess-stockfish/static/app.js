@@ -33,6 +33,69 @@
     b: { k: '♚', q: '♛', r: '♜', b: '♝', n: '♞', p: '♟' },
   };
 
+  // Engine requests share one WebSocket (/api/ws); the server streams search
+  // info while it thinks. Falls back to POST /api/best-move when the socket
+  // is unavailable.
+  const engineChannel = (() => {
+    let socket = null;
+    let nextId = 1;
+    const pending = new Map();
+
+    function post(payload) {
+      return fetch('/api/best-move', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload),
+      }).then((res) => {
+        if (!res.ok) {
+          throw new Error(`엔진 오류: ${res.status}`);
+        }
+        return res.json();
+      });
+    }
+
+    function connect() {
+      if (socket && socket.readyState <= WebSocket.OPEN) return socket;
+      const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+      socket = new WebSocket(`${protocol}//${window.location.host}/api/ws`);
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        const entry = pending.get(message.id);
+        if (!entry) return;
+        if (message.op === 'info') {
+          if (entry.onInfo) entry.onInfo(message.info);
+          return;
+        }
+        pending.delete(message.id);
+        entry.resolve(message.op === 'error' ? { error: message.error } : message);
+      };
+      socket.onclose = () => {
+        socket = null;
+        const lost = Array.from(pending.values());
+        pending.clear();
+        lost.forEach((entry) => post(entry.payload).then(entry.resolve, entry.reject));
+      };
+      return socket;
+    }
+
+    function request(payload, onInfo) {
+      if (typeof WebSocket === 'undefined') return post(payload);
+      const ws = connect();
+      return new Promise((resolve, reject) => {
+        const id = nextId++;
+        pending.set(id, { payload, resolve, reject, onInfo });
+        const message = JSON.stringify({ id, ...payload });
+        if (ws.readyState === WebSocket.OPEN) {
+          ws.send(message);
+        } else {
+          ws.addEventListener('open', () => ws.send(message), { once: true });
+        }
+      });
+    }
+
+    return { request };
+  })();
+
   // Convert Elo rating to Stockfish skill level (0-20)
   function eloToSkill(elo) {
     // Approximation based on Stockfish skill levels
@@ -326,17 +389,8 @@
       depth: gameDepth,
     };
 
-    fetch('/api/best-move', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify(payload),
-    })
-      .then((res) => {
-        if (!res.ok) {
-          throw new Error(`엔진 오류: ${res.status}`);
-        }
-        return res.json();
-      })
+    engineChannel
+      .request(payload, applyEngineInfo)
       .then(handleEngineResponse)
       .catch((error) => {
         console.error(error);
@@ -660,15 +714,8 @@
       skill: skill,
       depth: gameDepth,
     };
-    fetch('/api/best-move', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify(payload),
-    })
-      .then((res) => {
-        if (!res.ok) throw new Error('힌트를 불러오지 못했습니다.');
-        return res.json();
-      })
+    engineChannel
+      .request(payload)
       .then((result) => {
         engineBusy = false;
         toggleControls(false);
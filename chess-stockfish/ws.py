@@ -0,0 +1,144 @@
+"""Minimal RFC 6455 WebSocket framing for the Stockfish web UI server.
+
+Only what the engine channel needs: the opening handshake, text messages
+(with fragmentation), ping/pong and close. Frames are read from and written
+to the file objects of an upgraded ``BaseHTTPRequestHandler`` connection.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import struct
+import threading
+from typing import BinaryIO, Optional
+
+_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+MAX_MESSAGE_SIZE = 1 << 20
+
+
+class WebSocketClosed(Exception):
+    """The peer closed the connection or sent something we cannot handle."""
+
+
+def accept_key(client_key: str) -> str:
+    digest = hashlib.sha1(client_key.strip().encode("ascii") + _GUID).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _unmask(payload: bytes, mask: bytes) -> bytes:
+    # XOR the whole payload at once as big integers; far cheaper than a
+    # per-byte Python loop for anything but tiny frames.
+    length = len(payload)
+    if not length:
+        return payload
+    key = (mask * (length // 4 + 1))[:length]
+    value = int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")
+    return value.to_bytes(length, "big")
+
+
+class WebSocket:
+    """Server side of an established WebSocket connection."""
+
+    def __init__(self, rfile: BinaryIO, wfile: BinaryIO):
+        self._rfile = rfile
+        self._wfile = wfile
+        self._write_lock = threading.Lock()
+        self.closed = False
+
+    # ------------------------------------------------------------------
+    def _read_exact(self, size: int) -> bytes:
+        data = self._rfile.read(size)
+        if data is None or len(data) < size:
+            raise WebSocketClosed("Connection closed")
+        return data
+
+    # ------------------------------------------------------------------
+    def _read_frame(self):
+        first, second = self._read_exact(2)
+        fin = bool(first & 0x80)
+        opcode = first & 0x0F
+        masked = bool(second & 0x80)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", self._read_exact(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", self._read_exact(8))
+        if length > MAX_MESSAGE_SIZE:
+            raise WebSocketClosed("Frame too large")
+        if not masked:
+            raise WebSocketClosed("Client frames must be masked")
+        mask = self._read_exact(4)
+        return fin, opcode, _unmask(self._read_exact(length), mask)
+
+    # ------------------------------------------------------------------
+    def receive(self) -> Optional[str]:
+        """Next text message, or ``None`` once the peer has closed."""
+        parts = []
+        size = 0
+        while True:
+            try:
+                fin, opcode, payload = self._read_frame()
+            except WebSocketClosed:
+                self.closed = True
+                return None
+            if opcode == OP_PING:
+                self._send_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                self.close(payload[:2] if len(payload) >= 2 else b"")
+                return None
+            if opcode not in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+                self.close(struct.pack("!H", 1002))
+                return None
+            parts.append(payload)
+            size += len(payload)
+            if size > MAX_MESSAGE_SIZE:
+                self.close(struct.pack("!H", 1009))
+                return None
+            if fin:
+                try:
+                    return b"".join(parts).decode("utf-8")
+                except UnicodeDecodeError:
+                    # 1007: payload data inconsistent with the message type.
+                    self.close(struct.pack("!H", 1007))
+                    return None
+
+    # ------------------------------------------------------------------
+    def _send_frame(self, opcode: int, payload: bytes) -> None:
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        with self._write_lock:
+            if self.closed and opcode != OP_CLOSE:
+                raise WebSocketClosed("Connection closed")
+            self._wfile.write(header + payload)
+            self._wfile.flush()
+
+    # ------------------------------------------------------------------
+    def send(self, text: str) -> None:
+        self._send_frame(OP_TEXT, text.encode("utf-8"))
+
+    # ------------------------------------------------------------------
+    def close(self, payload: bytes = b"") -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._send_frame(OP_CLOSE, payload)
+        except OSError:
+            pass
@@ -0,0 +1,949 @@
+"""
+성능 측정용 마이크로벤치마크
+
+화면 없이(SDL dummy 드라이버) 엔티티 매니저와 레벨 생성기만 사용해서
+핫 루프의 비용을 측정합니다.
+
+    uv run bench.py platforms --chunks 40 --frames 600
+    uv run bench.py entities --chunks 400 --frames 200
+    uv run --extra fast bench.py entities --chunks 2000 --backend numpy
+    uv run bench.py render --chunks 40 --frames 300
+    uv run bench.py blit --blits 500 --frames 200
+    uv run bench.py frame --chunks 40 --density 3 --frames 600 --json out.json
+    uv run bench.py frame --render-mode full --idle
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, replace
+from functools import partial
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from constants import *
+from collision import swept_dx, swept_dy
+from entities import ENTITY_LISTS, EntityManager, _query_margin
+from game import Game
+from headless import ScriptedInput
+from level import LevelGenerator
+from player import Player
+from renderer import Renderer
+from spatial import PLATFORM_MOVING, PLATFORM_STATIC, PlatformGrid
+from sprites import *
+
+
+def build_world(chunks, seed=1, patrol_backend=PATROL_BACKEND):
+    """
+    초기 맵 뒤에 구간을 chunks개 생성한 엔티티 매니저를 만듭니다.
+    화면 밖 정리를 하지 않으므로 엔티티가 계속 쌓인 큰 월드가 됩니다.
+
+    Args:
+        chunks: 추가로 생성할 구간 수
+        seed: 월드 시드 (레벨 생성과 엔티티 시뮬레이션 난수)
+        patrol_backend: 순찰형 엔티티 업데이트 방식 ("python" 또는 "numpy")
+
+    Returns:
+        EntityManager: 생성된 엔티티 매니저
+    """
+    entity_manager = EntityManager(patrol_backend, seed)
+    entity_manager.reset_to_initial_state()
+    generator = LevelGenerator(entity_manager, seed)
+    for _ in range(chunks):
+        generator.spawn_chunk(generator.generated_until_x, CHUNK_WIDTH)
+        generator.generated_until_x += CHUNK_WIDTH
+    return entity_manager
+
+
+def _rebuilt_platforms(entity_manager):
+    """예전 get_all_platforms()처럼 매번 리스트를 이어 붙여 만듭니다 (비교용)"""
+    return (
+        entity_manager.platforms
+        + [mp.rect for mp in entity_manager.moving_platforms]
+        + [vp.rect for vp in entity_manager.vertical_platforms]
+        + [fp.rect for fp in entity_manager.fragile_platforms]
+    )
+
+
+def _measure(frame, frames):
+    """
+    frame()을 frames번 실행해서 프레임당 시간과 임시 할당량을 잽니다.
+
+    Returns:
+        tuple: (프레임당 마이크로초, 프레임당 최대 임시 할당 바이트)
+    """
+    for _ in range(10):
+        frame()
+
+    started = time.perf_counter_ns()
+    for _ in range(frames):
+        frame()
+    elapsed_us = (time.perf_counter_ns() - started) / 1000 / frames
+
+    # 할당량은 시간 측정과 따로 잽니다 (tracemalloc이 실행을 느리게 하므로)
+    tracemalloc.start()
+    peak = 0
+    for _ in range(min(frames, 100)):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        frame()
+        _, frame_peak = tracemalloc.get_traced_memory()
+        peak = max(peak, frame_peak - before)
+    tracemalloc.stop()
+    return elapsed_us, peak
+
+
+def _draw_background_legacy(renderer, camera_x, current_world):
+    """예전 draw_background처럼 매 프레임 한 줄씩 그립니다 (비교용)"""
+    if current_world >= 2:
+        top_color, bottom_color = CYBER_PURPLE_TOP, CYBER_PURPLE_BOT
+    else:
+        top_color, bottom_color = (135, 206, 235), (200, 230, 255)
+    for y in range(SCREEN_HEIGHT):
+        ratio = y / SCREEN_HEIGHT
+        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
+        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
+        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
+        pygame.draw.line(renderer.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+    if current_world >= 2:
+        grid_color = (40, 20, 60)
+        offset_x = int(camera_x % 100)
+        for x in range(-offset_x, SCREEN_WIDTH, 100):
+            pygame.draw.line(renderer.screen, grid_color, (x, 0), (x, SCREEN_HEIGHT))
+        for y in range(0, SCREEN_HEIGHT, 100):
+            pygame.draw.line(renderer.screen, grid_color, (0, y), (SCREEN_WIDTH, y))
+
+
+def _draw_waves_legacy(renderer, entity_manager, camera_x):
+    """예전 draw_wave처럼 화면에 걸친 물결을 24px마다 호로 그립니다 (비교용)"""
+    for sea_rect in entity_manager.seas:
+        wave_top = sea_rect.top - 4
+        start = max(0, int(camera_x - sea_rect.x - 12) // 24 * 24)
+        end = min(sea_rect.width, int(camera_x - sea_rect.x) + SCREEN_WIDTH + 13)
+        for i in range(start, end, 24):
+            wx = sea_rect.x + i - camera_x
+            wy = wave_top + int(math.sin((i + renderer.get_ticks() * 0.005)) * 3)
+            pygame.draw.arc(
+                renderer.screen,
+                SEA_DARK,
+                (wx - 12, wy - 6, 24, 12),
+                math.pi,
+                2 * math.pi,
+                2,
+            )
+
+
+def _draw_waves(renderer, entity_manager, camera_x):
+    """draw_wave로 모든 바다의 물결을 그립니다"""
+    for sea_rect in entity_manager.seas:
+        renderer.draw_wave(sea_rect, camera_x)
+
+
+def _draw_hud_legacy(renderer, score, coins, time_left, players, current_world):
+    """예전 draw_hud처럼 글자를 매 프레임 render하고 하트를 폴리곤으로 그립니다 (비교용)"""
+    screen = renderer.screen
+    for text, x in (("MARIO", 50), ("COINS", 250), ("WORLD", 450), ("TIME", 650)):
+        screen.blit(renderer.hud_font.render(text, True, (255, 255, 255)), (x, 10))
+    values = (
+        (f"{score:06d}", 50),
+        (f"x {coins:02d}", 250),
+        (f"{current_world}-1", 460),
+        (f"{max(0, int(time_left)):03d}", 660),
+    )
+    for text, x in values:
+        screen.blit(renderer.font.render(text, True, (255, 255, 255)), (x, 35))
+    for index, player in enumerate(players[:2]):
+        start_x = SCREEN_WIDTH - 150 if index == 0 else 30
+        for i in range(MAX_HEALTH):
+            x, y, scale = start_x + i * 40, 100, 1.2
+            filled = i < player.health
+            points = [
+                (x, y + 8 * scale),
+                (x - 8 * scale, y),
+                (x - 8 * scale, y - 4 * scale),
+                (x - 4 * scale, y - 8 * scale),
+                (x, y - 6 * scale),
+                (x + 4 * scale, y - 8 * scale),
+                (x + 8 * scale, y - 4 * scale),
+                (x + 8 * scale, y),
+            ]
+            if filled:
+                pygame.draw.polygon(screen, (255, 50, 50), points)
+            outline_color = (200, 30, 30) if filled else (80, 80, 80)
+            pygame.draw.polygon(screen, outline_color, points, 3)
+
+
+def _draw_terrain_legacy(renderer, entity_manager, camera_x, current_world):
+    """예전 render_all처럼 정적 지형을 rect마다 그립니다 (비교용)"""
+    plat_color, plat_border, spike_color, sea_color = renderer.terrain_colors(
+        current_world
+    )
+    for p in entity_manager.platforms:
+        renderer.draw_rect_with_camera(p, plat_color, camera_x, plat_border)
+    for s in entity_manager.springs:
+        renderer.draw_rect_with_camera(s, GREEN, camera_x)
+    for g in entity_manager.spikes:
+        renderer.draw_spike_with_camera(g, spike_color, camera_x)
+    for c in entity_manager.corals:
+        renderer.draw_rect_with_camera(c, CORAL, camera_x)
+    for w in entity_manager.seas:
+        renderer.draw_rect_with_camera(w, sea_color, camera_x)
+
+
+def bench_platforms(args):
+    """플랫폼 충돌 후보 수집 방식별 비용 비교"""
+    entity_manager = build_world(args.chunks, args.seed)
+    bodies = [e.rect for e in entity_manager.enemies]
+    bodies += [m.rect for m in entity_manager.mushrooms]
+    print(
+        f"platforms={len(entity_manager.get_all_platforms())} "
+        f"bodies={len(bodies)} frames={args.frames}"
+    )
+
+    def scan(body, candidates):
+        hits = 0
+        for p in candidates:
+            if body.colliderect(p):
+                hits += 1
+        return hits
+
+    def rebuild_frame():
+        # 몸체마다 두 번(수직/수평) 전체 리스트를 새로 만들어 검사
+        for body in bodies:
+            scan(body, _rebuilt_platforms(entity_manager))
+            scan(body, _rebuilt_platforms(entity_manager))
+
+    def view_frame():
+        for body in bodies:
+            view = entity_manager.get_all_platforms()
+            scan(body, view)
+            scan(body, view)
+
+    nearby = []
+
+    def grid_frame():
+        for body in bodies:
+            candidates = entity_manager.platforms_near(body, out=nearby)
+            scan(body, candidates)
+            scan(body, candidates)
+
+    print(f"{'mode':<10}{'us/frame':>12}{'peak alloc/frame':>20}")
+    for name, frame in (
+        ("rebuild", rebuild_frame),
+        ("view", view_frame),
+        ("grid", grid_frame),
+    ):
+        elapsed_us, peak = _measure(frame, args.frames)
+        print(f"{name:<10}{elapsed_us:>12.1f}{peak:>18d} B")
+
+
+# 예전 dict 엔티티에서 키 이름이 dataclass 필드와 다른 것
+_LEGACY_KEYS = {"direction": "dir"}
+
+
+def _legacy_entity(obj):
+    """dataclass 엔티티를 예전 dict 모양으로 복사합니다 (rect도 새로 만듦, 비교용)"""
+    entity = {
+        _LEGACY_KEYS.get(f.name, f.name): getattr(obj, f.name) for f in fields(obj)
+    }
+    entity["rect"] = obj.rect.copy()
+    return entity
+
+
+def _copy_entity(obj):
+    """dataclass 엔티티를 rect까지 새로 만들어 복사합니다 (메모리 비교용)"""
+    return replace(obj, rect=obj.rect.copy())
+
+
+def _entity_bytes(entities, copy):
+    """
+    copy로 엔티티를 하나씩 복사하는 데 드는 메모리를 tracemalloc으로 잽니다.
+
+    Returns:
+        float: rect를 포함한 엔티티당 바이트
+    """
+    copies = [None] * len(entities)
+    tracemalloc.start()
+    for i, obj in enumerate(entities):
+        copies[i] = copy(obj)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / max(1, len(entities))
+
+
+def _update_moving_legacy(platform_grid, platforms):
+    """예전 dict 움직이는 플랫폼 업데이트 (비교용)"""
+    for mp in platforms:
+        mp["rect"].x += mp["vx"]
+        if mp["rect"].left < mp["left"]:
+            mp["rect"].left = mp["left"]
+            mp["vx"] *= -1
+        elif mp["rect"].right > mp["right"]:
+            mp["rect"].right = mp["right"]
+            mp["vx"] *= -1
+        platform_grid.update(mp["rect"])
+
+
+def _update_vertical_legacy(platforms):
+    """예전 dict 수직 플랫폼 업데이트 (비교용)"""
+    for vp in platforms:
+        vp["rect"].y += vp["vy"]
+        if vp["rect"].top < vp["top"]:
+            vp["rect"].top = vp["top"]
+            vp["vy"] *= -1
+        elif vp["rect"].bottom > vp["bottom"]:
+            vp["rect"].bottom = vp["bottom"]
+            vp["vy"] *= -1
+
+
+def _update_enemies_legacy(entity_manager, enemies):
+    """예전 dict 적 업데이트 (지금과 같은 충돌 처리, 비교용)"""
+    index = entity_manager.render_index["enemies"]
+    for e in enemies:
+        if not e["alive"]:
+            continue
+
+        nearby = entity_manager.platforms_near(
+            e["rect"], margin=_query_margin(e["vx"]), out=entity_manager._nearby
+        )
+
+        if e["kind"] == "hopper":
+            e["jump_cd"] -= 1
+            if e["jump_cd"] <= 0:
+                e["vy"] = -8
+                e["jump_cd"] = entity_manager.rng.randint(50, 90)
+
+        in_sea = entity_manager._is_in_water(e["rect"])
+        if in_sea:
+            e["vy"] -= GRAVITY
+            if e["rect"].top < in_sea.top - 4:
+                e["vy"] += 0.4
+            e["vy"] *= 0.9
+            e["vy"] = max(min(e["vy"], 5), -5)
+        else:
+            e["vy"] += GRAVITY
+
+        e["vy"] = min(e["vy"], 20)
+
+        dy = int(e["vy"])
+        if dy > 0:
+            dy = swept_dy(e["rect"], dy, nearby)
+        e["rect"].y += dy
+        for p in nearby:
+            if e["rect"].colliderect(p):
+                if e["vy"] > 0:
+                    e["rect"].bottom = p.top
+                    e["vy"] = 0
+
+        e["rect"].x += swept_dx(e["rect"], e["vx"], nearby)
+        for p in nearby:
+            if e["rect"].colliderect(p):
+                if e["vx"] > 0:
+                    e["rect"].right = p.left
+                else:
+                    e["rect"].left = p.right
+                e["vx"] *= -1
+
+        index.update(e, e["rect"].left, e["rect"].right)
+
+
+def _update_fish_legacy(fish):
+    """예전 dict 물고기 적 업데이트 (비교용)"""
+    for f in fish:
+        if not f["alive"]:
+            continue
+        f["rect"].x += f["vx"]
+        if f["rect"].left < f["left"] or f["rect"].right > f["right"]:
+            f["vx"] *= -1
+
+
+def _update_turtles_legacy(turtles):
+    """예전 dict 거북이 적 업데이트 (비교용)"""
+    for t in turtles:
+        if not t["alive"]:
+            continue
+        t["rect"].x += t["vx"]
+        if t["rect"].left < t["left"] or t["rect"].right > t["right"]:
+            t["vx"] *= -1
+        t["t"] += 0.05
+        t["rect"].y += int(math.sin(t["t"]) * t["amp"] * 0.1)
+
+
+def _update_jellies_legacy(jellies):
+    """예전 dict 해파리 업데이트 (비교용)"""
+    for j in jellies:
+        if not j["alive"]:
+            continue
+        j["rect"].y += j["dir"] * 1
+        if j["rect"].top < j["top"] or j["rect"].bottom > j["bottom"]:
+            j["dir"] *= -1
+
+
+def _update_mushrooms_legacy(entity_manager, mushrooms):
+    """예전 dict 버섯 업데이트 (지금과 같은 충돌 처리, 비교용)"""
+    index = entity_manager.render_index["mushrooms"]
+    for m in mushrooms:
+        if not m["alive"]:
+            continue
+
+        nearby = entity_manager.platforms_near(
+            m["rect"],
+            margin=_query_margin(m["vx"]),
+            max_layer=PLATFORM_MOVING,
+            out=entity_manager._nearby,
+        )
+
+        m["vy"] += GRAVITY
+        m["vy"] = min(m["vy"], 20)
+        dy = int(m["vy"])
+        if dy > 0:
+            dy = swept_dy(m["rect"], dy, nearby)
+        m["rect"].y += dy
+
+        for p in nearby:
+            if m["rect"].colliderect(p):
+                if m["vy"] > 0:
+                    m["rect"].bottom = p.top
+                    m["vy"] = 0
+
+        m["rect"].x += swept_dx(m["rect"], m["vx"], nearby)
+        for p in nearby:
+            if m["rect"].colliderect(p):
+                if m["vx"] > 0:
+                    m["rect"].right = p.left
+                else:
+                    m["rect"].left = p.right
+                m["vx"] *= -1
+
+        index.update(m, m["rect"].left, m["rect"].right)
+
+
+def _update_cars_legacy(entity_manager, cars):
+    """예전 dict 자동차 업데이트 (비교용)"""
+    index = entity_manager.render_index["cars"]
+    for car in cars:
+        if not car["alive"]:
+            continue
+
+        if car["rider"]:
+            index.update(car, car["rect"].left, car["rect"].right)
+            continue
+
+        car["rect"].x += car["vx"]
+        if car["rect"].left < car["left"] or car["rect"].right > car["right"]:
+            car["vx"] *= -1
+            car["rect"].x += car["vx"]
+
+        on_platform = False
+        for p in entity_manager.platforms_near(
+            car["rect"], max_layer=PLATFORM_STATIC, out=entity_manager._nearby
+        ):
+            if car["rect"].colliderect(p) and car["rect"].bottom <= p.top + 4:
+                car["rect"].bottom = p.top
+                on_platform = True
+                break
+        if not on_platform:
+            car["rect"].bottom = min(car["rect"].bottom, GROUND_TOP_Y)
+
+        index.update(car, car["rect"].left, car["rect"].right)
+
+
+def bench_entities(args):
+    """
+    엔티티 업데이트 루프 처리량과 엔티티 메모리 측정
+
+    같은 엔티티를 예전 dict 모양으로 복사한 월드도 만들어서, 단계마다
+    dataclass 업데이트와 예전 dict 업데이트를 나란히 보여 줍니다.
+    """
+    tracemalloc.start()
+    entity_manager = build_world(args.chunks, args.seed, args.backend)
+    world_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    groups = {
+        "enemies": entity_manager.enemies,
+        "fish": entity_manager.fish_enemies,
+        "turtles": entity_manager.turtle_enemies,
+        "jellies": entity_manager.jellies,
+        "mushrooms": entity_manager.mushrooms,
+        "cars": entity_manager.cars,
+        "moving": entity_manager.moving_platforms,
+        "vertical": entity_manager.vertical_platforms,
+        "fragile": entity_manager.fragile_platforms,
+    }
+    total = sum(len(group) for group in groups.values())
+    entities = [e for group in groups.values() for e in group]
+    dataclass_bytes = _entity_bytes(entities, _copy_entity)
+    dict_bytes = _entity_bytes(entities, _legacy_entity)
+    # 같은 엔티티를 예전 dict 모양으로 복사한 월드 (rect도 따로 가짐)
+    legacy = {name: list(map(_legacy_entity, group)) for name, group in groups.items()}
+    legacy_grid = PlatformGrid()
+    for mp in legacy["moving"]:
+        legacy_grid.add(mp["rect"], PLATFORM_MOVING)
+    print(" ".join(f"{name}={len(group)}" for name, group in groups.items()))
+    if entity_manager.patrols is not None:
+        # 카메라가 월드 가운데 있다고 보고 화면 주변만 되돌려 씀
+        camera_x = INITIAL_GENERATED_X + CHUNK_WIDTH * args.chunks // 2
+        entity_manager.set_active_window(
+            camera_x - PATROL_ACTIVE_MARGIN,
+            camera_x + SCREEN_WIDTH + PATROL_ACTIVE_MARGIN,
+        )
+    print(f"backend={'numpy' if entity_manager.patrols is not None else 'python'}")
+
+    phases = [
+        (
+            "moving",
+            entity_manager.update_moving_platforms,
+            partial(_update_moving_legacy, legacy_grid, legacy["moving"]),
+        ),
+        (
+            "vertical",
+            entity_manager.update_vertical_platforms,
+            partial(_update_vertical_legacy, legacy["vertical"]),
+        ),
+        (
+            "enemies",
+            entity_manager.update_enemies,
+            partial(_update_enemies_legacy, entity_manager, legacy["enemies"]),
+        ),
+        (
+            "fish",
+            entity_manager.update_fish_enemies,
+            partial(_update_fish_legacy, legacy["fish"]),
+        ),
+        (
+            "turtles",
+            entity_manager.update_turtle_enemies,
+            partial(_update_turtles_legacy, legacy["turtles"]),
+        ),
+        (
+            "jellies",
+            entity_manager.update_jellies,
+            partial(_update_jellies_legacy, legacy["jellies"]),
+        ),
+        (
+            "mushrooms",
+            entity_manager.update_mushrooms,
+            partial(_update_mushrooms_legacy, entity_manager, legacy["mushrooms"]),
+        ),
+        (
+            "cars",
+            entity_manager.update_cars,
+            partial(_update_cars_legacy, entity_manager, legacy["cars"]),
+        ),
+    ]
+    print(f"entities={total} world memory={world_bytes / 1024:.0f} KiB")
+    # rect까지 새로 만들어 복사하는 데 든 메모리 (tracemalloc)
+    print(
+        f"entity memory with rect: dataclass={dataclass_bytes:.0f} B/entity "
+        f"dict={dict_bytes:.0f} B/entity"
+    )
+    print(
+        f"{'phase':<12}{'us/frame':>10}{'ns/entity':>12}"
+        f"{'dict us/frame':>16}{'dict ns/entity':>16}"
+    )
+    total_us = legacy_total_us = 0.0
+    for name, update, update_legacy in phases:
+        elapsed_us, _ = _measure(update, args.frames)
+        legacy_us, _ = _measure(update_legacy, args.frames)
+        total_us += elapsed_us
+        legacy_total_us += legacy_us
+        count = max(1, len(groups[name]))
+        print(
+            f"{name:<12}{elapsed_us:>10.0f}{elapsed_us * 1000 / count:>12.0f}"
+            f"{legacy_us:>16.0f}{legacy_us * 1000 / count:>16.0f}"
+        )
+    print(
+        f"{'total':<12}{total_us:>10.0f}{'':>12}{legacy_total_us:>16.0f}   "
+        f"({total / total_us:.2f} vs {total / legacy_total_us:.2f} "
+        f"M entity-updates/s)"
+    )
+
+
+def bench_render(args):
+    """렌더링 단계별 프레임 시간 측정 (카메라가 오른쪽으로 계속 스크롤)"""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = Renderer(screen)
+    entity_manager = build_world(args.chunks, args.seed)
+    players = [Player(1, (0, 180, 0)), Player(2, (200, 0, 0))]
+    world_right = INITIAL_GENERATED_X + CHUNK_WIDTH * args.chunks - SCREEN_WIDTH
+    camera = [0]
+
+    def scroll():
+        camera[0] = (camera[0] + PLAYER_SPEED) % world_right
+        return camera[0]
+
+    print(
+        f"platforms={len(entity_manager.get_all_platforms())} "
+        f"frames={args.frames} screen={SCREEN_WIDTH}x{SCREEN_HEIGHT}"
+    )
+    print(f"{'world':<7}{'phase':<22}{'us/frame':>10}{'draws/frame':>14}")
+    for world in (1, 2):
+        phases = [
+            (
+                "background (legacy)",
+                lambda: _draw_background_legacy(renderer, scroll(), world),
+            ),
+            ("background", lambda: renderer.draw_background(scroll(), world)),
+            (
+                "terrain (legacy)",
+                lambda: _draw_terrain_legacy(
+                    renderer, entity_manager, scroll(), world
+                ),
+            ),
+            (
+                "terrain",
+                lambda: renderer.draw_terrain(
+                    entity_manager, scroll(), renderer.terrain_colors(world)
+                ),
+            ),
+            (
+                "waves (legacy)",
+                lambda: _draw_waves_legacy(renderer, entity_manager, scroll()),
+            ),
+            ("waves", lambda: _draw_waves(renderer, entity_manager, scroll())),
+            (
+                "hud (legacy)",
+                lambda: _draw_hud_legacy(renderer, 1234, 5, 300, players, world),
+            ),
+            ("hud", lambda: renderer.draw_hud(1234, 5, 300, players, world)),
+            (
+                "render_all",
+                lambda: renderer.render_all(
+                    entity_manager, players, scroll(), 0, 0, 400, world
+                ),
+            ),
+        ]
+        for name, frame in phases:
+            camera[0] = 0
+            elapsed_us, _ = _measure(frame, args.frames)
+            line = f"{world:<7}{name:<22}{elapsed_us:>10.0f}"
+            if name == "render_all":
+                # 카메라 위치마다 다르므로 마지막 프레임 값
+                line += f"{renderer.draw_calls:>14d}"
+            print(line)
+
+    # 화면 전체를 가로지르는 바다 하나를 카메라를 멈춘 채 그림
+    # (스크롤하는 월드에서는 바다가 화면 일부에만 걸치는 경우가 대부분)
+    sea_world = EntityManager(seed=args.seed)
+    sea_world.add_sea(
+        pygame.Rect(-CHUNK_WIDTH, GROUND_TOP_Y, SCREEN_WIDTH + 2 * CHUNK_WIDTH, 240)
+    )
+    for name, frame in (
+        ("waves (legacy)", lambda: _draw_waves_legacy(renderer, sea_world, 0)),
+        ("waves", lambda: _draw_waves(renderer, sea_world, 0)),
+    ):
+        elapsed_us, _ = _measure(frame, args.frames)
+        print(f"{'sea':<7}{name:<22}{elapsed_us:>10.0f}")
+
+
+# blit 벤치마크가 비교하는 스프라이트 (종류, 크기, 색, 캐시 없이 만드는 함수)
+BLIT_SPRITES = (
+    (
+        "player",
+        (PLAYER_SMALL_WIDTH, PLAYER_SMALL_HEIGHT),
+        (200, 0, 0),
+        lambda: make_player_sprite(
+            PLAYER_SMALL_WIDTH, PLAYER_SMALL_HEIGHT, (200, 0, 0)
+        ),
+    ),
+    ("enemy", (28, 28), None, lambda: make_enemy_sprite(28, 28)),
+    ("fish", (28, 18), None, lambda: make_fish_sprite(28, 18)),
+    ("turtle", (30, 20), None, lambda: make_turtle_sprite(30, 20)),
+    ("mushroom", (24, 24), None, lambda: make_mushroom_sprite(24, 24)),
+    ("fireball", (16, 16), None, lambda: make_fireball_sprite(8)),
+    ("car", (50, 30), None, lambda: make_car_sprite(50, 30)),
+)
+
+
+def bench_blit(args):
+    """
+    스프라이트 blit 처리량 비교
+
+    캐시 없이 만든 SRCALPHA 표면(이전 방식)과 sprite_cache가 convert_alpha()로
+    화면 픽셀 형식에 맞춘 표면을 같은 위치에 blits번씩 그립니다.
+    플레이어 크기가 바뀔 때 스프라이트를 다시 그리는 비용과 캐시 조회도 비교합니다.
+    """
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    sprite_cache.convert()
+    positions = [
+        ((i * 131) % (SCREEN_WIDTH - 50), (i * 71) % (SCREEN_HEIGHT - 50))
+        for i in range(args.blits)
+    ]
+
+    def blit_all(image):
+        blit = screen.blit
+        for pos in positions:
+            blit(image, pos)
+
+    print(
+        f"blits/frame={args.blits} frames={args.frames} "
+        f"screen={SCREEN_WIDTH}x{SCREEN_HEIGHT} "
+        f"display={screen.get_bitsize()}bit"
+    )
+    print(
+        f"{'sprite':<10}{'raw us':>10}{'cached us':>11}"
+        f"{'speedup':>9}{'M blits/s':>11}"
+    )
+    for kind, size, color, make in BLIT_SPRITES:
+        raw = make()
+        cached = sprite_cache.get(kind, size, color)
+        raw_us, _ = _measure(lambda: blit_all(raw), args.frames)
+        cached_us, _ = _measure(lambda: blit_all(cached), args.frames)
+        print(
+            f"{kind:<10}{raw_us:>10.0f}{cached_us:>11.0f}"
+            f"{raw_us / cached_us:>8.2f}x{args.blits / cached_us:>11.2f}"
+        )
+
+    # 작아지기/커지기 한 번에 드는 스프라이트 비용
+    sizes = (
+        (PLAYER_SMALL_WIDTH, PLAYER_SMALL_HEIGHT),
+        (PLAYER_BIG_WIDTH, PLAYER_BIG_HEIGHT),
+    )
+    resize_us, _ = _measure(
+        lambda: [make_player_sprite(w, h, (200, 0, 0)) for w, h in sizes],
+        args.frames,
+    )
+    cached_us, _ = _measure(
+        lambda: [sprite_cache.get("player", size, (200, 0, 0)) for size in sizes],
+        args.frames,
+    )
+    print(f"{'resize':<10}{resize_us:>10.1f}{cached_us:>11.1f}")
+
+
+# frame 벤치마크가 시간을 재는 Game 단계 (render_all은 Renderer 메서드)
+FRAME_PHASES = (
+    "update_players",
+    "update_entities",
+    "handle_collisions",
+    "cleanup_offscreen",
+    "render_all",
+    "present",
+)
+
+
+def _runner_keys(frame):
+    """
+    두 플레이어 모두 오른쪽으로 달리며 주기적으로 점프하는 입력.
+    자동차에 막혀 멈추지 않도록 가끔 내립니다.
+    """
+    keys = {pygame.K_RIGHT, pygame.K_d}
+    if frame % 45 < 12:
+        keys.add(pygame.K_SPACE)
+    if (frame + 20) % 45 < 12:
+        keys.add(pygame.K_w)
+    if frame % 120 < 2:
+        keys.update((pygame.K_DOWN, pygame.K_e))
+    return keys
+
+
+def build_game(chunks, density=1, biome="mixed", seed=1):
+    """
+    초기 맵 뒤에 구간을 chunks개 미리 생성한 헤드리스 게임을 만듭니다.
+
+    density가 2 이상이면 같은 구간에 월드 번호만 바꾼 레이어를 겹쳐 생성해서
+    구간당 엔티티 수를 density배로 늘립니다.
+
+    Args:
+        chunks: 미리 생성할 구간 수
+        density: 구간마다 겹쳐 생성할 레이어 수
+        biome: "mixed"면 땅/바다 바이옴이 평소처럼 번갈아 나오고,
+            "land" / "sea"면 모든 구간을 그 바이옴으로 생성
+        seed: 월드 시드
+
+    Returns:
+        Game: 렌더링을 켠 헤드리스 게임
+    """
+    game = Game(
+        headless=True,
+        input_source=ScriptedInput(_runner_keys),
+        render=True,
+        seed=seed,
+    )
+    generator = game.level_generator
+    for layer in range(1, density + 1):
+        generator.reset(layer)
+        if biome != "mixed":
+            generator.biome_type = biome
+            generator.biome_chunks_remaining = chunks + 1
+        for _ in range(chunks):
+            generator.spawn_chunk(generator.generated_until_x, CHUNK_WIDTH)
+            generator.generated_until_x += CHUNK_WIDTH
+    generator.world = game.current_world
+    return game
+
+
+def _percentile(values, q):
+    """정렬된 values의 q 분위 값 (nearest-rank)"""
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+def bench_frame(args):
+    """
+    스크립트 입력으로 메인 루프를 돌리면서 Game 단계별 프레임 시간 측정
+
+    플레이어는 무적 상태로 달리므로 게임 오버로 월드가 리셋되지 않습니다.
+    --idle이면 아무 키도 누르지 않아 카메라가 멈춰 있습니다 (dirty 모드 비교용).
+    present는 SDL dummy 드라이버에서는 실제 창이 없어 거의 비용이 없습니다.
+    """
+    game = build_game(args.chunks, args.density, args.biome, args.seed)
+    game.renderer.mode = args.render_mode
+    if args.idle:
+        game.input_source = ScriptedInput(lambda frame: ())
+    for p in game.players:
+        p.invincible_timer = args.warmup + args.frames + 1
+
+    entity_manager = game.entity_manager
+    counts = {name: len(getattr(entity_manager, name)) for name in ENTITY_LISTS}
+
+    # 각 단계를 시간 재는 함수로 바꿔 끼움 (인스턴스 속성이 메서드를 가림)
+    samples = {name: [] for name in FRAME_PHASES}
+    samples["frame"] = []
+
+    def timed(method, out):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter_ns()
+            result = method(*args, **kwargs)
+            out.append(time.perf_counter_ns() - started)
+            return result
+
+        return wrapper
+
+    for name in FRAME_PHASES:
+        owner = game.renderer if name in ("render_all", "present") else game
+        setattr(owner, name, timed(getattr(owner, name), samples[name]))
+
+    for _ in range(args.warmup):
+        game.step()
+        game.renderer.present()
+    for values in samples.values():
+        values.clear()
+    for _ in range(args.frames):
+        started = time.perf_counter_ns()
+        game.step()
+        game.renderer.present()
+        samples["frame"].append(time.perf_counter_ns() - started)
+
+    phases = {}
+    for name, values in samples.items():
+        values.sort()
+        phases[name] = {
+            "mean_ms": sum(values) / len(values) / 1e6,
+            "p99_ms": _percentile(values, 0.99) / 1e6,
+            "max_ms": values[-1] / 1e6,
+        }
+
+    print(" ".join(f"{name}={count}" for name, count in counts.items()))
+    print(
+        f"chunks={args.chunks} density={args.density} biome={args.biome} "
+        f"frames={args.frames} camera_x={game.camera_x:.0f} "
+        f"render_mode={args.render_mode} idle={args.idle}"
+    )
+    print(f"{'phase':<20}{'mean ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in phases.items():
+        print(
+            f"{name:<20}{stats['mean_ms']:>10.3f}"
+            f"{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}"
+        )
+
+    if args.json:
+        report = {
+            "config": {
+                "chunks": args.chunks,
+                "density": args.density,
+                "biome": args.biome,
+                "seed": args.seed,
+                "frames": args.frames,
+                "warmup": args.warmup,
+                "render_mode": args.render_mode,
+                "idle": args.idle,
+                "screen": [SCREEN_WIDTH, SCREEN_HEIGHT],
+                "patrol_backend": PATROL_BACKEND,
+            },
+            "environment": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "machine": platform.machine(),
+            },
+            "entities": counts,
+            "phases": phases,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마리오 마이크로벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    platforms = sub.add_parser("platforms", help="플랫폼 충돌 후보 수집 비교")
+    platforms.add_argument("--chunks", type=int, default=40, help="생성할 구간 수")
+    platforms.add_argument("--frames", type=int, default=600, help="측정 프레임 수")
+    platforms.add_argument("--seed", type=int, default=1, help="레벨 생성 시드")
+    platforms.set_defaults(func=bench_platforms)
+
+    entities = sub.add_parser("entities", help="엔티티 업데이트 처리량")
+    entities.add_argument("--chunks", type=int, default=400, help="생성할 구간 수")
+    entities.add_argument("--frames", type=int, default=200, help="측정 프레임 수")
+    entities.add_argument("--seed", type=int, default=1, help="레벨 생성 시드")
+    entities.add_argument(
+        "--backend",
+        choices=("python", "numpy"),
+        default=PATROL_BACKEND,
+        help="순찰형 엔티티 업데이트 방식",
+    )
+    entities.set_defaults(func=bench_entities)
+
+    render = sub.add_parser("render", help="렌더링 프레임 시간")
+    render.add_argument("--chunks", type=int, default=40, help="생성할 구간 수")
+    render.add_argument("--frames", type=int, default=300, help="측정 프레임 수")
+    render.add_argument("--seed", type=int, default=1, help="레벨 생성 시드")
+    render.set_defaults(func=bench_render)
+
+    blit = sub.add_parser("blit", help="스프라이트 blit 처리량 (캐시 전후)")
+    blit.add_argument("--blits", type=int, default=500, help="프레임당 blit 수")
+    blit.add_argument("--frames", type=int, default=200, help="측정 프레임 수")
+    blit.set_defaults(func=bench_blit)
+
+    frame = sub.add_parser("frame", help="메인 루프 단계별 프레임 시간")
+    frame.add_argument("--chunks", type=int, default=40, help="생성할 구간 수")
+    frame.add_argument("--density", type=int, default=1, help="구간당 레이어 수")
+    frame.add_argument(
+        "--biome",
+        choices=("mixed", "land", "sea"),
+        default="mixed",
+        help="구간 바이옴",
+    )
+    frame.add_argument("--frames", type=int, default=600, help="측정 프레임 수")
+    frame.add_argument("--warmup", type=int, default=60, help="측정 전 프레임 수")
+    frame.add_argument("--seed", type=int, default=1, help="월드 시드")
+    frame.add_argument(
+        "--render-mode",
+        choices=("full", "dirty"),
+        default=RENDER_MODE,
+        help="화면 내보내기 방식",
+    )
+    frame.add_argument(
+        "--idle", action="store_true", help="키를 누르지 않아 카메라를 멈춰 둠"
+    )
+    frame.add_argument("--json", help="결과 JSON을 쓸 파일 (-면 표준 출력)")
+    frame.set_defaults(func=bench_frame)
+
+    args = parser.parse_args()
+    pygame.init()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
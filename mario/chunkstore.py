@@ -0,0 +1,105 @@
+"""
+화면 밖으로 정리한 청크를 보관했다가 다시 불러오는 저장소
+
+EntityManager.cleanup_offscreen이 버린 청크 열의 엔티티를 열 번호별로
+pickle + zlib으로 압축해 메모리에 둡니다. 압축한 크기의 합이 예산을 넘으면
+가장 오래전에 넣은 열부터 임시 폴더에 파일로 내려 두므로(spill), 긴 월드에서도
+메모리 사용량은 예산 안에 머물고 플레이어가 되돌아가면 그대로 되살릴 수
+있습니다.
+"""
+
+import os
+import pickle
+import tempfile
+import zlib
+from collections import OrderedDict
+
+from constants import *
+
+
+class ChunkStore:
+    """청크 열 번호 -> 압축한 엔티티 묶음을 담는 LRU 저장소"""
+
+    def __init__(self, budget=CHUNK_STORE_BUDGET, spill=CHUNK_STORE_SPILL):
+        """
+        Args:
+            budget: 메모리에 두는 압축 데이터의 최대 바이트 수
+            spill: True면 예산을 넘긴 열을 임시 폴더에 저장, False면 버림
+        """
+        self.budget = budget
+        self.spill = spill
+        # 열 번호 -> 압축 데이터 (앞쪽이 가장 오래전에 넣은 열)
+        self._memory = OrderedDict()
+        self.memory_bytes = 0
+        # 파일로 내려 둔 열 번호 -> 파일 경로
+        self._disk = {}
+        self._directory = None
+
+    def __len__(self):
+        return len(self._memory) + len(self._disk)
+
+    def __contains__(self, column):
+        return column in self._memory or column in self._disk
+
+    def put(self, column, items):
+        """
+        한 청크 열의 엔티티를 압축해 넣습니다 (이미 있으면 합침).
+
+        Args:
+            column: 청크 열 번호
+            items: 엔티티 리스트 속성 이름 -> 엔티티 리스트
+        """
+        stored = self.pop(column)
+        if stored:
+            for name, objs in items.items():
+                stored.setdefault(name, []).extend(objs)
+            items = stored
+        data = zlib.compress(pickle.dumps(items, pickle.HIGHEST_PROTOCOL))
+        self._memory[column] = data
+        self.memory_bytes += len(data)
+        self._evict()
+
+    def pop(self, column):
+        """
+        한 청크 열의 엔티티를 꺼냅니다 (저장소에서는 지움).
+
+        Args:
+            column: 청크 열 번호
+
+        Returns:
+            dict | None: 엔티티 리스트 속성 이름 -> 엔티티 리스트 (없으면 None)
+        """
+        data = self._memory.pop(column, None)
+        if data is not None:
+            self.memory_bytes -= len(data)
+        else:
+            path = self._disk.pop(column, None)
+            if path is None:
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+            os.remove(path)
+        return pickle.loads(zlib.decompress(data))
+
+    def clear(self):
+        """저장한 열을 모두 지웁니다 (임시 파일 포함)"""
+        self._memory.clear()
+        self.memory_bytes = 0
+        for path in self._disk.values():
+            os.remove(path)
+        self._disk.clear()
+
+    def _evict(self):
+        """예산을 넘는 동안 가장 오래전에 넣은 열을 파일로 내리거나 버림"""
+        while self.memory_bytes > self.budget and self._memory:
+            column, data = self._memory.popitem(last=False)
+            self.memory_bytes -= len(data)
+            if not self.spill:
+                continue
+            if self._directory is None:
+                # 객체가 사라지거나 프로그램이 끝나면 폴더째 지워짐
+                self._directory = tempfile.TemporaryDirectory(prefix="mario_chunks_")
+            path = os.path.join(self._directory.name, f"{column}.chunk")
+            with open(path, "wb") as f:
+                f.write(data)
+            self._disk[column] = path
@@ -2,9 +2,85 @@
 충돌 처리 담당 모듈
 """
 
-from typing import Callable, Any, Optional
+from typing import Callable, Optional
 import pygame
 from constants import *
+from models import Car, Enemy, FishEnemy, Jelly, Mushroom, TurtleEnemy
+
+
+# 이동 후 겹침 검사만 하면 플랫폼 두께(18~20px)보다 크게 움직이는 물체가
+# 플랫폼을 뚫고 지나갑니다. 아래 함수는 이동 경로(swept AABB)에서 처음 닿는
+# 플랫폼까지 이동량을 줄여, 이동 후 그 플랫폼과 1px 겹치게 만듭니다. 호출하는
+# 쪽은 기존처럼 겹친 플랫폼 바깥으로 붙이면 되므로, 작은 이동은 결과가 같고
+# 큰 이동만 처음 닿는 면에서 멈춥니다. 플랫폼 후보는 가로 이동 거리만큼 넓혀
+# 찾아야 합니다(platforms_near의 margin). 후보 격자는 x 열 단위라 세로로는
+# 화면 전체 높이를 이미 돌려주므로 세로 이동은 넓힐 필요가 없습니다.
+
+
+def swept_dx(rect: pygame.Rect, dx: float, platforms: list[pygame.Rect]) -> float:
+    """
+    rect를 가로로 dx만큼 옮길 때 처음 닿는 플랫폼까지만 가도록 줄인 이동량
+
+    Args:
+        rect: 옮길 물체의 rect (이동 전)
+        dx: 원래 가로 이동량
+        platforms: 충돌 검사할 플랫폼 리스트
+
+    Returns:
+        float: 닿는 플랫폼이 없으면 dx, 있으면 그 플랫폼과 1px 겹치는 이동량
+    """
+    if dx > 0:
+        right = rect.right
+        for p in platforms:
+            if (
+                right <= p.left < right + dx - 1
+                and p.bottom > rect.top
+                and p.top < rect.bottom
+            ):
+                dx = p.left - right + 1
+    elif dx < 0:
+        left = rect.left
+        for p in platforms:
+            if (
+                left + dx + 1 < p.right <= left
+                and p.bottom > rect.top
+                and p.top < rect.bottom
+            ):
+                dx = p.right - left - 1
+    return dx
+
+
+def swept_dy(rect: pygame.Rect, dy: int, platforms: list[pygame.Rect]) -> int:
+    """
+    rect를 세로로 dy만큼 옮길 때 처음 닿는 플랫폼까지만 가도록 줄인 이동량
+
+    Args:
+        rect: 옮길 물체의 rect (이동 전)
+        dy: 원래 세로 이동량 (정수 픽셀)
+        platforms: 충돌 검사할 플랫폼 리스트
+
+    Returns:
+        int: 닿는 플랫폼이 없으면 dy, 있으면 그 플랫폼과 1px 겹치는 이동량
+    """
+    if dy > 0:
+        bottom = rect.bottom
+        for p in platforms:
+            if (
+                bottom <= p.top < bottom + dy - 1
+                and p.right > rect.left
+                and p.left < rect.right
+            ):
+                dy = p.top - bottom + 1
+    elif dy < 0:
+        top = rect.top
+        for p in platforms:
+            if (
+                top + dy + 1 < p.bottom <= top
+                and p.right > rect.left
+                and p.left < rect.right
+            ):
+                dy = p.bottom - top - 1
+    return dy
 
 
 class CollisionHandler:
@@ -13,7 +89,7 @@ class CollisionHandler:
     @staticmethod
     def check_enemy_collision(
         player: "Player",
-        enemies: list[dict[str, Any]],
+        enemies: list[Enemy],
         on_reset_game: Callable[[], None],
     ) -> int:
         """
@@ -29,24 +105,24 @@ class CollisionHandler:
         """
         score = 0
         for e in enemies:
-            if not e["alive"]:
+            if not e.alive:
                 continue
 
             # 플레이어 본체 또는 탑승 중인 자동차와 충돌 확인
-            player_hit = player.rect.colliderect(e["rect"])
+            player_hit = player.rect.colliderect(e.rect)
             car_hit = False
             if player.on_car and player.current_car:
-                car_hit = player.current_car["rect"].colliderect(e["rect"])
+                car_hit = player.current_car.rect.colliderect(e.rect)
 
             if player_hit or car_hit:
                 # 위에서 밟았을 때 (플레이어 발이 적 머리 위)
                 # 자동차 타고 있어도 밟기는 가능하게 처리 (선택사항이나 게임성을 위해 유지)
                 if (
                     player.velocity_y > 0
-                    and player.rect.bottom <= e["rect"].top + STOMP_TOLERANCE
+                    and player.rect.bottom <= e.rect.top + STOMP_TOLERANCE
                 ):
-                    player.rect.bottom = e["rect"].top
-                    e["alive"] = False
+                    player.rect.bottom = e.rect.top
+                    e.alive = False
                     score += 1
                     player.velocity_y = JUMP_POWER * 0.6
                 else:
@@ -61,7 +137,7 @@ class CollisionHandler:
     @staticmethod
     def check_water_enemy_collision(
         player: "Player",
-        water_enemies: list[dict[str, Any]],
+        water_enemies: list[FishEnemy | TurtleEnemy],
         on_reset_game: Callable[[], None],
     ) -> int:
         """
@@ -77,14 +153,14 @@ class CollisionHandler:
         """
         score = 0
         for enemy in water_enemies:
-            if not enemy["alive"]:
+            if not enemy.alive:
                 continue
 
             # 플레이어 본체 또는 탑승 중인 자동차와 충돌 확인
-            player_hit = player.rect.colliderect(enemy["rect"])
+            player_hit = player.rect.colliderect(enemy.rect)
             car_hit = False
             if player.on_car and player.current_car:
-                car_hit = player.current_car["rect"].colliderect(enemy["rect"])
+                car_hit = player.current_car.rect.colliderect(enemy.rect)
 
             if player_hit or car_hit:
                 # 물속 적은 밟을 수 없음 (보통) - 그냥 닿으면 데미지
@@ -93,10 +169,10 @@ class CollisionHandler:
 
                 if (
                     player.velocity_y > 0
-                    and player.rect.bottom <= enemy["rect"].top + STOMP_TOLERANCE
+                    and player.rect.bottom <= enemy.rect.top + STOMP_TOLERANCE
                 ):
-                    player.rect.bottom = enemy["rect"].top
-                    enemy["alive"] = False
+                    player.rect.bottom = enemy.rect.top
+                    enemy.alive = False
                     score += 1
                     player.velocity_y = JUMP_POWER * 0.6
                 else:
@@ -111,7 +187,7 @@ class CollisionHandler:
     @staticmethod
     def check_jelly_collision(
         player: "Player",
-        jellies: list[dict[str, Any]],
+        jellies: list[Jelly],
         on_reset_game: Callable[[], None],
     ) -> None:
         """
@@ -123,10 +199,10 @@ class CollisionHandler:
             on_reset_game: 게임 리셋 콜백 함수
         """
         for j in jellies:
-            if not j["alive"]:
+            if not j.alive:
                 continue
 
-            if player.rect.colliderect(j["rect"]):
+            if player.rect.colliderect(j.rect):
                 # 체력 감소
                 game_over = player.take_damage()
                 if game_over:
@@ -134,23 +210,27 @@ class CollisionHandler:
                     break
 
     @staticmethod
-    def check_coin_collision(player: "Player", coins: list[pygame.Rect]) -> int:
+    def check_coin_collision(
+        player: "Player",
+        coins: list[pygame.Rect],
+        on_collect: Callable[[list[pygame.Rect]], None],
+    ) -> int:
         """
         플레이어와 동전의 충돌을 확인합니다.
 
         Args:
             player: 플레이어 객체
-            coins: 동전 리스트
+            coins: 동전 (후보) 리스트
+            on_collect: 획득한 동전들을 한 번에 제거하는 콜백 함수
 
         Returns:
             int: 획득한 점수
         """
-        score = 0
-        for c in list(coins):
-            if player.rect.colliderect(c):
-                coins.remove(c)
-                score += 1
-        return score
+        hits = player.rect.collidelistall(coins)
+        if not hits:
+            return 0
+        on_collect([coins[i] for i in hits])
+        return len(hits)
 
     @staticmethod
     def check_spring_collision(player: "Player", springs: list[pygame.Rect]) -> None:
@@ -169,18 +249,22 @@ class CollisionHandler:
 
     @staticmethod
     def check_mushroom_collision(
-        player: "Player", mushrooms: list[dict[str, Any]]
+        player: "Player",
+        mushrooms: list[Mushroom],
+        on_collect: Callable[[list[Mushroom]], None],
     ) -> None:
         """
         플레이어와 버섯의 충돌을 확인합니다.
 
         Args:
             player: 플레이어 객체
-            mushrooms: 버섯 리스트
+            mushrooms: 버섯 (후보) 리스트
+            on_collect: 획득한 버섯들을 한 번에 제거하는 콜백 함수
         """
-        for m in list(mushrooms):
-            if player.rect.colliderect(m["rect"]) and m["alive"]:
-                mushrooms.remove(m)
+        collected = []
+        for m in mushrooms:
+            if player.rect.colliderect(m.rect) and m.alive:
+                collected.append(m)
                 # 체력 회복
                 healed = player.heal()
                 # 체력이 최대가 아닌 경우에만 회복, 최대면 크기만 증가
@@ -188,6 +272,8 @@ class CollisionHandler:
                     player.make_big()
                 else:
                     player.make_big()
+        if collected:
+            on_collect(collected)
 
     @staticmethod
     def check_spike_collision(
@@ -228,7 +314,7 @@ class CollisionHandler:
 
     @staticmethod
     def check_car_collision(
-        player: "Player", cars: list[dict[str, Any]], on_ground: bool
+        player: "Player", cars: list[Car], on_ground: bool
     ) -> None:
         """
         플레이어와 자동차의 충돌을 확인합니다 (탑승 처리).
@@ -239,14 +325,14 @@ class CollisionHandler:
             on_ground: 플레이어가 바닥에 있는지 여부
         """
         for car in cars:
-            if not car["alive"]:
+            if not car.alive:
                 continue
             is_landing = player.velocity_y >= 0
             if (
-                player.rect.colliderect(car["rect"])
+                player.rect.colliderect(car.rect)
                 and (on_ground or is_landing)
                 and not player.on_car
-                and car["rider"] is None
+                and car.rider is None
             ):
                 player.mount_car(car)
                 break
@@ -268,6 +354,6 @@ class CollisionHandler:
                 return True
             # 자동차 타고 있을 때 자동차가 깃발에 닿아도 인정
             if player.on_car and player.current_car:
-                if player.current_car["rect"].colliderect(f):
+                if player.current_car.rect.colliderect(f):
                     return True
         return False
@@ -7,6 +7,13 @@ import pygame
 # 화면 설정
 SCREEN_WIDTH = 1600
 SCREEN_HEIGHT = 960
+FPS = 60  # 초당 프레임 수 (게임 로직은 프레임 단위 고정 시간 간격)
+SIMULATION_DT = 1 / FPS  # 시뮬레이션 한 스텝의 길이 (초)
+RENDER_FPS = 60  # 렌더링 프레임 상한 (보통 모니터 주사율, 0이면 제한 없음, 시뮬레이션 속도와 무관)
+MAX_CATCH_UP_STEPS = 5  # 렌더링 한 번에 따라잡는 최대 시뮬레이션 스텝 (과부하 시 폭주 방지)
+INTERPOLATION_MAX_JUMP = 100  # 한 스텝에 이보다 많이 움직인 물체는 보간하지 않음 (px)
+BACKGROUND_GRID_SIZE = 100  # 월드 2 배경 그리드 칸 크기
+TERRAIN_COLORKEY = (255, 0, 255)  # 청크 지형 표면의 투명색 (지형에 쓰지 않는 색)
 
 # 색상 정의 (R, G, B)
 SKY = (135, 206, 235)  # 하늘색
@@ -60,6 +67,30 @@ CAR_INVINCIBLE_ON_RAM = 30  # 들이받기 후 무적 프레임
 # 레벨 생성 설정
 CHUNK_WIDTH = 800  # 한 구간의 가로 길이
 INITIAL_GENERATED_X = 2600  # 초기 생성된 맵의 끝 X 좌표
+PLATFORM_QUERY_MARGIN = 32  # 플랫폼 충돌 후보를 찾을 때 좌우로 넓혀 보는 여유
+# 월드 시드: 정수면 매번 같은 맵과 적 움직임, None이면 실행할 때마다 새로 뽑음
+WORLD_SEED = None
+
+# 순찰형 엔티티(물고기, 거북이, 해파리, 움직이는 플랫폼) 업데이트 방식
+# "numpy"면 배열로 한 번에 계산 (uv sync --extra fast 필요), 아니면 파이썬 루프
+PATROL_BACKEND = "python"
+PATROL_ACTIVE_MARGIN = 400  # NumPy 백엔드가 rect를 갱신하는 화면 좌우 여유
+
+# 정리한 청크 보관소 (플레이어가 되돌아가면 다시 불러옴)
+CHUNK_STORE_BUDGET = 4 * 1024 * 1024  # 메모리에 압축해 두는 청크의 최대 바이트 수
+CHUNK_STORE_SPILL = True  # 예산을 넘긴 오래된 청크를 임시 폴더에 저장 (False면 버림)
+
+# 화면 내보내기 방식
+# "full"이면 매 프레임 화면 전체를 다시 그려 flip, "dirty"면 카메라가 멈춰 있는
+# 동안 배경과 지형을 다시 그리지 않고 바뀐 영역만 display.update
+RENDER_MODE = "dirty"
+
+# 입력 기록/재생 (replay.py): 이 스텝 간격마다 게임 상태 해시를 남겨 비교
+REPLAY_HASH_INTERVAL = 60
+
+# 프로파일러 오버레이 (F3 켜기/끄기, F4 캡처 저장)
+PROFILER_HISTORY = 240  # 프레임 시간 그래프에 보여 줄 최근 프레임 수
+PROFILER_CAPTURE_FRAMES = 3600  # 파일로 저장하려고 보관하는 최근 프레임 수
 
 # 수영 관련 설정
 SWIM_FORCE = 0.6
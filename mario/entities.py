@@ -5,14 +5,169 @@
 import pygame
 import random
 import math
+from itertools import count
 from constants import *
+from models import (
+    Car,
+    Enemy,
+    FragilePlatform,
+    Mushroom,
+    MovingPlatform,
+    VerticalPlatform,
+)
+from chunkstore import ChunkStore
+from collision import swept_dx, swept_dy
+from patrol import NUMPY_AVAILABLE, PatrolSystem
+from spatial import (
+    PlatformGrid,
+    RenderIndex,
+    PLATFORM_STATIC,
+    PLATFORM_MOVING,
+    PLATFORM_FRAGILE,
+)
+
+
+# 플랫폼 격자에도 rect가 들어 있는 엔티티 리스트 속성
+_PLATFORM_KINDS = ("moving_platforms", "vertical_platforms", "fragile_platforms")
+
+# NumPy 백엔드에서 PatrolGroup이 관리하는 엔티티 리스트 속성
+_PATROL_LISTS = (
+    ("fish_enemies", "fish"),
+    ("turtle_enemies", "turtles"),
+    ("jellies", "jellies"),
+    ("moving_platforms", "moving_platforms"),
+    ("vertical_platforms", "vertical_platforms"),
+)
+
+
+def _rect_span(obj):
+    return obj.rect.left, obj.rect.right
+
+
+def _patrol_span(obj):
+    return obj.left, obj.right
+
+
+def _query_margin(dx):
+    """가로로 dx만큼 움직이는 물체의 플랫폼 후보를 찾을 때 좌우로 넓혀 볼 여유"""
+    return max(PLATFORM_QUERY_MARGIN, math.ceil(abs(dx)))
+
+
+def _remove_all(items, dropped):
+    """
+    리스트에서 dropped 항목을 제자리에서 제거합니다.
+
+    엔티티는 대부분 왼쪽 청크부터 생성되어 리스트 앞쪽에 몰려 있으므로,
+    버릴 항목이 모두 앞쪽이면 앞부분만 잘라냅니다.
+    """
+    if not dropped:
+        return
+    gone = {id(item) for item in dropped}
+    front = 0
+    for item in items:
+        if id(item) not in gone:
+            break
+        front += 1
+    if front == len(gone):
+        del items[:front]
+    else:
+        items[:] = [item for item in items if id(item) not in gone]
+
+
+# 화면 컬링 인덱스에 등록하는 엔티티 리스트 속성 -> 그려질 수 있는 x 구간
+# 순찰 구간이 정해진 엔티티는 구간 전체, 나머지는 현재 rect 기준
+# (플레이어 충돌 후보 검색 collision_candidates와 청크 단위 정리도 이 인덱스를 씀)
+_RENDER_SPANS = {
+    "flags": lambda f: (f.left - 40, f.right),  # 깃발 삼각형이 기둥 왼쪽으로 40
+    "seas": lambda w: (w.left - 12, w.right + 12),  # 물결이 좌우로 12씩 넘침
+    "coins": lambda c: (c.left, c.right),
+    "moving_platforms": _patrol_span,
+    "vertical_platforms": _rect_span,
+    "fragile_platforms": _rect_span,
+    "fish_enemies": _patrol_span,
+    "turtle_enemies": _patrol_span,
+    "jellies": _rect_span,
+    "enemies": _rect_span,
+    "mushrooms": _rect_span,
+    "cars": _rect_span,
+    "springs": lambda s: (s.left, s.right),
+    "spikes": lambda g: (g.left, g.right),
+    "corals": lambda c: (c.left, c.right),
+}
+
+# 보관소에 넣을 때 청크 열을 정하는 x 구간 (고정 플랫폼은 인덱스 대신 격자에 있음)
+_STORE_SPANS = {"platforms": lambda p: (p.left, p.right), **_RENDER_SPANS}
+
+# 보관소에서 되살릴 때 쓰는 엔티티 리스트 속성 -> 추가 메서드
+_ADDERS = {
+    "platforms": "add_platform",
+    "flags": "add_flag",
+    "seas": "add_sea",
+    "coins": "add_coin",
+    "moving_platforms": "add_moving_platform",
+    "vertical_platforms": "add_vertical_platform",
+    "fragile_platforms": "add_fragile_platform",
+    "fish_enemies": "add_fish_enemy",
+    "turtle_enemies": "add_turtle_enemy",
+    "jellies": "add_jelly",
+    "enemies": "add_enemy",
+    "mushrooms": "add_mushroom",
+    "cars": "add_car",
+    "springs": "add_spring",
+    "spikes": "add_spike",
+    "corals": "add_coral",
+}
+
+# EntityManager의 모든 엔티티 리스트 속성 (재생 해시, 프로파일러, 벤치가 함께 씀)
+ENTITY_LISTS = (
+    "platforms",
+    "moving_platforms",
+    "vertical_platforms",
+    "fragile_platforms",
+    "enemies",
+    "fish_enemies",
+    "turtle_enemies",
+    "jellies",
+    "coins",
+    "mushrooms",
+    "dinos",
+    "fireballs",
+    "springs",
+    "spikes",
+    "seas",
+    "cars",
+    "corals",
+    "flags",
+)
+
+# 플레이어와 충돌을 검사하는 엔티티 리스트 (Game.handle_collisions의 검사 순서)
+COLLISION_KINDS = (
+    "flags",
+    "enemies",
+    "fish_enemies",
+    "turtle_enemies",
+    "jellies",
+    "coins",
+    "springs",
+    "mushrooms",
+    "spikes",
+)
+
+# 불똥에 맞으면 죽는 엔티티 리스트 (검사 순서)
+FIREBALL_TARGETS = ("enemies", "fish_enemies", "turtle_enemies", "jellies")
 
 
 class EntityManager:
     """게임의 모든 엔티티를 관리하는 클래스"""
 
-    def __init__(self):
-        """엔티티 매니저 초기화"""
+    def __init__(self, patrol_backend=PATROL_BACKEND, seed=0):
+        """
+        엔티티 매니저 초기화
+
+        Args:
+            patrol_backend: 순찰형 엔티티 업데이트 방식 ("python" 또는 "numpy")
+            seed: 엔티티 시뮬레이션 난수 시드 (레벨 생성과 별개의 흐름)
+        """
         self.platforms = []
         self.moving_platforms = []
         self.vertical_platforms = []
@@ -32,6 +187,45 @@ class EntityManager:
         self.corals = []
         self.flags = []
 
+        # 플랫폼 충돌 후보 검색용 격자 (청크 열 단위)
+        self.platform_grid = PlatformGrid()
+        # 충돌 후보를 담아 재사용하는 리스트 (프레임마다 새로 만들지 않음)
+        self._nearby = []
+        self._seas_near = []
+        self._targets = []
+
+        # 엔티티 시뮬레이션 전용 난수 (리셋할 때마다 같은 시드로 다시 시작)
+        self.seed = seed
+        self.rng = random.Random(f"{seed}:entities")
+
+        # 정적 지형(고정 플랫폼, 스프링, 가시, 산호, 바다)이 바뀐 청크 열 -> 버전
+        # 렌더러는 버전이 바뀐 청크의 지형 표면만 다시 그립니다
+        self.terrain_versions = {}
+        self._terrain_clock = count(1)
+
+        # 화면 컬링용 x 구간 인덱스 (_RENDER_SPANS의 종류별)
+        self.render_index = {name: RenderIndex() for name in _RENDER_SPANS}
+        # collision_candidates가 종류별 충돌 후보를 담아 재사용하는 리스트
+        self._candidates = {name: [] for name in COLLISION_KINDS}
+        # reset_to_initial_state마다 1씩 증가 (리셋 전에 모은 후보를 버리는 데 씀)
+        self.generation = 0
+        # cleanup_offscreen이 이미 버린 청크 열 (이 열 왼쪽은 모두 버림)
+        self.despawned_column = 0
+        # 버린 청크 열의 엔티티 보관소 (플레이어가 되돌아가면 되살림)
+        self.chunk_store = ChunkStore()
+
+        # 순찰형 엔티티(물고기, 거북이, 해파리, 움직이는 플랫폼)의 배열 시뮬레이션
+        self.patrols = None
+        if patrol_backend == "numpy":
+            if NUMPY_AVAILABLE:
+                self.patrols = PatrolSystem()
+            else:
+                print("numpy가 없어 순찰형 엔티티를 파이썬 루프로 업데이트합니다")
+        # NumPy 백엔드가 rect를 되돌려 쓰는 X 구간 (기본값: 전체)
+        self.active_left = -math.inf
+        self.active_right = math.inf
+        self._load_patrols()
+
     def reset_to_initial_state(self):
         """초기 상태로 리셋"""
         self.platforms = [
@@ -48,47 +242,31 @@ class EntityManager:
         ]
 
         self.moving_platforms = [
-            {
-                "rect": pygame.Rect(1350, 340, 120, 20),
-                "vx": 2,
-                "left": 1350,
-                "right": 1650,
-            },
-            {
-                "rect": pygame.Rect(1850, 260, 100, 20),
-                "vx": -2,
-                "left": 1750,
-                "right": 2050,
-            },
+            MovingPlatform(
+                pygame.Rect(1350, 340, 120, 20), vx=2, left=1350, right=1650
+            ),
+            MovingPlatform(
+                pygame.Rect(1850, 260, 100, 20), vx=-2, left=1750, right=2050
+            ),
         ]
 
         self.vertical_platforms = [
-            {
-                "rect": pygame.Rect(1600, 260, 100, 20),
-                "vy": 2,
-                "top": 220,
-                "bottom": 360,
-            },
+            VerticalPlatform(
+                pygame.Rect(1600, 260, 100, 20), vy=2, top=220, bottom=360
+            ),
         ]
 
         self.fragile_platforms = [
-            {"rect": pygame.Rect(1300, 300, 110, 18), "timer": -1},
+            FragilePlatform(pygame.Rect(1300, 300, 110, 18)),
         ]
 
         self.enemies = [
-            {"rect": pygame.Rect(380, 392, 28, 28), "vx": -2, "vy": 0, "alive": True},
-            {"rect": pygame.Rect(800, 392, 28, 28), "vx": 2, "vy": 0, "alive": True},
-            {"rect": pygame.Rect(1080, 392, 28, 28), "vx": -2, "vy": 0, "alive": True},
-            {"rect": pygame.Rect(1500, 392, 28, 28), "vx": -2, "vy": 0, "alive": True},
-            {"rect": pygame.Rect(2000, 392, 28, 28), "vx": 2, "vy": 0, "alive": True},
-            {
-                "rect": pygame.Rect(1720, 392, 28, 28),
-                "vx": 2,
-                "vy": 0,
-                "alive": True,
-                "kind": "hopper",
-                "jump_cd": 60,
-            },
+            Enemy(pygame.Rect(380, 392, 28, 28), vx=-2),
+            Enemy(pygame.Rect(800, 392, 28, 28), vx=2),
+            Enemy(pygame.Rect(1080, 392, 28, 28), vx=-2),
+            Enemy(pygame.Rect(1500, 392, 28, 28), vx=-2),
+            Enemy(pygame.Rect(2000, 392, 28, 28), vx=2),
+            Enemy(pygame.Rect(1720, 392, 28, 28), vx=2, kind="hopper", jump_cd=60),
         ]
 
         self.fish_enemies = []
@@ -108,7 +286,7 @@ class EntityManager:
         ]
 
         self.mushrooms = [
-            {"rect": pygame.Rect(1120, 396, 24, 24), "vx": 2, "vy": 0, "alive": True},
+            Mushroom(pygame.Rect(1120, 396, 24, 24), vx=2),
         ]
 
         self.dinos = []
@@ -118,225 +296,539 @@ class EntityManager:
         self.seas = []
         self.corals = []
         self.cars = [
-            {
-                "rect": pygame.Rect(400, 390, 50, 30),
-                "alive": True,
-                "rider": None,
-                "vx": 1,
-                "left": 300,
-                "right": 600,
-            }
+            Car(pygame.Rect(400, 390, 50, 30), vx=1, left=300, right=600),
         ]
 
         self.flags = []
 
+        self._load_patrols()
+        self.rebuild_platform_grid()
+        self.rebuild_terrain_versions()
+        self.rebuild_render_index()
+        self.rng.seed(f"{self.seed}:entities")
+        self.generation += 1
+        self.despawned_column = 0
+        self.chunk_store.clear()
+
+    def _load_patrols(self):
+        """
+        순찰형 엔티티 리스트를 PatrolGroup에 싣고, 리스트 속성을
+        PatrolGroup의 objects로 바꿔 둡니다 (NumPy 백엔드일 때만)
+        """
+        if self.patrols is None:
+            return
+        for attr, name in _PATROL_LISTS:
+            group = getattr(self.patrols, name)
+            group.load(getattr(self, attr))
+            setattr(self, attr, group.objects)
+
+    def set_active_window(self, left, right):
+        """
+        NumPy 백엔드가 매 프레임 rect를 갱신할 X 구간을 정합니다.
+        보통 카메라 화면에 PATROL_ACTIVE_MARGIN을 더한 범위입니다.
+        물속 적(물고기, 거북이, 해파리)에만 적용되고 플랫폼은 항상 갱신합니다.
+        """
+        self.active_left = left
+        self.active_right = right
+
+    def rebuild_platform_grid(self):
+        """플랫폼 리스트로부터 격자를 다시 만듭니다"""
+        self.platform_grid.clear()
+        for p in self.platforms:
+            self.platform_grid.add(p, PLATFORM_STATIC)
+        for mp in self.moving_platforms:
+            self.platform_grid.add(mp.rect, PLATFORM_MOVING)
+        for vp in self.vertical_platforms:
+            self.platform_grid.add(vp.rect, PLATFORM_MOVING)
+        for fp in self.fragile_platforms:
+            self.platform_grid.add(fp.rect, PLATFORM_FRAGILE)
+
+    def rebuild_render_index(self):
+        """현재 엔티티 리스트로부터 화면 컬링 인덱스를 다시 만듭니다"""
+        for name, span in _RENDER_SPANS.items():
+            index = self.render_index[name]
+            index.clear()
+            for obj in getattr(self, name):
+                index.add(obj, *span(obj))
+
+    def _index(self, name, obj):
+        """엔티티를 화면 컬링 인덱스에 등록합니다"""
+        self.render_index[name].add(obj, *_RENDER_SPANS[name](obj))
+
+    def visible(self, name, left, right, out=None):
+        """
+        x 구간 [left, right)가 걸치는 청크 열에 있는 엔티티를 반환합니다.
+
+        Args:
+            name: 엔티티 리스트 속성 이름 (예: "enemies", "coins")
+            left: 화면 왼쪽 X
+            right: 화면 오른쪽 X
+            out: 결과를 담을 재사용 리스트 (None이면 새 리스트)
+
+        Returns:
+            list: 그릴 후보 (열 단위라 화면 밖 엔티티가 섞일 수 있음)
+        """
+        return self.render_index[name].query(left, right, out)
+
+    def collision_candidates(self, left, right):
+        """
+        x 구간 [left, right)와 겹칠 수 있는 충돌 대상을 종류별로 한 번에 모읍니다.
+
+        전체 리스트를 훑지 않고 구간이 걸친 청크 열 버킷만 보므로, 비용이
+        월드에 쌓인 엔티티 수가 아니라 주변 엔티티 수에 비례합니다. 순찰 구간을
+        살짝 넘어간 물속 적도 잡도록 PLATFORM_QUERY_MARGIN만큼 넓혀 찾습니다.
+
+        Args:
+            left: 플레이어(와 탑승 중인 자동차)의 가장 왼쪽 X
+            right: 플레이어(와 탑승 중인 자동차)의 가장 오른쪽 X
+
+        Returns:
+            dict: COLLISION_KINDS의 이름 -> 후보 리스트 (다음 호출 때 다시 채워짐)
+        """
+        left -= PLATFORM_QUERY_MARGIN
+        right += PLATFORM_QUERY_MARGIN
+        render_index = self.render_index
+        for name, out in self._candidates.items():
+            render_index[name].query(left, right, out)
+        return self._candidates
+
+    def rebuild_terrain_versions(self):
+        """현재 정적 지형 전체로 청크별 지형 버전을 다시 매깁니다"""
+        self.terrain_versions.clear()
+        terrain = (self.platforms, self.springs, self.spikes, self.corals, self.seas)
+        for items in terrain:
+            for rect in items:
+                self._touch_terrain(rect)
+
+    def _touch_terrain(self, rect):
+        """rect가 걸치는 청크 열의 지형 버전을 올립니다"""
+        version = next(self._terrain_clock)
+        first = rect.left // CHUNK_WIDTH
+        last = (max(rect.right, rect.left + 1) - 1) // CHUNK_WIDTH
+        for column in range(first, last + 1):
+            self.terrain_versions[column] = version
+
+    def add_platform(self, rect):
+        """고정 플랫폼 추가 (격자에도 등록)"""
+        self.platforms.append(rect)
+        self.platform_grid.add(rect, PLATFORM_STATIC)
+        self._touch_terrain(rect)
+
+    def remove_platform(self, rect):
+        """
+        고정 플랫폼 제거 (격자에서도 제거)
+
+        Raises:
+            ValueError: 플랫폼 리스트에 없는 경우
+        """
+        self.platforms.remove(rect)
+        self.platform_grid.remove(rect)
+        self._touch_terrain(rect)
+
+    def add_moving_platform(self, mp):
+        """움직이는 플랫폼 추가 (격자에도 등록)"""
+        if self.patrols is not None:
+            self.patrols.moving_platforms.add(mp)
+        else:
+            self.moving_platforms.append(mp)
+        self.platform_grid.add(mp.rect, PLATFORM_MOVING)
+        self._index("moving_platforms", mp)
+
+    def add_vertical_platform(self, vp):
+        """수직 플랫폼 추가 (격자에도 등록)"""
+        if self.patrols is not None:
+            self.patrols.vertical_platforms.add(vp)
+        else:
+            self.vertical_platforms.append(vp)
+        self.platform_grid.add(vp.rect, PLATFORM_MOVING)
+        self._index("vertical_platforms", vp)
+
+    def add_fragile_platform(self, fp):
+        """부서지는 플랫폼 추가 (격자에도 등록)"""
+        self.fragile_platforms.append(fp)
+        self.platform_grid.add(fp.rect, PLATFORM_FRAGILE)
+        self._index("fragile_platforms", fp)
+
+    def add_spring(self, rect):
+        """스프링 추가"""
+        self.springs.append(rect)
+        self._touch_terrain(rect)
+        self._index("springs", rect)
+
+    def add_spike(self, rect):
+        """가시 추가"""
+        self.spikes.append(rect)
+        self._touch_terrain(rect)
+        self._index("spikes", rect)
+
+    def add_coral(self, rect):
+        """산호 추가"""
+        self.corals.append(rect)
+        self._touch_terrain(rect)
+        self._index("corals", rect)
+
+    def add_sea(self, rect):
+        """바다 추가"""
+        self.seas.append(rect)
+        self._touch_terrain(rect)
+        self._index("seas", rect)
+
+    def add_flag(self, rect):
+        """깃발 추가"""
+        self.flags.append(rect)
+        self._index("flags", rect)
+
+    def add_coin(self, rect):
+        """동전 추가"""
+        self.coins.append(rect)
+        self._index("coins", rect)
+
+    def remove_coin(self, rect):
+        """
+        동전 제거 (획득)
+
+        Raises:
+            ValueError: 동전 리스트에 없는 경우
+        """
+        self.coins.remove(rect)
+        self.render_index["coins"].remove(rect)
+
+    def remove_coins(self, rects):
+        """
+        여러 동전을 한 번에 제거 (획득)
+
+        하나씩 list.remove하지 않고 리스트를 한 번만 다시 만듭니다.
+        리스트에 없는 동전은 무시합니다.
+        """
+        gone = {id(rect) for rect in rects}
+        self.coins = [c for c in self.coins if id(c) not in gone]
+        index = self.render_index["coins"]
+        for rect in rects:
+            index.remove(rect)
+
+    def add_enemy(self, enemy):
+        """적 추가"""
+        self.enemies.append(enemy)
+        self._index("enemies", enemy)
+
+    def add_mushroom(self, mushroom):
+        """버섯 아이템 추가"""
+        self.mushrooms.append(mushroom)
+        self._index("mushrooms", mushroom)
+
+    def remove_mushroom(self, mushroom):
+        """
+        버섯 아이템 제거 (획득)
+
+        Raises:
+            ValueError: 버섯 리스트에 없는 경우
+        """
+        self.mushrooms.remove(mushroom)
+        self.render_index["mushrooms"].remove(mushroom)
+
+    def remove_mushrooms(self, mushrooms):
+        """
+        여러 버섯 아이템을 한 번에 제거 (획득)
+
+        리스트에 없는 버섯은 무시합니다.
+        """
+        gone = {id(m) for m in mushrooms}
+        self.mushrooms = [m for m in self.mushrooms if id(m) not in gone]
+        index = self.render_index["mushrooms"]
+        for m in mushrooms:
+            index.remove(m)
+
+    def add_car(self, car):
+        """자동차 추가"""
+        self.cars.append(car)
+        self._index("cars", car)
+
+    def add_fish_enemy(self, fish):
+        """물고기 적 추가"""
+        if self.patrols is not None:
+            self.patrols.fish.add(fish)
+        else:
+            self.fish_enemies.append(fish)
+        self._index("fish_enemies", fish)
+
+    def add_turtle_enemy(self, turtle):
+        """거북이 적 추가"""
+        if self.patrols is not None:
+            self.patrols.turtles.add(turtle)
+        else:
+            self.turtle_enemies.append(turtle)
+        self._index("turtle_enemies", turtle)
+
+    def add_jelly(self, jelly):
+        """해파리 추가"""
+        if self.patrols is not None:
+            self.patrols.jellies.add(jelly)
+        else:
+            self.jellies.append(jelly)
+        self._index("jellies", jelly)
+
+    def platforms_near(
+        self, rect, margin=PLATFORM_QUERY_MARGIN, max_layer=PLATFORM_FRAGILE, out=None
+    ):
+        """
+        rect 주변의 플랫폼 충돌 후보를 반환합니다.
+
+        Args:
+            rect: 검사할 물체의 rect
+            margin: 좌우로 넓혀서 볼 여유
+            max_layer: 포함할 최대 플랫폼 층 (고정 < 움직이는 < 부서지는)
+            out: 결과를 담을 재사용 리스트 (None이면 새 리스트)
+
+        Returns:
+            list: 주변 열에 있는 플랫폼 rect 리스트
+        """
+        return self.platform_grid.query(rect, margin, max_layer, out)
+
     def get_all_platforms(self):
-        """모든 플랫폼을 하나의 리스트로 반환"""
-        return (
-            self.platforms
-            + [mp["rect"] for mp in self.moving_platforms]
-            + [vp["rect"] for vp in self.vertical_platforms]
-            + [fp["rect"] for fp in self.fragile_platforms]
-        )
+        """
+        모든 플랫폼 rect의 읽기 전용 뷰를 반환합니다.
+
+        플랫폼이 추가/제거/정리될 때 함께 갱신되는 뷰라서 호출할 때마다
+        리스트를 새로 만들지 않습니다. 순회만 하고 수정하지 마세요.
+        """
+        return self.platform_grid.rects()
 
     def update_moving_platforms(self):
         """움직이는 플랫폼 업데이트"""
+        if self.patrols is not None:
+            # 플랫폼은 화면 밖 적의 충돌에도 쓰이므로 항상 전부 되돌려 쓰고,
+            # 걸치는 격자 열이 바뀐 것만 격자에 다시 넣음
+            grid = self.platform_grid
+            moved = self.patrols.moving_platforms.step_all(grid.cell_width)
+            for i in moved:
+                grid.update(self.moving_platforms[i].rect)
+            return
         for mp in self.moving_platforms:
-            mp["rect"].x += mp["vx"]
-            if mp["rect"].left < mp["left"]:
-                mp["rect"].left = mp["left"]
-                mp["vx"] *= -1
-            elif mp["rect"].right > mp["right"]:
-                mp["rect"].right = mp["right"]
-                mp["vx"] *= -1
+            mp.rect.x += mp.vx
+            if mp.rect.left < mp.left:
+                mp.rect.left = mp.left
+                mp.vx *= -1
+            elif mp.rect.right > mp.right:
+                mp.rect.right = mp.right
+                mp.vx *= -1
+            self.platform_grid.update(mp.rect)
 
     def update_vertical_platforms(self):
         """수직 플랫폼 업데이트"""
+        if self.patrols is not None:
+            self.patrols.vertical_platforms.step_all(self.platform_grid.cell_width)
+            return
         for vp in self.vertical_platforms:
-            vp["rect"].y += vp["vy"]
-            if vp["rect"].top < vp["top"]:
-                vp["rect"].top = vp["top"]
-                vp["vy"] *= -1
-            elif vp["rect"].bottom > vp["bottom"]:
-                vp["rect"].bottom = vp["bottom"]
-                vp["vy"] *= -1
+            vp.rect.y += vp.vy
+            if vp.rect.top < vp.top:
+                vp.rect.top = vp.top
+                vp.vy *= -1
+            elif vp.rect.bottom > vp.bottom:
+                vp.rect.bottom = vp.bottom
+                vp.vy *= -1
 
     def update_enemies(self):
         """적 업데이트"""
-        all_platforms = self.get_all_platforms()
-
+        index = self.render_index["enemies"]
         for e in self.enemies:
-            if not e["alive"]:
+            if not e.alive:
                 continue
 
+            nearby = self.platforms_near(
+                e.rect, margin=_query_margin(e.vx), out=self._nearby
+            )
+
             # 점프형 적
-            if e.get("kind") == "hopper":
-                e["jump_cd"] -= 1
-                if e["jump_cd"] <= 0:
-                    e["vy"] = -8
-                    e["jump_cd"] = random.randint(50, 90)
+            if e.kind == "hopper":
+                e.jump_cd -= 1
+                if e.jump_cd <= 0:
+                    e.vy = -8
+                    e.jump_cd = self.rng.randint(50, 90)
 
             # 물속에서는 가벼운 중력
-            in_sea = self._is_in_water(e["rect"])
+            in_sea = self._is_in_water(e.rect)
             if in_sea:
-                e["vy"] -= GRAVITY
-                if e["rect"].top < in_sea.top - 4:
-                    e["vy"] += 0.4
-                e["vy"] *= 0.9
-                e["vy"] = max(min(e["vy"], 5), -5)
+                e.vy -= GRAVITY
+                if e.rect.top < in_sea.top - 4:
+                    e.vy += 0.4
+                e.vy *= 0.9
+                e.vy = max(min(e.vy, 5), -5)
             else:
-                e["vy"] += GRAVITY
+                e.vy += GRAVITY
 
-            e["vy"] = min(e["vy"], 20)
+            e.vy = min(e.vy, 20)
 
-            # 수직 이동
-            e["rect"].y += int(e["vy"])
-            for p in all_platforms:
-                if e["rect"].colliderect(p):
-                    if e["vy"] > 0:
-                        e["rect"].bottom = p.top
-                        e["vy"] = 0
+            # 수직 이동 (떨어질 때만 플랫폼에 착지하므로 아래로만 swept 검사)
+            dy = int(e.vy)
+            if dy > 0:
+                dy = swept_dy(e.rect, dy, nearby)
+            e.rect.y += dy
+            for p in nearby:
+                if e.rect.colliderect(p):
+                    if e.vy > 0:
+                        e.rect.bottom = p.top
+                        e.vy = 0
 
             # 수평 이동
-            e["rect"].x += e["vx"]
-            for p in all_platforms:
-                if e["rect"].colliderect(p):
-                    if e["vx"] > 0:
-                        e["rect"].right = p.left
+            e.rect.x += swept_dx(e.rect, e.vx, nearby)
+            for p in nearby:
+                if e.rect.colliderect(p):
+                    if e.vx > 0:
+                        e.rect.right = p.left
                     else:
-                        e["rect"].left = p.right
-                    e["vx"] *= -1
+                        e.rect.left = p.right
+                    e.vx *= -1
+
+            index.update(e, e.rect.left, e.rect.right)
 
     def update_fish_enemies(self):
         """물고기 적 업데이트"""
+        if self.patrols is not None:
+            self.patrols.fish.step(self.active_left, self.active_right)
+            return
         for f in self.fish_enemies:
-            if not f["alive"]:
+            if not f.alive:
                 continue
-            f["rect"].x += f["vx"]
-            if f["rect"].left < f["left"] or f["rect"].right > f["right"]:
-                f["vx"] *= -1
+            f.rect.x += f.vx
+            if f.rect.left < f.left or f.rect.right > f.right:
+                f.vx *= -1
 
     def update_turtle_enemies(self):
         """거북이 적 업데이트"""
+        if self.patrols is not None:
+            self.patrols.turtles.step(self.active_left, self.active_right)
+            return
         for t in self.turtle_enemies:
-            if not t["alive"]:
+            if not t.alive:
                 continue
-            t["rect"].x += t["vx"]
-            if t["rect"].left < t["left"] or t["rect"].right > t["right"]:
-                t["vx"] *= -1
-            t["t"] += 0.05
-            t["rect"].y += int(math.sin(t["t"]) * t["amp"] * 0.1)
+            t.rect.x += t.vx
+            if t.rect.left < t.left or t.rect.right > t.right:
+                t.vx *= -1
+            t.t += 0.05
+            t.rect.y += int(math.sin(t.t) * t.amp * 0.1)
 
     def update_jellies(self):
         """해파리 업데이트"""
+        if self.patrols is not None:
+            self.patrols.jellies.step(self.active_left, self.active_right)
+            return
         for j in self.jellies:
-            if not j["alive"]:
+            if not j.alive:
                 continue
-            j["rect"].y += j["dir"] * 1
-            if j["rect"].top < j["top"] or j["rect"].bottom > j["bottom"]:
-                j["dir"] *= -1
+            j.rect.y += j.direction * 1
+            if j.rect.top < j.top or j.rect.bottom > j.bottom:
+                j.direction *= -1
 
     def update_mushrooms(self):
         """버섯 아이템 업데이트"""
-        all_platforms = (
-            self.platforms
-            + [mp["rect"] for mp in self.moving_platforms]
-            + [vp["rect"] for vp in self.vertical_platforms]
-        )
-
+        index = self.render_index["mushrooms"]
         for m in self.mushrooms:
-            if not m["alive"]:
+            if not m.alive:
                 continue
 
-            m["vy"] += GRAVITY
-            m["vy"] = min(m["vy"], 20)
-            m["rect"].y += int(m["vy"])
-
-            for p in all_platforms:
-                if m["rect"].colliderect(p):
-                    if m["vy"] > 0:
-                        m["rect"].bottom = p.top
-                        m["vy"] = 0
-
-            m["rect"].x += m["vx"]
-            for p in all_platforms:
-                if m["rect"].colliderect(p):
-                    if m["vx"] > 0:
-                        m["rect"].right = p.left
+            nearby = self.platforms_near(
+                m.rect,
+                margin=_query_margin(m.vx),
+                max_layer=PLATFORM_MOVING,
+                out=self._nearby,
+            )
+
+            m.vy += GRAVITY
+            m.vy = min(m.vy, 20)
+            dy = int(m.vy)
+            if dy > 0:
+                dy = swept_dy(m.rect, dy, nearby)
+            m.rect.y += dy
+
+            for p in nearby:
+                if m.rect.colliderect(p):
+                    if m.vy > 0:
+                        m.rect.bottom = p.top
+                        m.vy = 0
+
+            m.rect.x += swept_dx(m.rect, m.vx, nearby)
+            for p in nearby:
+                if m.rect.colliderect(p):
+                    if m.vx > 0:
+                        m.rect.right = p.left
                     else:
-                        m["rect"].left = p.right
-                    m["vx"] *= -1
+                        m.rect.left = p.right
+                    m.vx *= -1
+
+            index.update(m, m.rect.left, m.rect.right)
 
     def update_dinos(self):
         """공룡 업데이트"""
         for d in self.dinos:
-            if not d["alive"]:
+            if not d.alive:
                 continue
 
-            if d["rider"]:
+            if d.rider:
                 # 탑승 중인 공룡의 위치 업데이트는 Player.apply_vertical_movement에서 수행됨
                 continue
 
             # 자유 이동 (자동차와 동일한 왔다 갔다 로직)
-            d["rect"].x += d["vx"]
-            if d["rect"].left < d["left"] or d["rect"].right > d["right"]:
-                d["vx"] *= -1
-                d["rect"].x += d["vx"]
+            d.rect.x += d.vx
+            if d.rect.left < d.left or d.rect.right > d.right:
+                d.vx *= -1
+                d.rect.x += d.vx
 
             # 플랫폼 위에 고정
             on_platform = False
-            for p in self.platforms:
-                if d["rect"].colliderect(p) and d["rect"].bottom <= p.top + 4:
-                    d["rect"].bottom = p.top
+            for p in self.platforms_near(
+                d.rect, max_layer=PLATFORM_STATIC, out=self._nearby
+            ):
+                if d.rect.colliderect(p) and d.rect.bottom <= p.top + 4:
+                    d.rect.bottom = p.top
                     on_platform = True
                     break
             if not on_platform:
-                d["rect"].bottom = min(d["rect"].bottom, GROUND_TOP_Y)
+                d.rect.bottom = min(d.rect.bottom, GROUND_TOP_Y)
 
     def update_cars(self):
         """자동차 업데이트"""
+        index = self.render_index["cars"]
         for car in self.cars:
-            if not car["alive"]:
+            if not car.alive:
                 continue
 
-            if car["rider"]:
+            if car.rider:
                 # 탑승 중인 자동차의 위치 업데이트는 Player.apply_vertical_movement에서 수행됨
+                index.update(car, car.rect.left, car.rect.right)
                 continue
 
             # 자유 이동 (왔다 갔다)
-            car["rect"].x += car["vx"]
-            if car["rect"].left < car["left"] or car["rect"].right > car["right"]:
-                car["vx"] *= -1
-                car["rect"].x += car["vx"]
+            car.rect.x += car.vx
+            if car.rect.left < car.left or car.rect.right > car.right:
+                car.vx *= -1
+                car.rect.x += car.vx
 
             # 플랫폼 위에 고정
             on_platform = False
-            for p in self.platforms:
-                if car["rect"].colliderect(p) and car["rect"].bottom <= p.top + 4:
-                    car["rect"].bottom = p.top
+            for p in self.platforms_near(
+                car.rect, max_layer=PLATFORM_STATIC, out=self._nearby
+            ):
+                if car.rect.colliderect(p) and car.rect.bottom <= p.top + 4:
+                    car.rect.bottom = p.top
                     on_platform = True
                     break
             if not on_platform:
-                car["rect"].bottom = min(car["rect"].bottom, GROUND_TOP_Y)
+                car.rect.bottom = min(car.rect.bottom, GROUND_TOP_Y)
+
+            index.update(car, car.rect.left, car.rect.right)
 
     def update_fireballs(self, score):
         """불똥 업데이트 및 충돌 처리"""
-        all_platforms = (
-            self.platforms
-            + [mp["rect"] for mp in self.moving_platforms]
-            + [vp["rect"] for vp in self.vertical_platforms]
-        )
-
         for fb in list(self.fireballs):
-            if not fb["alive"]:
+            if not fb.alive:
                 self.fireballs.remove(fb)
                 continue
 
-            fb["rect"].x += fb["vx"]
-            fb["ttl"] -= 1
+            fb.rect.x += fb.vx
+            fb.ttl -= 1
 
-            if fb["ttl"] <= 0:
-                fb["alive"] = False
+            if fb.ttl <= 0:
+                fb.alive = False
                 try:
                     self.fireballs.remove(fb)
                 except ValueError:
@@ -345,52 +837,34 @@ class EntityManager:
 
             # 벽 충돌
             hit_wall = False
-            for p in all_platforms:
-                if fb["rect"].colliderect(p):
+            for p in self.platforms_near(
+                fb.rect, max_layer=PLATFORM_MOVING, out=self._nearby
+            ):
+                if fb.rect.colliderect(p):
                     hit_wall = True
                     break
 
             if hit_wall:
-                fb["alive"] = False
+                fb.alive = False
                 try:
                     self.fireballs.remove(fb)
                 except ValueError:
                     pass
                 continue
 
-            # 적과 충돌
-            for e in self.enemies:
-                if e["alive"] and fb["rect"].colliderect(e["rect"]):
-                    e["alive"] = False
-                    score += 1
-                    fb["alive"] = False
-                    break
-
-            if fb["alive"]:
-                for f in self.fish_enemies:
-                    if f["alive"] and fb["rect"].colliderect(f["rect"]):
-                        f["alive"] = False
+            # 적과 충돌 (불똥이 걸친 청크 열의 적만 검사)
+            for name in FIREBALL_TARGETS:
+                targets = self.visible(name, fb.rect.left, fb.rect.right, self._targets)
+                for e in targets:
+                    if e.alive and fb.rect.colliderect(e.rect):
+                        e.alive = False
                         score += 1
-                        fb["alive"] = False
-                        break
-
-            if fb["alive"]:
-                for t in self.turtle_enemies:
-                    if t["alive"] and fb["rect"].colliderect(t["rect"]):
-                        t["alive"] = False
-                        score += 1
-                        fb["alive"] = False
-                        break
-
-            if fb["alive"]:
-                for j in self.jellies:
-                    if j["alive"] and fb["rect"].colliderect(j["rect"]):
-                        j["alive"] = False
-                        score += 1
-                        fb["alive"] = False
+                        fb.alive = False
                         break
+                if not fb.alive:
+                    break
 
-            if not fb["alive"]:
+            if not fb.alive:
                 try:
                     self.fireballs.remove(fb)
                 except ValueError:
@@ -399,50 +873,133 @@ class EntityManager:
         return score
 
     def cleanup_offscreen(self, despawn_x):
-        """화면 밖 엔티티 제거"""
-        self.platforms = [p for p in self.platforms if p.right > despawn_x]
-        self.moving_platforms = [
-            mp for mp in self.moving_platforms if mp["rect"].right > despawn_x
-        ]
-        self.vertical_platforms = [
-            vp for vp in self.vertical_platforms if vp["rect"].right > despawn_x
-        ]
-        self.fragile_platforms = [
-            fp
-            for fp in self.fragile_platforms
-            if fp["rect"].right > despawn_x and fp["rect"].width > 0
-        ]
-        self.enemies = [
-            e
-            for e in self.enemies
-            if e["rect"].right > despawn_x
-            and (e["alive"] or e["rect"].y < SCREEN_HEIGHT + 100)
-        ]
-        self.coins = [c for c in self.coins if c.right > despawn_x]
-        self.springs = [s for s in self.springs if s.right > despawn_x]
-        self.spikes = [g for g in self.spikes if g.right > despawn_x]
-        self.mushrooms = [
-            m for m in self.mushrooms if m["rect"].right > despawn_x and m["alive"]
-        ]
-        self.seas = [w for w in self.seas if w.right > despawn_x]
-        self.fish_enemies = [
-            f for f in self.fish_enemies if f["rect"].right > despawn_x and f["alive"]
-        ]
-        self.turtle_enemies = [
-            t for t in self.turtle_enemies if t["rect"].right > despawn_x and t["alive"]
-        ]
-        self.jellies = [
-            j for j in self.jellies if j["rect"].right > despawn_x and j["alive"]
-        ]
-        self.corals = [c for c in self.corals if c.right > despawn_x]
-        self.cars = [
-            car for car in self.cars if car["rect"].right > despawn_x and car["alive"]
-        ]
-        self.flags = [f for f in self.flags if f.right > despawn_x]
+        """
+        화면 밖 엔티티 제거
+
+        despawn_x가 청크 열 경계를 넘을 때만 그 왼쪽 열을 통째로 버립니다.
+        엔티티는 인덱스(render_index, platform_grid)의 청크 열 버킷에 들어
+        있으므로, 경계를 넘지 않은 프레임에는 할 일이 없고 경계를 넘으면
+        버리는 열에 든 엔티티 수만큼만 비용이 듭니다. 죽은 엔티티는 업데이트와
+        렌더링에서 건너뛰다가 자기 청크와 함께 버려집니다.
+
+        버린 열의 살아 있는 엔티티는 chunk_store에 보관하고, despawn_x가 다시
+        이미 버린 열로 돌아오면 그 열부터 되살립니다.
+
+        Args:
+            despawn_x: 이보다 완전히 왼쪽에 있는 청크 열을 버림
+        """
+        column = max(0, int(despawn_x // CHUNK_WIDTH))
+        if column > self.despawned_column:
+            self.despawned_column = column
+            self._store_columns(self.drop_columns(column), column)
+        elif column < self.despawned_column:
+            self.restore_columns(column)
+
+    def _store_columns(self, dropped, column):
+        """
+        drop_columns가 버린 엔티티를 청크 열별로 나눠 보관소에 넣습니다.
+        죽었거나 화면 아래로 떨어진 엔티티는 보관하지 않습니다.
+
+        Args:
+            dropped: 엔티티 리스트 속성 이름 -> 버린 항목 리스트
+            column: 버린 열의 경계 (보관하는 열은 모두 이보다 왼쪽)
+        """
+        columns = {}
+        for name, items in dropped.items():
+            span = _STORE_SPANS[name]
+            for obj in items:
+                if not getattr(obj, "alive", True):
+                    continue
+                if getattr(obj, "rect", obj).top > SCREEN_HEIGHT:
+                    continue
+                # 구간의 마지막 열에 보관 (버린 항목은 모두 column보다 왼쪽에서 끝남)
+                left, right = span(obj)
+                last = (max(right, left + 1) - 1) // CHUNK_WIDTH
+                columns.setdefault(last, {}).setdefault(name, []).append(obj)
+        for last, items in columns.items():
+            self.chunk_store.put(last, items)
+
+    def restore_columns(self, column):
+        """
+        column 열부터 이미 버린 열까지 보관소에 있는 엔티티를 되살립니다.
+
+        엔티티는 add_* 메서드로 다시 추가하므로 격자, 화면 컬링 인덱스,
+        지형 버전(렌더러 캐시)도 함께 갱신됩니다.
+
+        Args:
+            column: 되살린 뒤 남길 첫 열 번호
+        """
+        for c in range(column, self.despawned_column):
+            items = self.chunk_store.pop(c)
+            if not items:
+                continue
+            for name, objs in items.items():
+                add = getattr(self, _ADDERS[name])
+                for obj in objs:
+                    add(obj)
+        self.despawned_column = column
+
+    def drop_columns(self, column):
+        """
+        마지막 열이 column보다 왼쪽인 엔티티와 지형을 모두 버립니다.
+
+        Args:
+            column: 이 열부터는 남길 첫 열 번호
+
+        Returns:
+            dict: 엔티티 리스트 속성 이름 -> 버린 항목 리스트
+        """
+        dropped = {"platforms": self.platform_grid.drop_before(column)}
+        _remove_all(self.platforms, dropped["platforms"])
+
+        if self.patrols is not None:
+            dropped.update(self._despawn_patrols(column * CHUNK_WIDTH))
+            skip = {attr for attr, _ in _PATROL_LISTS}
+        else:
+            skip = ()
+        for name, index in self.render_index.items():
+            if name in skip:
+                continue
+            items = index.drop_before(column)
+            if not items:
+                continue
+            dropped[name] = items
+            _remove_all(getattr(self, name), items)
+            if name in _PLATFORM_KINDS:
+                for item in items:
+                    self.platform_grid.remove(item.rect)
+
+        # 버린 청크는 지형 버전도 버림
+        # (렌더러는 버전이 없는 청크의 지형 표면을 캐시에서 지웁니다)
+        for gone in [c for c in self.terrain_versions if c < column]:
+            del self.terrain_versions[gone]
+        return dropped
+
+    def _despawn_patrols(self, despawn_x):
+        """
+        NumPy 백엔드의 순찰형 엔티티 정리
+        (제거된 플랫폼은 격자에서, 모든 제거 항목은 화면 컬링 인덱스에서도 뺌)
+
+        Returns:
+            dict: 엔티티 리스트 속성 이름 -> 제거된 항목 리스트
+        """
+        patrols = self.patrols
+        dropped = {}
+        for attr, name in _PATROL_LISTS:
+            index = self.render_index[attr]
+            items = getattr(patrols, name).despawn(despawn_x)
+            for item in items:
+                index.remove(item)
+                if attr in _PLATFORM_KINDS:
+                    self.platform_grid.remove(item.rect)
+            if items:
+                dropped[attr] = items
+        return dropped
 
     def _is_in_water(self, rect):
-        """주어진 rect가 물속에 있는지 확인"""
-        for w in self.seas:
+        """주어진 rect가 물속에 있는지 확인 (rect가 걸친 청크 열의 바다만 검사)"""
+        seas = self.render_index["seas"].query(rect.left, rect.right, self._seas_near)
+        for w in seas:
             if rect.colliderect(w):
                 return w
         return None
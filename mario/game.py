@@ -10,61 +10,157 @@
 - level.py: 레벨 생성 및 관리
 - renderer.py: 렌더링
 - collision.py: 충돌 처리
+- headless.py: 창 없이 실행하기 위한 입력 소스와 시뮬레이션 시계
 """
 
+import argparse
+import math
+import os
 import pygame
+import random
 import sys
+import time
 
 from constants import *
 from player import Player
 from entities import EntityManager
 from level import LevelGenerator
 from renderer import Renderer
+from sprites import sprite_cache
 from collision import CollisionHandler
+from headless import ScriptedInput, SimulatedClock
+from profiler import Profiler
+from replay import (
+    InputRecorder,
+    Replay,
+    ReplayDivergence,
+    ReplayInput,
+    run_headless,
+)
+
+# 렌더링할 때 두 시뮬레이션 상태 사이를 보간하는 움직이는 엔티티 종류
+_INTERPOLATED = (
+    "moving_platforms",
+    "vertical_platforms",
+    "enemies",
+    "fish_enemies",
+    "turtle_enemies",
+    "jellies",
+    "mushrooms",
+    "cars",
+)
 
 
 class Game:
     """메인 게임 클래스"""
 
-    def __init__(self):
-        """게임 초기화"""
+    def __init__(
+        self,
+        headless=False,
+        input_source=None,
+        render=None,
+        seed=None,
+        patrol_backend=None,
+    ):
+        """
+        게임 초기화
+
+        Args:
+            headless: True면 창 없이(SDL dummy 드라이버) 시뮬레이션 시계로 실행
+            input_source: 키 상태를 반환하는 함수 (기본값: 키보드,
+                헤드리스에서는 아무 키도 누르지 않음)
+            render: 매 프레임 화면을 그릴지 여부 (기본값: 헤드리스가 아닐 때만)
+            seed: 월드 시드 (기본값: constants.WORLD_SEED, 그것도 None이면 새로 뽑음)
+            patrol_backend: 순찰형 엔티티 업데이트 방식 ("python" 또는 "numpy",
+                기본값: constants.PATROL_BACKEND)
+        """
+        self.headless = headless
+        if seed is None:
+            seed = WORLD_SEED
+        if seed is None:
+            seed = random.randrange(2**32)
+            print(f"World seed: {seed}")
+        self.seed = seed
+        if patrol_backend is None:
+            patrol_backend = PATROL_BACKEND
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = self._open_display(headless)
+        sprite_cache.convert()
         pygame.display.set_caption("작은 마리오 (2인용)")
-        self.clock = pygame.time.Clock()
+        if headless:
+            self.clock = SimulatedClock()
+            self.get_ticks = self.clock.get_ticks
+            self.input_source = input_source or ScriptedInput(lambda frame: ())
+        else:
+            self.clock = pygame.time.Clock()
+            self.get_ticks = pygame.time.get_ticks
+            self.input_source = input_source or pygame.key.get_pressed
+        self.render_enabled = not headless if render is None else render
 
         # 게임 컴포넌트 초기화
         # P1: 아이디 1, 초록색 (루이지 스타일)
         # P2: 아이디 2, 빨간색 (마리오 스타일)
         self.players = [Player(1, (0, 180, 0)), Player(2, (200, 0, 0))]
-        self.entity_manager = EntityManager()
-        self.level_generator = LevelGenerator(self.entity_manager)
+        self.entity_manager = EntityManager(patrol_backend, seed=self.seed)
+        self.level_generator = LevelGenerator(self.entity_manager, self.seed)
         self.renderer = Renderer(self.screen)
+        self.renderer.get_ticks = self.get_ticks
         self.collision_handler = CollisionHandler()
+        # 단계별 프레임 시간 오버레이 (켜져 있을 때만 측정)
+        self.profiler = Profiler()
+
+        # 플랫폼 충돌 후보를 담아 재사용하는 리스트
+        self._nearby_platforms = []
+        self._wall_platforms = []
 
         # 게임 상태
         self.camera_x = 0
         self.score = 0
         self.coins = 0
         self.time_left = 400
-        self.last_time_update = pygame.time.get_ticks()
+        self.sim_frame = 0  # 지금까지 진행한 시뮬레이션 스텝 수
+        self.last_time_update = self.sim_frame
         self.on_ground = False
         self.current_world = 1
 
+        # 고정 시간 간격 루프: 아직 시뮬레이션하지 않은 실제 시간(초)과
+        # 렌더링 보간의 시작점 (id(rect) -> (rect, x, y))
+        self.accumulator = 0.0
+        self._snapshot = {}
+        self._prev_camera_x = 0
+        self._prev_generation = None
+        self._visible = []
+
         # 초기 레벨 설정
         self.entity_manager.reset_to_initial_state()
 
+    @staticmethod
+    def _open_display(headless):
+        """
+        화면을 엽니다. 창이 있으면 수직 동기화를 요청하고, 드라이버가 지원하지
+        않으면 동기화 없이 엽니다 (그때도 Game.run이 RENDER_FPS로 프레임을 제한).
+        """
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if not headless:
+            try:
+                return pygame.display.set_mode(size, vsync=1)
+            except pygame.error:
+                pass
+        return pygame.display.set_mode(size)
+
     def reset_game(self):
         """게임을 처음 상태로 리셋"""
         for p in self.players:
             p.reset()
         self.entity_manager.reset_to_initial_state()
-        self.level_generator.reset()
+        self.level_generator.reset(self.current_world)
         self.camera_x = 0
         self.score = 0
         self.coins = 0
         self.time_left = 400
-        self.last_time_update = pygame.time.get_ticks()
+        self.last_time_update = self.sim_frame
 
     def complete_level(self):
         """레벨 클리어 처리"""
@@ -87,7 +183,7 @@ class Game:
 
         # 엔티티 및 레벨 리셋
         self.entity_manager.reset_to_initial_state()
-        self.level_generator.reset()
+        self.level_generator.reset(self.current_world)
 
         # 월드 길이를 늘리거나 난이도를 높이는 등의 추가 설정 가능
         global WORLD_LENGTH
@@ -95,7 +191,7 @@ class Game:
 
         self.camera_x = 0
         self.time_left = 400
-        self.last_time_update = pygame.time.get_ticks()
+        self.last_time_update = self.sim_frame
 
     def handle_collisions(self):
         """모든 충돌 처리 (모든 플레이어에 대해 수행)"""
@@ -142,7 +238,7 @@ class Game:
         Returns:
             list: 각 플레이어의 입력 튜플 리스트 [(move_dir, jump_down, jump_pressed, fire_pressed, dismount_pressed), ...]
         """
-        keys = pygame.key.get_pressed()
+        keys = self.input_source()
         inputs = []
 
         # P1 Controls (Arrows, Space/Up, Shift, Down for dismount)
@@ -197,8 +293,6 @@ class Game:
 
     def update_players(self, inputs, keys):
         """모든 플레이어 업데이트"""
-        all_platforms = self.entity_manager.get_all_platforms()
-
         for i, player in enumerate(self.players):
             move_dir, jump_down, jump_pressed, fire_pressed, dismount_pressed = inputs[
                 i
@@ -221,8 +315,19 @@ class Game:
             )
             in_water = current_sea is not None
 
+            # 주변 플랫폼 후보 (탑승 중이면 자동차까지 포함, 이번 가로 이동량만큼 넓힘)
+            body = player.rect
+            if player.on_car and player.current_car:
+                body = body.union(player.current_car.rect)
+            reach = abs(player.horizontal_move(move_dir))
+            nearby = self.entity_manager.platforms_near(
+                body,
+                margin=max(PLATFORM_QUERY_MARGIN, math.ceil(reach)),
+                out=self._nearby_platforms,
+            )
+
             # 가로 이동
-            player.apply_horizontal_movement(move_dir, all_platforms)
+            player.apply_horizontal_movement(move_dir, nearby)
 
             # 움직이는 플랫폼 위에서 같이 이동
             self._handle_moving_platform_movement(player)
@@ -237,9 +342,7 @@ class Game:
                 player.rect.y += int(player.velocity_y)
             else:
                 # ground check는 loop 안에서 지역적으로 수행
-                on_ground = player.apply_vertical_movement(
-                    all_platforms, False, jump_down
-                )
+                on_ground = player.apply_vertical_movement(nearby, False, jump_down)
 
             # 점프 처리
             player.handle_jump(jump_pressed, on_ground)
@@ -256,16 +359,18 @@ class Game:
         """움직이는 플랫폼 위에서 플레이어를 같이 이동"""
         for mp in self.entity_manager.moving_platforms:
             if (
-                abs(player.rect.bottom - mp["rect"].top) <= 1
-                and player.rect.right > mp["rect"].left
-                and player.rect.left < mp["rect"].right
+                abs(player.rect.bottom - mp.rect.top) <= 1
+                and player.rect.right > mp.rect.left
+                and player.rect.left < mp.rect.right
             ):
-                player.rect.x += mp["vx"]
+                player.rect.x += mp.vx
 
                 # 벽 충돌 방지
-                for p in self.entity_manager.get_all_platforms():
+                for p in self.entity_manager.platforms_near(
+                    player.rect, out=self._wall_platforms
+                ):
                     if player.rect.colliderect(p):
-                        if mp["vx"] > 0:
+                        if mp.vx > 0:
                             player.rect.right = p.left
                         else:
                             player.rect.left = p.right
@@ -274,11 +379,11 @@ class Game:
         """수직 플랫폼 위에서 플레이어를 같이 이동"""
         for vp in self.entity_manager.vertical_platforms:
             if (
-                abs(player.rect.bottom - vp["rect"].top) <= 1
-                and player.rect.right > vp["rect"].left
-                and player.rect.left < vp["rect"].right
+                abs(player.rect.bottom - vp.rect.top) <= 1
+                and player.rect.right > vp.rect.left
+                and player.rect.left < vp.rect.right
             ):
-                player.rect.y += vp["vy"]
+                player.rect.y += vp.vy
 
     def handle_fireball_shooting(self, inputs):
         """불똥 발사 처리"""
@@ -287,6 +392,10 @@ class Game:
 
     def update_entities(self):
         """모든 엔티티 업데이트"""
+        self.entity_manager.set_active_window(
+            self.camera_x - PATROL_ACTIVE_MARGIN,
+            self.camera_x + SCREEN_WIDTH + PATROL_ACTIVE_MARGIN,
+        )
         self.entity_manager.update_moving_platforms()
         self.entity_manager.update_vertical_platforms()
         self.entity_manager.update_enemies()
@@ -298,56 +407,78 @@ class Game:
         self.score = self.entity_manager.update_fireballs(self.score)
 
     def handle_collisions(self):
-        """모든 충돌 처리 (모든 플레이어에 대해 수행)"""
+        """
+        모든 충돌 처리 (모든 플레이어에 대해 수행)
+
+        플레이어(와 탑승 중인 자동차)가 걸친 청크 열의 충돌 대상을 종류별로
+        한 번에 모은 뒤(broad phase) 종류별 검사 함수에 후보만 넘깁니다.
+        """
+        entity_manager = self.entity_manager
+        handler = self.collision_handler
+        generation = entity_manager.generation
         for player in self.players:
+            left, right = player.rect.left, player.rect.right
+            if player.on_car and player.current_car:
+                left = min(left, player.current_car.rect.left)
+                right = max(right, player.current_car.rect.right)
+            near = entity_manager.collision_candidates(left, right)
+
             # 깃발(Finish Line) 충돌
-            if self.collision_handler.check_flag_collision(
-                player, self.entity_manager.flags
-            ):
+            if handler.check_flag_collision(player, near["flags"]):
                 self.complete_level()
                 return
 
+            # 아래 검사가 게임을 리셋하면 모아 둔 후보는 이전 월드의 것이므로
+            # 곧바로 중단 (리셋 전에 얻은 점수도 더하지 않음)
+
             # 적과 충돌
-            self.score += self.collision_handler.check_enemy_collision(
-                player, self.entity_manager.enemies, self.reset_game
+            score = handler.check_enemy_collision(
+                player, near["enemies"], self.reset_game
             )
+            if entity_manager.generation != generation:
+                return
+            self.score += score
 
             # 물고기와 충돌
-            self.score += self.collision_handler.check_water_enemy_collision(
-                player, self.entity_manager.fish_enemies, self.reset_game
+            score = handler.check_water_enemy_collision(
+                player, near["fish_enemies"], self.reset_game
             )
+            if entity_manager.generation != generation:
+                return
+            self.score += score
 
             # 거북이와 충돌
-            self.score += self.collision_handler.check_water_enemy_collision(
-                player, self.entity_manager.turtle_enemies, self.reset_game
+            score = handler.check_water_enemy_collision(
+                player, near["turtle_enemies"], self.reset_game
             )
+            if entity_manager.generation != generation:
+                return
+            self.score += score
 
             # 해파리와 충돌
-            self.collision_handler.check_jelly_collision(
-                player, self.entity_manager.jellies, self.reset_game
-            )
+            handler.check_jelly_collision(player, near["jellies"], self.reset_game)
+            if entity_manager.generation != generation:
+                return
 
             # 동전과 충돌
-            coins_collected = self.collision_handler.check_coin_collision(
-                player, self.entity_manager.coins
+            coins_collected = handler.check_coin_collision(
+                player, near["coins"], entity_manager.remove_coins
             )
             self.score += coins_collected * 200
             self.coins += coins_collected
 
             # 스프링과 충돌
-            self.collision_handler.check_spring_collision(
-                player, self.entity_manager.springs
-            )
+            handler.check_spring_collision(player, near["springs"])
 
             # 버섯과 충돌
-            self.collision_handler.check_mushroom_collision(
-                player, self.entity_manager.mushrooms
+            handler.check_mushroom_collision(
+                player, near["mushrooms"], entity_manager.remove_mushrooms
             )
 
             # 가시와 충돌
-            self.collision_handler.check_spike_collision(
-                player, self.entity_manager.spikes, self.reset_game
-            )
+            handler.check_spike_collision(player, near["spikes"], self.reset_game)
+            if entity_manager.generation != generation:
+                return
 
     def update_camera(self):
         """카메라 업데이트 (플레이어들의 중간 지점)"""
@@ -365,8 +496,9 @@ class Game:
             self.level_generator.generate_next_chunk()
 
     def cleanup_offscreen(self):
-        """화면 밖 엔티티 제거"""
-        despawn_x = self.camera_x - 400
+        """화면 밖 엔티티 제거 (뒤처진 플레이어 주변은 남김)"""
+        left = min(p.rect.left for p in self.players)
+        despawn_x = min(self.camera_x, left) - 400
         self.entity_manager.cleanup_offscreen(despawn_x)
 
     def check_fall_off(self):
@@ -389,73 +521,235 @@ class Game:
                 break
 
     def run(self):
-        """게임 메인 루프"""
+        """
+        게임 메인 루프
+
+        시뮬레이션은 1/FPS초 고정 간격으로 진행하고, 렌더링은 RENDER_FPS(보통
+        모니터 주사율, 0이면 제한 없음)만큼 자주 하면서 두 시뮬레이션 상태
+        사이를 보간해서 그립니다. 상한이 있어야 clock.tick이 남는 시간을 쉬므로
+        CPU 코어 하나를 계속 돌리지 않습니다.
+        """
         running = True
+        previous = time.perf_counter()
         while running:
             # 이벤트 처리
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_F3:
+                        self.profiler.toggle(self)
+                    elif event.key == pygame.K_F4 and self.profiler.capture:
+                        print(f"Profile saved: {self.profiler.dump()}")
 
-            # 입력 처리
-            inputs, keys = self.handle_input()
-
-            # 플레이어 업데이트
-            self.update_players(inputs, keys)
-
-            # 불똥 발사
-            self.handle_fireball_shooting(inputs)
-
-            # 엔티티 업데이트
-            self.update_entities()
-
-            # 충돌 처리
-            self.handle_collisions()
-
-            # 카메라 업데이트
-            self.update_camera()
-
-            # 레벨 생성
-            self.generate_level()
-
-            # 화면 밖 정리
-            self.cleanup_offscreen()
-
-            # 낙사 체크
-            self.check_fall_off()
-
-            # 시간 업데이트
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_time_update > 1000:  # 1초마다
-                self.time_left -= 1
-                self.last_time_update = current_time
-                if self.time_left <= 0:
-                    # 모든 플레이어 데미지
-                    for p in self.players:
-                        p.take_damage()
-                    # 일단 한명이라도 죽으면 리셋
-                    if any(p.health <= 0 for p in self.players):
-                        self.reset_game()
-
-            # 렌더링
-            self.renderer.render_all(
-                self.entity_manager,
-                self.players,
-                self.camera_x,
-                self.score,
-                self.coins,
-                self.time_left,
-                self.current_world,
-            )
+            now = time.perf_counter()
+            self.update_frame(now - previous)
+            previous = now
 
             # 화면 업데이트
-            pygame.display.flip()
-            self.clock.tick(60)
+            self.renderer.present()
+            self.clock.tick(RENDER_FPS)
 
         pygame.quit()
         sys.exit()
 
+    def step(self, frames=1):
+        """
+        frames 프레임을 기다리지 않고 진행합니다 (봇, 테스트, 벤치마크용).
+
+        헤드리스 모드에서는 시뮬레이션 시계가 프레임마다 1/FPS초씩 흐르므로
+        실제 시간과 상관없이 같은 입력이면 같은 게임 시간이 지납니다.
+
+        Args:
+            frames: 진행할 프레임 수
+        """
+        for _ in range(frames):
+            if not self.headless:
+                pygame.event.pump()
+            self.update_frame()
+            if self.headless:
+                self.clock.tick(FPS)
+
+    def update_frame(self, elapsed=None):
+        """
+        시뮬레이션을 진행하고 (켜져 있으면) 화면을 그립니다.
+
+        Args:
+            elapsed: 지난 호출 뒤로 흐른 실제 시간(초). None이면 시뮬레이션을
+                정확히 한 스텝 진행하고 보간 없이 그립니다 (step, 벤치마크용).
+                값이 있으면 누적된 시간만큼 고정 간격 스텝을 진행하되(최대
+                MAX_CATCH_UP_STEPS), 남은 시간 비율만큼 보간해서 그립니다.
+        """
+        if elapsed is None:
+            self.simulate_step()
+            alpha = 1.0
+        else:
+            self.accumulator += elapsed
+            steps = 0
+            while self.accumulator >= SIMULATION_DT and steps < MAX_CATCH_UP_STEPS:
+                # 마지막 스텝 직전 상태를 보간 시작점으로 기억
+                if self.accumulator < SIMULATION_DT * 2 or (
+                    steps == MAX_CATCH_UP_STEPS - 1
+                ):
+                    self._snapshot_positions()
+                self.simulate_step()
+                self.accumulator -= SIMULATION_DT
+                steps += 1
+            if self.accumulator >= SIMULATION_DT:
+                # 따라잡지 못한 시간은 버림 (느려질지언정 멈추지 않도록)
+                self.accumulator %= SIMULATION_DT
+            alpha = self.accumulator / SIMULATION_DT
+
+        # 렌더링 (헤드리스에서는 기본으로 건너뜀)
+        if self.render_enabled:
+            self.render_frame(alpha)
+
+    def simulate_step(self):
+        """입력, 업데이트, 충돌, 정리를 고정 간격 한 스텝(1/FPS초)만큼 진행합니다"""
+        # 입력 처리
+        inputs, keys = self.handle_input()
+
+        # 플레이어 업데이트
+        self.update_players(inputs, keys)
+
+        # 불똥 발사
+        self.handle_fireball_shooting(inputs)
+
+        # 엔티티 업데이트
+        self.update_entities()
+
+        # 충돌 처리
+        self.handle_collisions()
+
+        # 카메라 업데이트
+        self.update_camera()
+
+        # 레벨 생성
+        self.generate_level()
+
+        # 화면 밖 정리
+        self.cleanup_offscreen()
+
+        # 낙사 체크
+        self.check_fall_off()
+
+        # 시간 업데이트 (시뮬레이션 FPS 스텝 = 게임 시간 1초)
+        self.sim_frame += 1
+        if self.sim_frame - self.last_time_update >= FPS:
+            self.time_left -= 1
+            self.last_time_update = self.sim_frame
+            if self.time_left <= 0:
+                # 모든 플레이어 데미지
+                for p in self.players:
+                    p.take_damage()
+                # 일단 한명이라도 죽으면 리셋
+                if any(p.health <= 0 for p in self.players):
+                    self.reset_game()
+
+    def _snapshot_positions(self):
+        """
+        보간 시작점으로 쓸 카메라와 화면 주변 움직이는 물체의 위치를 기억합니다.
+        """
+        self._prev_camera_x = self.camera_x
+        self._prev_generation = self.entity_manager.generation
+        snapshot = self._snapshot
+        snapshot.clear()
+        for p in self.players:
+            snapshot[id(p.rect)] = (p.rect, p.rect.x, p.rect.y)
+        left = self.camera_x - INTERPOLATION_MAX_JUMP
+        right = self.camera_x + SCREEN_WIDTH + INTERPOLATION_MAX_JUMP
+        for name in _INTERPOLATED:
+            for obj in self.entity_manager.visible(name, left, right, self._visible):
+                rect = obj.rect
+                snapshot[id(rect)] = (rect, rect.x, rect.y)
+
+    def render_frame(self, alpha=1.0):
+        """
+        화면을 그립니다.
+
+        Args:
+            alpha: 직전 시뮬레이션 상태(0)와 현재 상태(1) 사이 보간 비율
+        """
+        camera_x = self.camera_x
+        moved = []
+        if alpha < 1.0 and self._prev_generation == self.entity_manager.generation:
+            camera_x = self._prev_camera_x + (camera_x - self._prev_camera_x) * alpha
+            # 그리는 동안만 보간 위치로 옮겼다가 되돌림
+            for rect, x, y in self._snapshot.values():
+                cur_x, cur_y = rect.x, rect.y
+                if (
+                    abs(cur_x - x) > INTERPOLATION_MAX_JUMP
+                    or abs(cur_y - y) > INTERPOLATION_MAX_JUMP
+                ):
+                    continue  # 순간이동(리스폰 등)은 보간하지 않음
+                rect.x = round(x + (cur_x - x) * alpha)
+                rect.y = round(y + (cur_y - y) * alpha)
+                moved.append((rect, cur_x, cur_y))
+
+        self.renderer.render_all(
+            self.entity_manager,
+            self.players,
+            camera_x,
+            self.score,
+            self.coins,
+            self.time_left,
+            self.current_world,
+        )
+
+        for rect, x, y in moved:
+            rect.x = x
+            rect.y = y
+
+
+def main():
+    """명령줄 인자에 따라 게임을 실행하거나 입력을 기록/재생합니다"""
+    parser = argparse.ArgumentParser(description="작은 마리오 (2인용)")
+    parser.add_argument("--record", metavar="PATH", help="플레이 입력을 기록할 파일")
+    parser.add_argument("--replay", metavar="PATH", help="재생할 기록 파일")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="--replay를 화면 없이 최대 속도로 재생하며 검증",
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+        game = Game(headless=args.headless, seed=replay.seed)
+        if args.headless:
+            try:
+                result = run_headless(game, replay)
+            except ReplayDivergence as e:
+                print(f"Replay diverged at step {e.frame}")
+                sys.exit(1)
+            print(f"Replay OK: {len(replay)} steps, {result.verified} hashes matched")
+            return
+        source = ReplayInput(game, replay, strict=False)
+        game.input_source = source
+        try:
+            game.run()
+        finally:
+            if source.diverged_at is not None:
+                print(f"Replay diverged at step {source.diverged_at}")
+            elif source.finished:
+                print(
+                    f"Replay OK: {len(replay)} steps, "
+                    f"{source.verified} hashes matched"
+                )
+        return
 
-if __name__ == "__main__":
     game = Game()
-    game.run()
+    if not args.record:
+        game.run()
+        return
+    recorder = InputRecorder(game, game.input_source)
+    game.input_source = recorder
+    try:
+        game.run()
+    finally:
+        recorder.save(args.record)
+        print(f"Recorded {recorder.frame} steps: {args.record}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+화면 없이 게임을 돌리기 위한 입력 소스와 시뮬레이션 시계 (헤드리스 모드)
+
+Game(headless=True)는 SDL dummy 비디오 드라이버로 창 없이 실행되고, 키보드와
+실제 시계 대신 여기의 입력 소스와 SimulatedClock을 사용합니다. Game.step(n)은
+고정 시간 간격(1/FPS초)으로 n 프레임을 기다리지 않고 진행합니다.
+
+    script = ScriptedInput(lambda frame: {pygame.K_RIGHT, pygame.K_d})
+    game = Game(headless=True, input_source=script)
+    game.step(600)  # 게임 시간 10초
+"""
+
+from constants import FPS
+
+
+class KeyState:
+    """pygame.key.get_pressed() 결과처럼 키 상수로 인덱싱하는 눌린 키 집합"""
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        """
+        Args:
+            pressed: 눌린 키 상수들 (예: {pygame.K_RIGHT, pygame.K_SPACE})
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """프레임 번호로 눌린 키를 정하는 입력 소스"""
+
+    def __init__(self, script):
+        """
+        Args:
+            script: 프레임 번호(0부터) -> 눌린 키 상수들을 반환하는 함수
+        """
+        self.script = script
+        self.frame = 0
+
+    def __call__(self):
+        """이번 프레임의 키 상태를 반환하고 다음 프레임으로 넘어갑니다"""
+        keys = KeyState(self.script(self.frame))
+        self.frame += 1
+        return keys
+
+
+class SimulatedClock:
+    """
+    pygame.time.Clock과 pygame.time.get_ticks 대신 쓰는 시뮬레이션 시계
+
+    tick()은 실제로 기다리지 않고 시간을 한 프레임만큼만 흘려보냅니다.
+    """
+
+    def __init__(self, fps=FPS):
+        """
+        Args:
+            fps: 초당 프레임 수 (한 프레임 = 1000 / fps 밀리초)
+        """
+        self.frame_ms = 1000 / fps
+        self.elapsed_ms = 0.0
+
+    def get_ticks(self):
+        """시작 후 흐른 시뮬레이션 시간 (밀리초, 정수)"""
+        return int(self.elapsed_ms)
+
+    def tick(self, framerate=0):
+        """
+        한 프레임만큼 시간을 진행합니다 (pygame.time.Clock.tick과 같은 모양).
+
+        Returns:
+            int: 이번 프레임에 흐른 밀리초
+        """
+        self.elapsed_ms += self.frame_ms
+        return int(self.frame_ms)
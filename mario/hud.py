@@ -0,0 +1,159 @@
+"""
+HUD(점수, 동전, 월드, 시간, 체력 하트) 표면 캐시
+
+라벨("MARIO", "COINS" 등)과 하트는 처음 한 번만 그리고, 값 글자는 값이 바뀐
+것만 font.render로 다시 만듭니다. 이것들을 패널(글자 패널, 플레이어별 하트
+패널) 표면에 합성해 두었다가, 아무것도 바뀌지 않은 프레임에는 screen.blits
+한 번으로 패널을 붙이기만 합니다. 패널은 대부분 투명하므로 RLE로 압축해 두어
+붙일 때 투명한 부분을 건너뜁니다.
+"""
+
+import pygame
+
+from constants import *
+from sprites import make_heart_sprite
+
+_TEXT_COLOR = (255, 255, 255)
+
+# 라벨 글자와 X 좌표 (라벨은 y=10, 값은 y=35)
+_LABELS = (("MARIO", 50), ("COINS", 250), ("WORLD", 450), ("TIME", 650))
+_LABEL_Y = 10
+_VALUE_Y = 35
+
+# 값 이름 -> 값 글자 X 좌표
+_VALUE_X = {"score": 50, "coins": 250, "world": 460, "time": 660}
+
+# 하트 패널 (P1은 화면 오른쪽, P2는 왼쪽, 하트 중심 기준)
+_HEART_Y = 100
+_HEART_SPACING = 40
+_HEART_SIZE = 24
+
+
+def _heart_start_x(player_index):
+    """플레이어 순서(0: P1, 1: P2)의 첫 하트 중심 X"""
+    return SCREEN_WIDTH - 150 if player_index == 0 else 30
+
+
+def _panel(items):
+    """
+    (표면, 화면 위치) 목록을 감싸는 크기의 패널 표면에 합성합니다.
+
+    Returns:
+        tuple: (패널 표면, 패널의 화면 위치)
+    """
+    bounds = pygame.Rect(items[0][1], items[0][0].get_size())
+    for surface, pos in items[1:]:
+        bounds.union_ip(pygame.Rect(pos, surface.get_size()))
+    panel = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for surface, (x, y) in items:
+        # 투명한 패널에 알파 블렌딩으로 붙이면 가장자리 색이 한 번 더 어두워지므로
+        # 픽셀을 그대로 옮김 (겹치는 곳은 더 밝은 쪽)
+        panel.blit(
+            surface, (x - bounds.x, y - bounds.y), special_flags=pygame.BLEND_RGBA_MAX
+        )
+    if pygame.display.get_surface() is not None:
+        panel = panel.convert_alpha()
+    panel.set_alpha(255, pygame.RLEACCEL)
+    return panel, bounds.topleft
+
+
+class Hud:
+    """값이 바뀐 부분만 다시 그리는 HUD 캐시"""
+
+    def __init__(self, font, label_font):
+        """
+        Args:
+            font: 값 글자 글꼴
+            label_font: 라벨 글꼴
+        """
+        self.font = font
+        self._labels = [
+            (label_font.render(text, True, _TEXT_COLOR), (x, _LABEL_Y))
+            for text, x in _LABELS
+        ]
+        # 값 이름 -> (글자, 표면)
+        self._values = {}
+        self._hearts = {filled: make_heart_sprite(filled) for filled in (True, False)}
+        if pygame.display.get_surface() is not None:
+            self._hearts = {k: s.convert_alpha() for k, s in self._hearts.items()}
+
+        # 마지막으로 합성한 값 글자와 체력 (바뀐 것이 없으면 다시 합성하지 않음)
+        self._texts = None
+        self._healths = ()
+        self._text_panel = None
+        self._heart_panels = []
+        # screen.blits에 넘기는 (패널, 위치) 목록
+        self._panels = []
+        # font.render를 부른 횟수 (라벨 제외, 벤치마크용)
+        self.renders = 0
+
+    def _value_surface(self, name, text):
+        """값 글자 표면 (글자가 바뀌었을 때만 다시 render)"""
+        cached = self._values.get(name)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surface = self.font.render(text, True, _TEXT_COLOR)
+        self.renders += 1
+        self._values[name] = (text, surface)
+        return surface
+
+    def _heart_panel(self, player_index, health):
+        """한 플레이어의 하트 MAX_HEALTH개를 합성한 패널"""
+        start_x = _heart_start_x(player_index)
+        half = _HEART_SIZE // 2
+        items = [
+            (
+                self._hearts[i < health],
+                (start_x + i * _HEART_SPACING - half, _HEART_Y - half),
+            )
+            for i in range(MAX_HEALTH)
+        ]
+        return _panel(items)
+
+    def draw(self, screen, score, coins, time_left, players, current_world=1):
+        """
+        HUD를 그립니다 (바뀐 값이 있을 때만 패널을 다시 합성).
+
+        Args:
+            screen: 그릴 화면
+            score: 점수
+            coins: 동전 수
+            time_left: 남은 시간
+            players: 플레이어 리스트 (앞의 두 명까지 체력 표시)
+            current_world: 현재 월드 번호
+
+        Returns:
+            list[pygame.Rect]: 그린 화면 영역
+        """
+        texts = (
+            f"{score:06d}",
+            f"x {coins:02d}",
+            f"{current_world}-1",
+            f"{max(0, int(time_left)):03d}",
+        )
+        healths = tuple(p.health for p in players[:2])
+        if texts != self._texts or healths != self._healths:
+            self._compose(texts, healths)
+        return screen.blits(self._panels)
+
+    def _compose(self, texts, healths):
+        """바뀐 부분의 패널만 다시 합성합니다"""
+        if texts != self._texts:
+            items = list(self._labels)
+            for (name, x), text in zip(_VALUE_X.items(), texts):
+                items.append((self._value_surface(name, text), (x, _VALUE_Y)))
+            self._text_panel = _panel(items)
+            self._texts = texts
+        if healths != self._healths:
+            old = self._healths
+            panels = self._heart_panels[: len(healths)]
+            for i, health in enumerate(healths):
+                if i >= len(old) or old[i] != health:
+                    panel = self._heart_panel(i, health)
+                    if i < len(panels):
+                        panels[i] = panel
+                    else:
+                        panels.append(panel)
+            self._heart_panels = panels
+            self._healths = healths
+        self._panels = [self._text_panel, *self._heart_panels]
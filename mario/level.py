@@ -6,29 +6,65 @@ import pygame
 import random
 import math
 from constants import *
+from models import (
+    Car,
+    Enemy,
+    FishEnemy,
+    FragilePlatform,
+    Jelly,
+    Mushroom,
+    MovingPlatform,
+    TurtleEnemy,
+    VerticalPlatform,
+)
 
 
 class LevelGenerator:
     """레벨을 생성하고 관리하는 클래스"""
 
-    def __init__(self, entity_manager):
+    def __init__(self, entity_manager, seed=0):
         """
         레벨 생성기 초기화
 
         Args:
             entity_manager: 엔티티 매니저 인스턴스
+            seed: 월드 시드 (같은 시드면 같은 맵이 생성됨)
         """
         self.entity_manager = entity_manager
+        self.seed = seed
+        self.world = 1
         self.generated_until_x = INITIAL_GENERATED_X
         self.biome_type = "land"  # "land" 또는 "sea"
         self.biome_chunks_remaining = 4
 
-    def reset(self):
-        """레벨 생성기를 초기 상태로 리셋"""
+    def reset(self, world=1):
+        """
+        레벨 생성기를 초기 상태로 리셋
+
+        Args:
+            world: 생성할 월드 번호 (월드마다 다른 맵이 나오도록 시드에 섞음)
+        """
+        self.world = world
         self.generated_until_x = INITIAL_GENERATED_X
         self.biome_type = "land"
         self.biome_chunks_remaining = 4
 
+    def chunk_rng(self, start_x):
+        """
+        구간마다 독립된 난수 생성기를 만듭니다.
+
+        월드 시드, 월드 번호, 구간 번호(start_x // CHUNK_WIDTH)로만 정해지므로
+        다른 구간을 몇 개 생성했는지나 게임 중 다른 난수 사용과 관계없이
+        같은 구간은 항상 같은 모습으로 생성됩니다.
+
+        Args:
+            start_x: 구간 시작 X 좌표
+
+        Returns:
+            random.Random: 이 구간 전용 난수 생성기
+        """
+        return random.Random(f"{self.seed}:{self.world}:{start_x // CHUNK_WIDTH}")
+
     def spawn_chunk(self, start_x, width):
         """
         새로운 레벨 구간을 생성합니다.
@@ -37,140 +73,133 @@ class LevelGenerator:
             start_x: 시작 X 좌표
             width: 구간의 너비
         """
+        rng = self.chunk_rng(start_x)
         chunk_plats = []
 
         # 바닥 생성
         ground = pygame.Rect(start_x, GROUND_TOP_Y, width, GROUND_THICKNESS)
-        self.entity_manager.platforms.append(ground)
+        self.entity_manager.add_platform(ground)
         chunk_plats.append(ground)
 
         # 공중 플랫폼 생성
-        for _ in range(random.randint(2, 4)):
-            w = random.randint(100, 160)
-            x = random.randint(start_x + 80, start_x + width - w - 80)
-            y = random.randint(240, 360)
+        for _ in range(rng.randint(2, 4)):
+            w = rng.randint(100, 160)
+            x = rng.randint(start_x + 80, start_x + width - w - 80)
+            y = rng.randint(240, 360)
             plat = pygame.Rect(x, y, w, 20)
-            self.entity_manager.platforms.append(plat)
+            self.entity_manager.add_platform(plat)
             chunk_plats.append(plat)
 
             # 동전 생성
-            if random.random() < 0.7:
+            if rng.random() < 0.7:
                 coin = pygame.Rect(x + w // 2 - 8, y - 30, 16, 16)
-                self.entity_manager.coins.append(coin)
+                self.entity_manager.add_coin(coin)
 
         # 움직이는 플랫폼 생성
-        if random.random() < 0.6:
+        if rng.random() < 0.6:
             left = start_x + 120
             right = start_x + width - 120
-            w = random.randint(90, 130)
-            x = random.randint(left, right - w)
-            y = random.randint(240, 340)
-            moving_plat = {
-                "rect": pygame.Rect(x, y, w, 20),
-                "vx": random.choice([-2, 2]),
-                "left": left,
-                "right": right,
-            }
-            self.entity_manager.moving_platforms.append(moving_plat)
+            w = rng.randint(90, 130)
+            x = rng.randint(left, right - w)
+            y = rng.randint(240, 340)
+            moving_plat = MovingPlatform(
+                rect=pygame.Rect(x, y, w, 20),
+                vx=rng.choice([-2, 2]),
+                left=left,
+                right=right,
+            )
+            self.entity_manager.add_moving_platform(moving_plat)
 
         # 수직 플랫폼 생성
-        if random.random() < 0.5:
-            top = random.randint(220, 260)
-            bottom = random.randint(320, 380)
-            x = random.randint(start_x + 140, start_x + width - 240)
-            w = random.randint(90, 120)
-            vertical_plat = {
-                "rect": pygame.Rect(x, (top + bottom) // 2, w, 20),
-                "vy": random.choice([-2, 2]),
-                "top": top,
-                "bottom": bottom,
-            }
-            self.entity_manager.vertical_platforms.append(vertical_plat)
+        if rng.random() < 0.5:
+            top = rng.randint(220, 260)
+            bottom = rng.randint(320, 380)
+            x = rng.randint(start_x + 140, start_x + width - 240)
+            w = rng.randint(90, 120)
+            vertical_plat = VerticalPlatform(
+                rect=pygame.Rect(x, (top + bottom) // 2, w, 20),
+                vy=rng.choice([-2, 2]),
+                top=top,
+                bottom=bottom,
+            )
+            self.entity_manager.add_vertical_platform(vertical_plat)
 
         # 적 생성
-        for _ in range(random.randint(1, 2)):
-            base = random.choice(chunk_plats)
-            ex = random.randint(base.left + 10, base.right - 38)
+        for _ in range(rng.randint(1, 2)):
+            base = rng.choice(chunk_plats)
+            ex = rng.randint(base.left + 10, base.right - 38)
             ey = base.top - 28
 
-            if random.random() < 0.4:  # 점프하는 적
-                enemy = {
-                    "rect": pygame.Rect(ex, ey, 28, 28),
-                    "vx": random.choice([-2, 2]),
-                    "vy": 0,
-                    "alive": True,
-                    "kind": "hopper",
-                    "jump_cd": random.randint(40, 80),
-                }
+            if rng.random() < 0.4:  # 점프하는 적
+                enemy = Enemy(
+                    rect=pygame.Rect(ex, ey, 28, 28),
+                    vx=rng.choice([-2, 2]),
+                    kind="hopper",
+                    jump_cd=rng.randint(40, 80),
+                )
             else:  # 걷는 적
-                enemy = {
-                    "rect": pygame.Rect(ex, ey, 28, 28),
-                    "vx": random.choice([-2, 2]),
-                    "vy": 0,
-                    "alive": True,
-                }
-            self.entity_manager.enemies.append(enemy)
+                enemy = Enemy(
+                    rect=pygame.Rect(ex, ey, 28, 28),
+                    vx=rng.choice([-2, 2]),
+                )
+            self.entity_manager.add_enemy(enemy)
 
         # 부서지는 플랫폼 생성
-        if random.random() < 0.5:
-            w = random.randint(90, 140)
-            x = random.randint(start_x + 120, start_x + width - w - 120)
-            y = random.randint(260, 340)
-            fragile_plat = {"rect": pygame.Rect(x, y, w, 18), "timer": -1}
-            self.entity_manager.fragile_platforms.append(fragile_plat)
+        if rng.random() < 0.5:
+            w = rng.randint(90, 140)
+            x = rng.randint(start_x + 120, start_x + width - w - 120)
+            y = rng.randint(260, 340)
+            fragile_plat = FragilePlatform(rect=pygame.Rect(x, y, w, 18))
+            self.entity_manager.add_fragile_platform(fragile_plat)
 
         # 스프링 생성
-        if random.random() < 0.6:
-            sx = random.randint(start_x + 130, start_x + width - 130)
+        if rng.random() < 0.6:
+            sx = rng.randint(start_x + 130, start_x + width - 130)
             spring = pygame.Rect(sx, ground.top - 18, 26, 18)
-            self.entity_manager.springs.append(spring)
+            self.entity_manager.add_spring(spring)
 
         # 가시 생성
-        if random.random() < 0.6:
-            gx = random.randint(start_x + 140, start_x + width - 140)
+        if rng.random() < 0.6:
+            gx = rng.randint(start_x + 140, start_x + width - 140)
             spike = pygame.Rect(gx, ground.top - 16, 24, 16)
-            self.entity_manager.spikes.append(spike)
+            self.entity_manager.add_spike(spike)
 
         # 버섯 아이템 생성
-        if random.random() < 0.7:
-            for _ in range(random.randint(1, 2)):
-                base = random.choice(chunk_plats)
-                mx = random.randint(base.left + 10, base.right - 34)
+        if rng.random() < 0.7:
+            for _ in range(rng.randint(1, 2)):
+                base = rng.choice(chunk_plats)
+                mx = rng.randint(base.left + 10, base.right - 34)
                 my = base.top - 24
-                mushroom = {
-                    "rect": pygame.Rect(mx, my, 24, 24),
-                    "vx": random.choice([-2, 2]),
-                    "vy": 0,
-                    "alive": True,
-                }
-                self.entity_manager.mushrooms.append(mushroom)
+                mushroom = Mushroom(
+                    rect=pygame.Rect(mx, my, 24, 24),
+                    vx=rng.choice([-2, 2]),
+                )
+                self.entity_manager.add_mushroom(mushroom)
 
         # 자동차 생성
-        if random.random() < 0.30:  # 30% 확률
-            base = random.choice(chunk_plats)
+        if rng.random() < 0.30:  # 30% 확률
+            base = rng.choice(chunk_plats)
             # 자동차 너비는 50. 안전하게 배치하기 위해 최소 80 이상 너비 필요
             if base.width >= 80:
                 # 좌우 여유 공간 확보
-                cx = random.randint(
+                cx = rng.randint(
                     base.left + 10, max(base.left + 11, base.right - 60)
                 )
                 cy = base.top - 30
                 roam_left = base.left + 5
                 roam_right = base.right - 5
-                car = {
-                    "rect": pygame.Rect(cx, cy, 50, 30),
-                    "alive": True,
-                    "rider": None,
-                    "vx": random.choice([-1, 1]),
-                    "left": roam_left,
-                    "right": roam_right,
-                }
-                self.entity_manager.cars.append(car)
+                car = Car(
+                    rect=pygame.Rect(cx, cy, 50, 30),
+                    vx=rng.choice([-1, 1]),
+                    left=roam_left,
+                    right=roam_right,
+                )
+                self.entity_manager.add_car(car)
 
         # 바이옴 처리
-        self._handle_biome(start_x, width, ground, chunk_plats)
+        self._handle_biome(start_x, width, ground, chunk_plats, rng)
 
-    def _handle_biome(self, start_x, width, ground, chunk_plats):
+    def _handle_biome(self, start_x, width, ground, chunk_plats, rng):
         """
         바이옴 전환 및 생성을 처리합니다.
 
@@ -179,22 +208,23 @@ class LevelGenerator:
             width: 구간의 너비
             ground: 바닥 rect
             chunk_plats: 이 구간의 플랫폼 리스트
+            rng: 이 구간의 난수 생성기
         """
         # 바이옴 전환
         if self.biome_chunks_remaining <= 0:
             if self.biome_type == "land":
                 self.biome_type = "sea"
-                self.biome_chunks_remaining = random.randint(2, 4)
+                self.biome_chunks_remaining = rng.randint(2, 4)
             else:
                 self.biome_type = "land"
-                self.biome_chunks_remaining = random.randint(3, 6)
+                self.biome_chunks_remaining = rng.randint(3, 6)
 
         if self.biome_type == "sea":
-            self._generate_sea_biome(start_x, width, ground, chunk_plats)
+            self._generate_sea_biome(start_x, width, ground, chunk_plats, rng)
 
         self.biome_chunks_remaining -= 1
 
-    def _generate_sea_biome(self, start_x, width, ground, chunk_plats):
+    def _generate_sea_biome(self, start_x, width, ground, chunk_plats, rng):
         """
         바다 바이옴을 생성합니다.
 
@@ -203,14 +233,15 @@ class LevelGenerator:
             width: 구간의 너비
             ground: 바닥 rect
             chunk_plats: 이 구간의 플랫폼 리스트
+            rng: 이 구간의 난수 생성기
         """
         sea = pygame.Rect(start_x, GROUND_TOP_Y, width, GROUND_THICKNESS + 240)
-        self.entity_manager.seas.append(sea)
+        self.entity_manager.add_sea(sea)
 
         # 바닥을 바다 부분만큼 제거
         if ground.colliderect(sea):
             try:
-                self.entity_manager.platforms.remove(ground)
+                self.entity_manager.remove_platform(ground)
                 chunk_plats.remove(ground)
             except ValueError:
                 pass
@@ -220,69 +251,66 @@ class LevelGenerator:
                 left_ground = pygame.Rect(
                     ground.left, ground.top, sea.left - ground.left, ground.height
                 )
-                self.entity_manager.platforms.append(left_ground)
+                self.entity_manager.add_platform(left_ground)
                 chunk_plats.append(left_ground)
             if ground.right > sea.right:
                 right_ground = pygame.Rect(
                     sea.right, ground.top, ground.right - sea.right, ground.height
                 )
-                self.entity_manager.platforms.append(right_ground)
+                self.entity_manager.add_platform(right_ground)
                 chunk_plats.append(right_ground)
 
         # 다리 생성
-        if random.random() < 0.6:
+        if rng.random() < 0.6:
             bridge_y = GROUND_TOP_Y - 60
             bridge = pygame.Rect(start_x + 20, bridge_y, width - 40, 18)
-            self.entity_manager.platforms.append(bridge)
+            self.entity_manager.add_platform(bridge)
             chunk_plats.append(bridge)
 
         # 물고기 적 생성
-        for _ in range(random.randint(2, 4)):
-            fx = random.randint(start_x + 20, start_x + width - 48)
-            fy = random.randint(sea.top + 20, min(sea.top + 80, sea.bottom - 40))
-            fish = {
-                "rect": pygame.Rect(fx, fy, 28, 20),
-                "vx": random.choice([-2, 2]),
-                "left": start_x + 10,
-                "right": start_x + width - 10,
-                "alive": True,
-            }
-            self.entity_manager.fish_enemies.append(fish)
+        for _ in range(rng.randint(2, 4)):
+            fx = rng.randint(start_x + 20, start_x + width - 48)
+            fy = rng.randint(sea.top + 20, min(sea.top + 80, sea.bottom - 40))
+            fish = FishEnemy(
+                rect=pygame.Rect(fx, fy, 28, 20),
+                vx=rng.choice([-2, 2]),
+                left=start_x + 10,
+                right=start_x + width - 10,
+            )
+            self.entity_manager.add_fish_enemy(fish)
 
         # 거북이 적 생성
-        for _ in range(random.randint(1, 2)):
-            tx = random.randint(start_x + 30, start_x + width - 58)
-            base_y = random.randint(sea.top + 40, sea.bottom - 50)
-            turtle = {
-                "rect": pygame.Rect(tx, base_y, 30, 20),
-                "vx": random.choice([-1, 1]),
-                "left": start_x + 10,
-                "right": start_x + width - 10,
-                "alive": True,
-                "t": random.random() * 6.28,
-                "amp": 12,
-            }
-            self.entity_manager.turtle_enemies.append(turtle)
+        for _ in range(rng.randint(1, 2)):
+            tx = rng.randint(start_x + 30, start_x + width - 58)
+            base_y = rng.randint(sea.top + 40, sea.bottom - 50)
+            turtle = TurtleEnemy(
+                rect=pygame.Rect(tx, base_y, 30, 20),
+                vx=rng.choice([-1, 1]),
+                left=start_x + 10,
+                right=start_x + width - 10,
+                t=rng.random() * 6.28,
+                amp=12,
+            )
+            self.entity_manager.add_turtle_enemy(turtle)
 
         # 산호 생성
-        for _ in range(random.randint(2, 4)):
-            cx = random.randint(start_x + 10, start_x + width - 26)
-            ch = random.randint(30, 70)
+        for _ in range(rng.randint(2, 4)):
+            cx = rng.randint(start_x + 10, start_x + width - 26)
+            ch = rng.randint(30, 70)
             coral = pygame.Rect(cx, sea.bottom - ch, 18, ch)
-            self.entity_manager.corals.append(coral)
+            self.entity_manager.add_coral(coral)
 
         # 해파리 생성
-        for _ in range(random.randint(2, 4)):
-            jx = random.randint(start_x + 40, start_x + width - 40)
-            jy = random.randint(sea.top + 20, sea.bottom - 60)
-            jelly = {
-                "rect": pygame.Rect(jx, jy, 18, 24),
-                "dir": random.choice([-1, 1]),
-                "top": sea.top + 20,
-                "bottom": sea.bottom - 20,
-                "alive": True,
-            }
-            self.entity_manager.jellies.append(jelly)
+        for _ in range(rng.randint(2, 4)):
+            jx = rng.randint(start_x + 40, start_x + width - 40)
+            jy = rng.randint(sea.top + 20, sea.bottom - 60)
+            jelly = Jelly(
+                rect=pygame.Rect(jx, jy, 18, 24),
+                direction=rng.choice([-1, 1]),
+                top=sea.top + 20,
+                bottom=sea.bottom - 20,
+            )
+            self.entity_manager.add_jelly(jelly)
 
     def should_generate_chunk(self, player_x):
         """
@@ -315,12 +343,12 @@ class LevelGenerator:
         """
         # 평평한 바닥 생성
         ground = pygame.Rect(start_x, GROUND_TOP_Y, 1000, GROUND_THICKNESS)
-        self.entity_manager.platforms.append(ground)
+        self.entity_manager.add_platform(ground)
 
         # 깃발 생성 (끝부분 쯤에)
         flag_x = start_x + 600
         flag_rect = pygame.Rect(flag_x, GROUND_TOP_Y - 300, 10, 300)
-        self.entity_manager.flags.append(flag_rect)
+        self.entity_manager.add_flag(flag_rect)
 
         # 성(Castle) 장식 (선택)
         # castle_rect = pygame.Rect(flag_x + 100, GROUND_TOP_Y - 160, 120, 160)
@@ -3,6 +3,10 @@
 
 이 모듈은 게임의 모든 엔티티를 dataclass로 정의하여
 타입 안정성과 AI 친화성을 높입니다.
+
+움직이는 엔티티는 `slots=True`로 정의해서 엔티티마다 __dict__를 만들지 않으므로
+메모리가 적고 속성 접근이 빠릅니다. `eq=False`로 두어 같은 값의 엔티티라도
+서로 다른 객체로 취급합니다 (리스트에서 제거할 때 다른 엔티티가 지워지지 않음).
 """
 
 from dataclasses import dataclass
@@ -35,66 +39,79 @@ class Platform:
     break_timer: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class MovingPlatform:
-    """움직이는 플랫폼 엔티티"""
+    """움직이는 플랫폼 엔티티 (left~right 사이를 좌우로 왕복)"""
 
     rect: pygame.Rect
-    start_x: float
-    end_x: float
-    speed: float
-    direction: int = 1  # 1: 오른쪽, -1: 왼쪽
+    vx: int
+    left: int
+    right: int
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class VerticalPlatform:
-    """수직 플랫폼 엔티티"""
+    """수직 플랫폼 엔티티 (top~bottom 사이를 위아래로 왕복)"""
 
     rect: pygame.Rect
-    start_y: float
-    end_y: float
-    speed: float
-    direction: int = 1  # 1: 아래, -1: 위
+    vy: int
+    top: int
+    bottom: int
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
+class FragilePlatform:
+    """부서지는 플랫폼 엔티티"""
+
+    rect: pygame.Rect
+    timer: int = -1
+
+
+@dataclass(slots=True, eq=False)
 class Enemy:
     """적 엔티티"""
 
     rect: pygame.Rect
-    vel_x: float = -2.0
-    vel_y: float = 0.0
-    jumping: bool = False
+    vx: int = -2
+    vy: float = 0.0
     alive: bool = True
+    kind: str = "walker"  # "walker" 또는 "hopper"(점프하는 적)
+    jump_cd: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FishEnemy:
-    """물고기 적 엔티티"""
+    """물고기 적 엔티티 (left~right 사이를 왕복)"""
 
     rect: pygame.Rect
-    vel_x: float = -3.0
-    amplitude: float = 0.0
-    phase: float = 0.0
+    vx: int
+    left: int
+    right: int
+    alive: bool = True
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TurtleEnemy:
-    """거북이 적 엔티티"""
+    """거북이 적 엔티티 (좌우 왕복하면서 위아래로 출렁임)"""
 
     rect: pygame.Rect
-    vel_x: float = -1.5
+    vx: int
+    left: int
+    right: int
+    alive: bool = True
+    t: float = 0.0  # 출렁임 위상
+    amp: int = 12  # 출렁임 크기
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Jelly:
-    """해파리 엔티티"""
+    """해파리 엔티티 (top~bottom 사이를 위아래로 왕복)"""
 
     rect: pygame.Rect
-    start_y: float
-    end_y: float
-    vel_y: float = 2.0
-    direction: int = 1
+    direction: int
+    top: int
+    bottom: int
+    alive: bool = True
 
 
 @dataclass
@@ -118,33 +135,48 @@ class Spike:
     rect: pygame.Rect
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Mushroom:
     """버섯 아이템 엔티티"""
 
     rect: pygame.Rect
-    vel_x: float = 2.0
-    vel_y: float = 0.0
+    vx: int = 2
+    vy: float = 0.0
+    alive: bool = True
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Car:
-    """자동차 엔티티"""
+    """자동차 엔티티 (타고 있지 않으면 left~right 사이를 왕복)"""
 
     rect: pygame.Rect
-    vel_x: float = 0.0
-    vel_y: float = 0.0
-    mounted: bool = False
+    vx: int
+    left: int
+    right: int
+    alive: bool = True
+    rider: pygame.Rect | None = None  # 탑승한 플레이어의 rect
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
+class Dino:
+    """공룡 엔티티 (자동차처럼 탑승 가능)"""
+
+    rect: pygame.Rect
+    vx: int
+    left: int
+    right: int
+    alive: bool = True
+    rider: pygame.Rect | None = None
+
+
+@dataclass(slots=True, eq=False)
 class Fireball:
     """불똥 엔티티"""
 
     rect: pygame.Rect
-    vel_x: float
-    lifetime: int
-    sprite: pygame.Surface
+    vx: int
+    ttl: int  # 남은 수명 (프레임)
+    alive: bool = True
 
 
 @dataclass
@@ -0,0 +1,344 @@
+"""
+순찰형 엔티티의 NumPy 배열(struct-of-arrays) 시뮬레이션 (선택 기능)
+
+물고기, 거북이, 해파리, 움직이는 플랫폼, 수직 플랫폼은 모두 정해진 구간을
+왕복하기만 하므로, 엔티티 하나씩 파이썬으로 돌리는 대신 종류별로 x, y, w, h,
+vx, vy, 구간(lo, hi), alive, phase 배열에 모아 두고 한 번에 계산합니다.
+
+배열이 위치의 원본이고, 엔티티 객체의 rect와 속도는 활성 구간(카메라 주변)에
+있는 것만 매 프레임 되돌려 써서(materialize) 충돌 검사와 렌더링에 사용합니다.
+활성 구간 밖에 있는 엔티티의 rect는 마지막으로 보였을 때의 값으로 남습니다.
+(플랫폼은 화면 밖 적의 충돌에도 쓰이므로 EntityManager가 항상 전부 되돌려 씁니다)
+
+numpy가 설치되어 있지 않으면 NUMPY_AVAILABLE이 False이고
+EntityManager는 기존 파이썬 루프를 사용합니다.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# 배열이 가득 차면 이 배수로 늘립니다
+_GROWTH = 2
+
+# 엔티티 하나당 저장하는 열과 자료형
+_COLUMNS = (
+    ("x", "int64"),
+    ("y", "int64"),
+    ("w", "int64"),
+    ("h", "int64"),
+    ("vx", "int64"),
+    ("vy", "int64"),
+    ("lo", "int64"),  # 왕복 구간 시작 (left 또는 top)
+    ("hi", "int64"),  # 왕복 구간 끝 (right 또는 bottom)
+    ("alive", "bool"),
+    ("phase", "float64"),
+    ("amp", "float64"),
+)
+
+
+class PatrolGroup:
+    """
+    같은 규칙으로 움직이는 엔티티 묶음
+
+    objects 리스트와 배열의 순서는 항상 같습니다. objects는 EntityManager의
+    엔티티 리스트(예: fish_enemies)로 그대로 쓰이므로, 추가/제거는 반드시
+    이 클래스를 통해야 합니다.
+    """
+
+    def __init__(self, read, write, axis, clamp, bob=False, has_alive=True):
+        """
+        Args:
+            read: 객체 -> (vx, vy, lo, hi, phase, amp) 함수
+            write: (객체, vx, vy, phase)로 속도/위상을 객체에 되돌려 쓰는 함수
+            axis: 왕복 축 (0: x, 1: y)
+            clamp: True면 구간 끝에 붙여서 방향 전환 (플랫폼),
+                   False면 넘어간 채로 방향만 전환 (물속 적)
+            bob: True면 phase에 따라 위아래로 출렁임 (거북이)
+            has_alive: 객체에 alive 속성이 있는지 여부
+        """
+        self._read = read
+        self._write = write
+        self.axis = axis
+        self.clamp = clamp
+        self.bob = bob
+        self.has_alive = has_alive
+
+        self.objects = []
+        self.count = 0
+        # 마지막 step에서 rect를 되돌려 쓴 인덱스 (alive 동기화용)
+        self._window = []
+        self._allocate(64)
+
+    def _allocate(self, capacity):
+        """배열을 capacity 크기로 (다시) 만듭니다 (기존 값은 유지)"""
+        old = getattr(self, "x", None)
+        for name, dtype in _COLUMNS:
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def add(self, obj):
+        """엔티티를 묶음 끝에 추가합니다 (objects 리스트에도 추가)"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * _GROWTH)
+        i = self.count
+        rect = obj.rect
+        vx, vy, lo, hi, phase, amp = self._read(obj)
+        self.x[i] = rect.x
+        self.y[i] = rect.y
+        self.w[i] = rect.width
+        self.h[i] = rect.height
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.lo[i] = lo
+        self.hi[i] = hi
+        self.alive[i] = obj.alive if self.has_alive else True
+        self.phase[i] = phase
+        self.amp[i] = amp
+        self.objects.append(obj)
+        self.count += 1
+
+    def load(self, objects):
+        """기존 리스트 내용으로 묶음을 다시 채웁니다 (리스트 객체는 유지)"""
+        items = list(objects)
+        self.objects.clear()
+        self.count = 0
+        self._window = []
+        for obj in items:
+            self.add(obj)
+
+    def _advance(self, n):
+        """
+        배열을 한 프레임 진행합니다.
+
+        Args:
+            n: 엔티티 수 (self.count)
+
+        Returns:
+            numpy.ndarray: 이번 프레임에 방향이 바뀐 엔티티 (bool 마스크)
+        """
+        x, y, w, h = self.x[:n], self.y[:n], self.w[:n], self.h[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        lo, hi = self.lo[:n], self.hi[:n]
+        alive = self.alive[:n]
+
+        # 죽은 엔티티는 움직이지 않음
+        if self.has_alive:
+            x += vx * alive
+            y += vy * alive
+        else:
+            x += vx
+            y += vy
+
+        pos, size, vel = (x, w, vx) if self.axis == 0 else (y, h, vy)
+        if self.clamp:
+            low = pos < lo
+            high = ~low & (pos + size > hi)
+            pos[low] = lo[low]
+            pos[high] = hi[high] - size[high]
+            flipped = low | high
+        else:
+            out = (pos < lo) | (pos + size > hi)
+            if self.has_alive:
+                out &= alive
+            flipped = out
+        vel[flipped] *= -1
+
+        if self.bob:
+            phase = self.phase[:n]
+            phase += 0.05 * alive
+            bob = (np.sin(phase) * self.amp[:n] * 0.1).astype(np.int64)
+            y += bob * alive
+        return flipped
+
+    def step(self, window_left, window_right):
+        """
+        한 프레임 진행하고 활성 구간 안의 엔티티만 객체에 되돌려 씁니다.
+
+        Args:
+            window_left: 활성 구간 왼쪽 X
+            window_right: 활성 구간 오른쪽 X
+
+        Returns:
+            list[int]: 되돌려 쓴 엔티티 인덱스
+        """
+        n = self.count
+        if n == 0:
+            self._window = []
+            return self._window
+        self._sync_alive()
+        self._advance(n)
+
+        x, y, w = self.x[:n], self.y[:n], self.w[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        # 활성 구간 안의 엔티티만 rect/속도를 객체에 되돌려 씀
+        visible = np.flatnonzero((x + w > window_left) & (x < window_right))
+        self._window = visible.tolist()
+        objects = self.objects
+        write = self._write
+        for i, xi, yi, vxi, vyi, phase_i in zip(
+            self._window,
+            x[visible].tolist(),
+            y[visible].tolist(),
+            vx[visible].tolist(),
+            vy[visible].tolist(),
+            self.phase[visible].tolist(),
+        ):
+            obj = objects[i]
+            obj.rect.x = xi
+            obj.rect.y = yi
+            write(obj, vxi, vyi, phase_i)
+        return self._window
+
+    def step_all(self, cell_width):
+        """
+        모든 엔티티를 한 프레임 진행하고 rect를 전부 되돌려 씁니다.
+
+        화면 밖 적의 충돌에도 쓰이는 플랫폼용입니다. 움직이는 축의 좌표만 쓰고
+        속도는 방향이 바뀐 엔티티에만 써서, 엔티티당 파이썬 작업을 대입 한 번으로
+        줄입니다. bob이나 alive가 있는 묶음에는 쓰지 않습니다.
+
+        Args:
+            cell_width: 플랫폼 격자 열 하나의 가로 길이
+
+        Returns:
+            list[int]: 걸치는 격자 열이 바뀐 엔티티 인덱스 (격자 갱신이 필요한 것)
+        """
+        n = self.count
+        self._window = []
+        if n == 0:
+            return []
+        x, w = self.x[:n], self.w[:n]
+        first, last = x // cell_width, (x + w - 1) // cell_width
+        flipped = self._advance(n)
+
+        objects = self.objects
+        if self.axis == 0:
+            for obj, xi in zip(objects, x.tolist()):
+                obj.rect.x = xi
+        else:
+            for obj, yi in zip(objects, self.y[:n].tolist()):
+                obj.rect.y = yi
+        write = self._write
+        for i in np.flatnonzero(flipped).tolist():
+            write(objects[i], int(self.vx[i]), int(self.vy[i]), 0.0)
+
+        moved = (x // cell_width != first) | ((x + w - 1) // cell_width != last)
+        return np.flatnonzero(moved).tolist()
+
+    def _sync_alive(self):
+        """
+        마지막 step에서 되돌려 쓴 엔티티의 alive를 객체에서 읽어 배열과 맞춥니다
+        (충돌로 죽은 엔티티는 활성 구간 안에서만 생김)
+        """
+        if not self.has_alive:
+            return
+        objects = self.objects
+        for i in self._window:
+            if not objects[i].alive:
+                self.alive[i] = False
+
+    def despawn(self, despawn_x):
+        """
+        그려질 수 있는 x 구간이 모두 despawn_x 왼쪽인 엔티티를 제거합니다.
+
+        파이썬 백엔드의 화면 컬링 인덱스(entities._RENDER_SPANS)와 같은 구간을
+        씁니다. x로 왕복하는 엔티티는 순찰 구간 전체(lo~hi), y로 왕복하는
+        엔티티는 현재 x 위치입니다. 죽은 엔티티도 파이썬 백엔드처럼 구간이
+        벗어날 때까지 남겨 둡니다.
+
+        Returns:
+            list: 제거된 엔티티 객체 (없으면 빈 리스트, 마지막 상태가 되돌려 쓰여 있음)
+        """
+        n = self.count
+        if n == 0:
+            return []
+        self._sync_alive()
+        if self.axis == 0:
+            keep = self.hi[:n] > despawn_x
+        else:
+            keep = self.x[:n] + self.w[:n] > despawn_x
+        if keep.all():
+            return []
+
+        kept_index = np.flatnonzero(keep)
+        removed_index = np.flatnonzero(~keep).tolist()
+        removed = [self.objects[i] for i in removed_index]
+        # 활성 구간 밖에서 제거된 엔티티도 마지막 상태를 객체에 되돌려 씀
+        # (보관했다가 다시 추가할 때 add가 객체에서 읽어 감)
+        for i, obj in zip(removed_index, removed):
+            obj.rect.x = int(self.x[i])
+            obj.rect.y = int(self.y[i])
+            self._write(obj, int(self.vx[i]), int(self.vy[i]), float(self.phase[i]))
+        kept = [self.objects[i] for i in kept_index.tolist()]
+        for name, _ in _COLUMNS:
+            array = getattr(self, name)
+            array[: len(kept)] = array[kept_index]
+        self.objects[:] = kept
+        self.count = len(kept)
+        self._window = []
+        return removed
+
+
+def _write_vx(obj, vx, vy, phase):
+    obj.vx = vx
+
+
+def _write_vy(obj, vx, vy, phase):
+    obj.vy = vy
+
+
+def _write_turtle(obj, vx, vy, phase):
+    obj.vx = vx
+    obj.t = phase
+
+
+def _write_jelly(obj, vx, vy, phase):
+    obj.direction = vy
+
+
+class PatrolSystem:
+    """순찰형 엔티티 다섯 종류의 PatrolGroup 모음"""
+
+    def __init__(self):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy가 설치되어 있지 않습니다 (uv sync --extra fast)")
+        self.fish = PatrolGroup(
+            lambda f: (f.vx, 0, f.left, f.right, 0.0, 0.0),
+            _write_vx,
+            axis=0,
+            clamp=False,
+        )
+        self.turtles = PatrolGroup(
+            lambda t: (t.vx, 0, t.left, t.right, t.t, t.amp),
+            _write_turtle,
+            axis=0,
+            clamp=False,
+            bob=True,
+        )
+        self.jellies = PatrolGroup(
+            lambda j: (0, j.direction, j.top, j.bottom, 0.0, 0.0),
+            _write_jelly,
+            axis=1,
+            clamp=False,
+        )
+        self.moving_platforms = PatrolGroup(
+            lambda mp: (mp.vx, 0, mp.left, mp.right, 0.0, 0.0),
+            _write_vx,
+            axis=0,
+            clamp=True,
+            has_alive=False,
+        )
+        self.vertical_platforms = PatrolGroup(
+            lambda vp: (0, vp.vy, vp.top, vp.bottom, 0.0, 0.0),
+            _write_vy,
+            axis=1,
+            clamp=True,
+            has_alive=False,
+        )
@@ -2,10 +2,11 @@
 플레이어 관련 클래스 및 함수
 """
 
-from typing import Any
 import pygame
 from constants import *  # CAR_SPEED_MULT 포함
-from sprites import make_player_sprite
+from collision import swept_dx, swept_dy
+from models import Car
+from sprites import sprite_cache
 
 
 class Player:
@@ -39,13 +40,14 @@ class Player:
         self.coyote_timer = 0
         self.jump_buffer_timer = 0
         self.jump_was_down = False
+        self.fire_was_down = False
 
         # 자동차 탑승 관련
         self.on_car = False
         self.current_car = None
 
         # 스프라이트
-        self.sprite = make_player_sprite(self.rect.width, self.rect.height, self.color)
+        self.sprite = sprite_cache.get("player", self.rect.size, self.color)
 
     def reset(self) -> None:
         """플레이어를 초기 상태로 리셋"""
@@ -64,7 +66,7 @@ class Player:
         self.health = INITIAL_HEALTH  # 체력 리셋
         self.on_car = False
         self.current_car = None
-        self.sprite = make_player_sprite(self.rect.width, self.rect.height, self.color)
+        self.sprite = sprite_cache.get("player", self.rect.size, self.color)
 
     def update_invincibility(self) -> None:
         """무적 시간 업데이트"""
@@ -81,7 +83,7 @@ class Player:
         self.rect.bottom = old_bottom
         self.is_big = True
         self.invincible_timer = 60
-        self.sprite = make_player_sprite(self.rect.width, self.rect.height, self.color)
+        self.sprite = sprite_cache.get("player", self.rect.size, self.color)
 
     def take_damage(self) -> bool:
         """
@@ -118,15 +120,15 @@ class Player:
         self.rect.y = old_center[1] - self.rect.height // 2
         self.is_big = False
         self.invincible_timer = 60
-        self.sprite = make_player_sprite(self.rect.width, self.rect.height, self.color)
+        self.sprite = sprite_cache.get("player", self.rect.size, self.color)
 
-    def mount_car(self, car: dict[str, Any]) -> None:
+    def mount_car(self, car: Car) -> None:
         """자동차에 탑승합니다"""
         self.on_car = True
         self.current_car = car
-        car["rider"] = self.rect
+        car.rider = self.rect
         self.velocity_y = 0
-        self.rect.bottom = car["rect"].top + 6
+        self.rect.bottom = car.rect.top + 6
 
     def dismount_car(self) -> None:
         """자동차에서 내립니다"""
@@ -134,11 +136,26 @@ class Player:
             return
 
         car = self.current_car
-        car["rider"] = None
+        car.rider = None
         self.on_car = False
         self.current_car = None
         self.velocity_y = JUMP_POWER * 0.5  # 내릴 때 살짝 점프
-        car["rect"].bottom = min(car["rect"].bottom, GROUND_TOP_Y)
+        car.rect.bottom = min(car.rect.bottom, GROUND_TOP_Y)
+
+    def horizontal_move(self, move_direction: int) -> float:
+        """
+        이번 프레임의 가로 이동량 (자동차를 타면 CAR_SPEED_MULT배)
+
+        Args:
+            move_direction: 이동 방향 (-1: 왼쪽, 0: 정지, 1: 오른쪽)
+
+        Returns:
+            float: 가로 이동량 (픽셀)
+        """
+        move = move_direction * self.speed
+        if self.on_car and self.current_car:
+            move *= CAR_SPEED_MULT
+        return move
 
     def apply_horizontal_movement(
         self, move_direction: int, platforms: list[pygame.Rect]
@@ -148,16 +165,16 @@ class Player:
 
         Args:
             move_direction: 이동 방향 (-1: 왼쪽, 0: 정지, 1: 오른쪽)
-            platforms: 충돌 검사할 플랫폼 리스트
+            platforms: 충돌 검사할 플랫폼 리스트 (보통 EntityManager.platforms_near
+                결과, 이동량 horizontal_move만큼 넓혀 찾은 것)
         """
         if move_direction != 0:
             self.facing = move_direction
 
-        effective_move = move_direction * self.speed
-        if self.on_car and self.current_car:
-            effective_move *= CAR_SPEED_MULT
+        effective_move = self.horizontal_move(move_direction)
 
-        self.rect.x += effective_move
+        # 벽을 뚫고 지나가지 않도록 처음 닿는 플랫폼까지만 이동
+        self.rect.x += swept_dx(self.rect, effective_move, platforms)
 
         # 벽 충돌 처리
         for p in platforms:
@@ -185,27 +202,35 @@ class Player:
         if self.velocity_y > 20:
             self.velocity_y = 20
 
-        # 위치 업데이트
-        self.rect.y += int(self.velocity_y)
+        # 위치 업데이트 (처음 닿는 플랫폼까지만, 탑승 중이면 자동차 기준)
+        dy = int(self.velocity_y)
+        if self.on_car and self.current_car:
+            car = self.current_car
+            car.rect.centerx = self.rect.centerx
+            car.rect.top = self.rect.bottom - 6
+            dy = swept_dy(car.rect, dy, platforms)
+        else:
+            dy = swept_dy(self.rect, dy, platforms)
+        self.rect.y += dy
         new_on_ground = False
 
         # 2. 상태별 충돌 처리
         if self.on_car and self.current_car:
             # 자동차 탑승 중 (차량 기준 충돌 검사)
             car = self.current_car
-            car["rect"].centerx = self.rect.centerx
-            car["rect"].top = self.rect.bottom - 6
+            car.rect.centerx = self.rect.centerx
+            car.rect.top = self.rect.bottom - 6
 
             for p in platforms:
-                if car["rect"].colliderect(p):
+                if car.rect.colliderect(p):
                     if self.velocity_y > 0:
-                        car["rect"].bottom = p.top
-                        self.rect.bottom = car["rect"].top + 6
+                        car.rect.bottom = p.top
+                        self.rect.bottom = car.rect.top + 6
                         self.velocity_y = 0
                         new_on_ground = True
                     elif self.velocity_y < 0:
-                        car["rect"].top = p.bottom
-                        self.rect.bottom = car["rect"].top + 6
+                        car.rect.top = p.bottom
+                        self.rect.bottom = car.rect.top + 6
                         self.velocity_y = 0
 
         else:
@@ -293,5 +318,8 @@ class Player:
         Args:
             screen: 그릴 화면
             camera_x: 카메라 X 위치
+
+        Returns:
+            pygame.Rect: 그린 화면 영역
         """
-        screen.blit(self.sprite, (self.rect.x - camera_x, self.rect.y))
+        return screen.blit(self.sprite, (self.rect.x - camera_x, self.rect.y))
@@ -0,0 +1,245 @@
+"""
+게임 안에서 켜고 끄는 프로파일러 오버레이
+
+Game.run에서 F3으로 켜고 끄며, F4로 지금까지 모은 캡처를 JSON 파일로 저장합니다.
+
+켜져 있는 동안만 Game의 단계 메서드(update_players 등)와 Renderer.render_all을
+perf_counter_ns로 시간을 재는 함수로 바꿔 끼웁니다(인스턴스 속성이 메서드를
+가림). 끄면 그 속성을 지워 원래 메서드가 그대로 호출되므로, 꺼져 있을 때는
+프레임마다 추가되는 비용이 없습니다.
+"""
+
+import json
+import time
+from collections import deque
+
+import pygame
+
+from constants import *
+from entities import ENTITY_LISTS
+
+# 시간을 재는 단계 (render_all은 Renderer, 나머지는 Game 메서드)
+PROFILED_PHASES = (
+    "update_players",
+    "update_entities",
+    "handle_collisions",
+    "generate_level",
+    "cleanup_offscreen",
+    "render_all",
+)
+
+_FRAME_BUDGET_MS = 1000 / FPS
+_GRAPH_HEIGHT = 80
+_BAR_WIDTH = 2
+_PANEL_ALPHA = 180
+_VALUE_X = 170  # 단계별 시간 값을 그리는 열 (글꼴 폭이 일정하지 않아서 따로 맞춤)
+_TEXT_COLOR = (255, 255, 255)
+_OK_COLOR = (80, 220, 80)
+_SLOW_COLOR = (240, 70, 70)
+_BUDGET_COLOR = (255, 220, 0)
+
+
+class Profiler:
+    """단계별 프레임 시간을 모으고 오버레이로 그리는 프로파일러"""
+
+    def __init__(
+        self, history=PROFILER_HISTORY, capture_frames=PROFILER_CAPTURE_FRAMES
+    ):
+        """
+        Args:
+            history: 그래프에 보여 줄 최근 프레임 수
+            capture_frames: 파일로 저장하려고 보관하는 최근 프레임 수
+        """
+        self.enabled = False
+        self.history = deque(maxlen=history)
+        self.capture = deque(maxlen=capture_frames)
+        # 현재 프레임에서 단계별로 쓴 시간 (나노초)
+        self.phase_ns = dict.fromkeys(PROFILED_PHASES, 0)
+        # 마지막 프레임의 단계별 시간 (밀리초, "other"는 단계 밖 시간)
+        self.last_phases = {}
+        self.frames = 0
+        self._font = None
+
+    @staticmethod
+    def _owner(game, name):
+        """단계 메서드를 가진 객체 (render_all만 Renderer)"""
+        return game.renderer if name == "render_all" else game
+
+    def _timed(self, name, method):
+        """method를 호출하고 걸린 시간을 phase_ns[name]에 더하는 함수"""
+        phase_ns = self.phase_ns
+        perf_counter_ns = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            started = perf_counter_ns()
+            result = method(*args, **kwargs)
+            phase_ns[name] += perf_counter_ns() - started
+            return result
+
+        return timed
+
+    def _timed_frame(self, game, update_frame):
+        """프레임 전체를 재고 기록한 뒤 오버레이를 그리는 update_frame"""
+        perf_counter_ns = time.perf_counter_ns
+
+        def timed_frame(*args):
+            for name in self.phase_ns:
+                self.phase_ns[name] = 0
+            started = perf_counter_ns()
+            update_frame(*args)
+            self.record(game, perf_counter_ns() - started)
+            if game.render_enabled:
+                game.renderer.mark_dirty(self.draw(game.screen, game))
+
+        return timed_frame
+
+    def enable(self, game):
+        """game의 단계 메서드를 시간을 재는 함수로 바꿔 끼웁니다"""
+        if self.enabled:
+            return
+        for name in PROFILED_PHASES:
+            owner = self._owner(game, name)
+            setattr(owner, name, self._timed(name, getattr(owner, name)))
+        game.update_frame = self._timed_frame(game, game.update_frame)
+        self.enabled = True
+
+    def disable(self, game):
+        """바꿔 끼운 함수를 지워 원래 메서드로 되돌립니다"""
+        if not self.enabled:
+            return
+        for name in PROFILED_PHASES:
+            delattr(self._owner(game, name), name)
+        del game.update_frame
+        self.enabled = False
+
+    def toggle(self, game):
+        """오버레이를 켜거나 끕니다"""
+        if self.enabled:
+            self.disable(game)
+        else:
+            self.enable(game)
+
+    def record(self, game, frame_ns):
+        """
+        한 프레임의 측정값을 그래프 기록과 캡처에 추가합니다.
+
+        Args:
+            game: Game 인스턴스
+            frame_ns: update_frame 전체에 걸린 시간 (나노초)
+        """
+        phases = {name: ns / 1e6 for name, ns in self.phase_ns.items()}
+        frame_ms = frame_ns / 1e6
+        phases["other"] = max(0.0, frame_ms - sum(phases.values()))
+        self.last_phases = phases
+        self.history.append(frame_ms)
+        self.frames += 1
+
+        entity_manager = game.entity_manager
+        self.capture.append(
+            {
+                "frame": self.frames,
+                "camera_x": game.camera_x,
+                "frame_ms": frame_ms,
+                "phases_ms": phases,
+                "draw_calls": game.renderer.draw_calls,
+                "entities": {
+                    name: len(getattr(entity_manager, name)) for name in ENTITY_LISTS
+                },
+            }
+        )
+
+    def dump(self, path=None):
+        """
+        보관 중인 캡처를 JSON 파일로 저장합니다.
+
+        Args:
+            path: 저장할 파일 경로 (기본값: 현재 폴더의 profile_<시각>.json)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        if path is None:
+            path = time.strftime("profile_%Y%m%d_%H%M%S.json")
+        frames = list(self.capture)
+        summary = {}
+        for name in (*PROFILED_PHASES, "other"):
+            values = [f["phases_ms"][name] for f in frames]
+            if values:
+                summary[name] = {
+                    "mean_ms": sum(values) / len(values),
+                    "max_ms": max(values),
+                }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fps": FPS,
+                    "screen": [SCREEN_WIDTH, SCREEN_HEIGHT],
+                    "summary": summary,
+                    "frames": frames,
+                },
+                f,
+                indent=1,
+            )
+        return path
+
+    def draw(self, screen, game):
+        """
+        화면 왼쪽 아래에 프레임 시간 그래프와 단계별 시간, 엔티티 수를 그립니다.
+
+        Args:
+            screen: 그릴 화면
+            game: Game 인스턴스
+
+        Returns:
+            pygame.Rect: 그린 화면 영역
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        font = self._font
+        line_height = font.get_linesize()
+
+        history = self.history
+        frame_ms = history[-1] if history else 0.0
+        avg_ms = sum(history) / len(history) if history else 0.0
+        max_ms = max(history) if history else 0.0
+        # (왼쪽 글자, 값 열 글자)
+        lines = [
+            (
+                f"frame {frame_ms:.2f} ms  avg {avg_ms:.2f}  max {max_ms:.2f}  "
+                f"budget {_FRAME_BUDGET_MS:.1f}",
+                "",
+            )
+        ]
+        lines += [(name, f"{ms:.2f} ms") for name, ms in self.last_phases.items()]
+        lines.append(("draw calls", str(game.renderer.draw_calls)))
+        counts = [
+            f"{name} {len(getattr(game.entity_manager, name))}"
+            for name in ENTITY_LISTS
+        ]
+        for i in range(0, len(counts), 3):
+            lines.append(("  ".join(counts[i : i + 3]), ""))
+        lines.append(("F3 hide  F4 save capture", ""))
+
+        width = max(history.maxlen * _BAR_WIDTH, 420) + 16
+        height = _GRAPH_HEIGHT + line_height * len(lines) + 24
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, _PANEL_ALPHA))
+
+        # 프레임 시간 그래프 (위쪽 끝이 예산의 2배, 노란 선이 1프레임 예산)
+        scale = _GRAPH_HEIGHT / (_FRAME_BUDGET_MS * 2)
+        bottom = 8 + _GRAPH_HEIGHT
+        for i, ms in enumerate(history):
+            bar = min(_GRAPH_HEIGHT, max(1, int(ms * scale)))
+            color = _OK_COLOR if ms <= _FRAME_BUDGET_MS else _SLOW_COLOR
+            panel.fill(color, (8 + i * _BAR_WIDTH, bottom - bar, _BAR_WIDTH, bar))
+        budget_y = bottom - int(_FRAME_BUDGET_MS * scale)
+        pygame.draw.line(panel, _BUDGET_COLOR, (8, budget_y), (width - 8, budget_y))
+
+        y = bottom + 8
+        for label, value in lines:
+            panel.blit(font.render(label, True, _TEXT_COLOR), (8, y))
+            if value:
+                panel.blit(font.render(value, True, _TEXT_COLOR), (_VALUE_X, y))
+            y += line_height
+
+        return screen.blit(panel, (10, SCREEN_HEIGHT - height - 10))
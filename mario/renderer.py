@@ -5,8 +5,18 @@
 import pygame
 import math
 from constants import *
+from hud import Hud
+from spatial import PLATFORM_STATIC
 from sprites import *
 
+# 물결 띠: 물결은 24px 간격이고 높이가 sin(오프셋 + 시간)으로 출렁이는데,
+# 물결 11개(264px)마다 sin(264) ≈ sin(0)으로 거의 되풀이되므로 이 폭의 띠를
+# 위상별로 미리 그려 두고 이어 붙여 씀
+_WAVE_SPACING = 24
+_WAVE_PERIOD = 11 * _WAVE_SPACING
+_WAVE_FRAMES = 24  # 출렁임 한 주기(2π)를 나눈 애니메이션 프레임 수
+_WAVE_BASE = 9  # 띠 위쪽 끝에서 물결 기준선까지 (출렁임 3 + 호 반지름 6)
+
 
 class Renderer:
     """게임 화면 렌더링을 담당하는 클래스"""
@@ -19,16 +29,49 @@ class Renderer:
             screen: pygame 화면
         """
         self.screen = screen
+        # 물결 애니메이션 시계 (헤드리스 모드에서는 시뮬레이션 시계로 바뀜)
+        self.get_ticks = pygame.time.get_ticks
         self.font = pygame.font.SysFont("arial", 24, bold=True)
         self.hud_font = pygame.font.SysFont("arial", 20, bold=True)
-
-        # 스프라이트 미리 생성
-        self.enemy_img = make_enemy_sprite(28, 28)
-        self.fish_img = make_fish_sprite(28, 18)
-        self.turtle_img = make_turtle_sprite(30, 20)
-        self.fireball_img = make_fireball_sprite(8)
-        self.mushroom_img = make_mushroom_sprite(24, 24)
-        self.car_img = make_car_sprite(50, 30)
+        # 점수, 시간, 체력 등 HUD 표면 캐시
+        self.hud = Hud(self.font, self.hud_font)
+
+        # 스프라이트 (플레이어와 함께 쓰는 캐시에서 화면 픽셀 형식으로 받아 옴)
+        self.enemy_img = sprite_cache.get("enemy", (28, 28))
+        self.fish_img = sprite_cache.get("fish", (28, 18))
+        self.turtle_img = sprite_cache.get("turtle", (30, 20))
+        self.fireball_img = sprite_cache.get("fireball", (16, 16))
+        self.mushroom_img = sprite_cache.get("mushroom", (24, 24))
+        self.car_img = sprite_cache.get("car", (50, 30))
+
+        # 배경 캐시 (월드 테마나 화면 크기가 바뀔 때만 다시 그림)
+        self._background = None
+        self._background_key = None
+
+        # 청크 열 -> (지형 버전, 지형 색, 표면, 표면 위쪽 Y)
+        self._terrain = {}
+        self._terrain_owner = None
+
+        # 애니메이션 프레임 번호 -> 미리 그린 물결 띠
+        self._wave_strips = {}
+
+        # 화면 컬링 결과와 같은 스프라이트 묶음을 담아 재사용하는 리스트
+        self._visible = []
+        self._batch = []
+
+        # 화면 내보내기 방식 ("full": 매 프레임 전체, "dirty": 바뀐 영역만)
+        self.mode = RENDER_MODE
+        # 이번/지난 프레임에 배경과 지형 위에 그린 화면 영역
+        self._dirty = []
+        self._prev_dirty = []
+        # dirty 모드: 배경+지형 레이어와 그 조건, 지난 프레임의 조건,
+        # 이번 프레임이 배경을 되돌려 그린 프레임인지
+        self._static = None
+        self._static_key = None
+        self._last_key = None
+        self._still = False
+        # 마지막 render_all에서 월드를 그린 호출 수 (HUD 제외)
+        self.draw_calls = 0
 
     def draw_rect_with_camera(self, rect, color, camera_x, border_color=None):
         """
@@ -39,11 +82,15 @@ class Renderer:
             color: 색상
             camera_x: 카메라 X 좌표
             border_color: 테두리 색상 (None이면 없음)
+
+        Returns:
+            pygame.Rect: 그린 화면 영역
         """
         shifted = pygame.Rect(rect.x - camera_x, rect.y, rect.width, rect.height)
         pygame.draw.rect(self.screen, color, shifted)
         if border_color:
             pygame.draw.rect(self.screen, border_color, shifted, 2)
+        return shifted
 
     def draw_spike_with_camera(self, rect, color, camera_x):
         """
@@ -68,140 +115,231 @@ class Renderer:
             sea_rect: 바다 사각형
             camera_x: 카메라 X 좌표
         """
-        wave_top = sea_rect.top - 4
-        for i in range(0, sea_rect.width, 24):
-            wx = sea_rect.x + i - camera_x
-            wy = wave_top + int(math.sin((i + pygame.time.get_ticks() * 0.005)) * 3)
-            pygame.draw.arc(
-                self.screen,
-                SEA_DARK,
-                (wx - 12, wy - 6, 24, 12),
-                math.pi,
-                2 * math.pi,
-                2,
+        # 화면에 걸치는 구간만 띠에서 잘라 붙임 (sea_rect.x 기준 오프셋,
+        # 첫 물결과 마지막 물결은 좌우로 12씩 넘침)
+        last = (sea_rect.width - 1) // _WAVE_SPACING * _WAVE_SPACING + 12
+        camera_offset = int(camera_x) - sea_rect.x
+        i = max(-12, camera_offset)
+        end = min(last, camera_offset + SCREEN_WIDTH)
+        if i >= end:
+            return
+
+        phase = self.get_ticks() * 0.005 % (2 * math.pi)
+        strip = self._wave_strip(int(phase / (2 * math.pi) * _WAVE_FRAMES))
+        height = strip.get_height()
+        y = sea_rect.top - 4 - _WAVE_BASE
+        while i < end:
+            u = i % _WAVE_PERIOD
+            width = min(_WAVE_PERIOD - u, end - i)
+            self._dirty.append(
+                self.screen.blit(strip, (i - camera_offset, y), (u, 0, width, height))
             )
+            self.draw_calls += 1
+            i += width
 
-    def draw_heart(self, x, y, filled=True):
+    def _wave_strip(self, frame):
         """
-        하트를 그립니다.
+        애니메이션 프레임의 물결 띠 (처음 쓸 때 한 번만 그림)
 
-        Args:
-            x: X 좌표
-            y: Y 좌표
-            filled: 채워진 하트인지 여부 (False면 빈 하트)
-        """
-        # 하트 모양을 폴리곤으로 그리기
-        heart_color = (255, 50, 50) if filled else (100, 100, 100)
-        outline_color = (200, 30, 30) if filled else (80, 80, 80)
-
-        # 하트 좌표 (크기: 약 30x28)
-        scale = 1.2
-        points = [
-            (x, y + 8 * scale),  # 아래 중앙
-            (x - 8 * scale, y),  # 왼쪽 위
-            (x - 8 * scale, y - 4 * scale),  # 왼쪽 상단
-            (x - 4 * scale, y - 8 * scale),  # 왼쪽 꼭대기
-            (x, y - 6 * scale),  # 중앙 상단
-            (x + 4 * scale, y - 8 * scale),  # 오른쪽 꼭대기
-            (x + 8 * scale, y - 4 * scale),  # 오른쪽 상단
-            (x + 8 * scale, y),  # 오른쪽 위
-        ]
-
-        # 하트 채우기
-        if filled:
-            pygame.draw.polygon(self.screen, heart_color, points)
-
-        # 하트 외곽선
-        pygame.draw.polygon(self.screen, outline_color, points, 3)
-
-    def draw_health_bar(self, health, is_p1=True):
-        """
-        화면 오른쪽 상단에 체력(하트)을 그립니다.
+        띠의 x는 바다 왼쪽 끝 기준 오프셋을 _WAVE_PERIOD로 나눈 나머지이고,
+        양 끝에 걸친 물결은 반대쪽에도 그려서 띠를 이어 붙여도 끊기지 않습니다.
 
         Args:
-            health: 현재 체력
-            is_p1: P1인지 여부 (True면 오른쪽, False면 왼쪽)
+            frame: 0 ~ _WAVE_FRAMES - 1
+
+        Returns:
+            pygame.Surface: _WAVE_PERIOD 폭의 물결 띠
         """
-        # 하트 시작 위치
-        if is_p1:
-            start_x = SCREEN_WIDTH - 150
-        else:
-            start_x = 30  # P2는 왼쪽
+        strip = self._wave_strips.get(frame)
+        if strip is not None:
+            return strip
+        phase = frame * 2 * math.pi / _WAVE_FRAMES
+        strip = pygame.Surface((_WAVE_PERIOD, _WAVE_BASE * 2), pygame.SRCALPHA)
+        for i in range(0, _WAVE_PERIOD + 1, _WAVE_SPACING):
+            wy = _WAVE_BASE + int(math.sin(i % _WAVE_PERIOD + phase) * 3)
+            pygame.draw.arc(
+                strip, SEA_DARK, (i - 12, wy - 6, 24, 12), math.pi, 2 * math.pi, 2
+            )
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert_alpha()
+        self._wave_strips[frame] = strip
+        return strip
+
+    @staticmethod
+    def terrain_colors(current_world):
+        """
+        월드 테마별 정적 지형 색을 반환합니다.
+
+        Returns:
+            tuple: (플랫폼 색, 플랫폼 테두리 색, 가시 색, 바다 색)
+        """
+        if current_world >= 2:
+            # 월드 2는 물 색을 약간 어둡게
+            return NEON_BLACK, NEON_GREEN, NEON_PINK, (0, 0, 100)
+        return GRAY, None, ORANGE, SEA
+
+    def draw_terrain(self, entity_manager, camera_x, colors):
+        """
+        화면에 보이는 청크의 정적 지형 표면을 붙입니다.
 
-        start_y = 100  # HUD 아래로 내림 (기존 70이었으나 겹칠 수 있으므로 조정)
-        heart_spacing = 40
+        고정 플랫폼, 스프링, 가시, 산호, 바다는 생성된 뒤 바뀌지 않으므로
+        청크(CHUNK_WIDTH) 단위로 한 번 그려 두고, 청크의 지형 버전이나
+        테마 색이 바뀔 때만 다시 그립니다. 화면 밖 정리로 지형 버전이
+        사라진 청크의 표면은 캐시에서 버립니다.
 
-        for i in range(MAX_HEALTH):
-            x = start_x + i * heart_spacing
-            # 현재 체력보다 작거나 같으면 채워진 하트
-            filled = i < health
-            self.draw_heart(x, start_y, filled)
+        Args:
+            entity_manager: 엔티티 매니저
+            camera_x: 카메라 X 좌표
+            colors: terrain_colors()가 반환한 지형 색
+        """
+        versions = entity_manager.terrain_versions
+        if self._terrain_owner is not entity_manager:
+            self._terrain.clear()
+            self._terrain_owner = entity_manager
+        for column in [c for c in self._terrain if c not in versions]:
+            del self._terrain[column]
+
+        first = int(camera_x) // CHUNK_WIDTH
+        last = int(camera_x + SCREEN_WIDTH) // CHUNK_WIDTH
+        for column in range(first, last + 1):
+            version = versions.get(column)
+            if version is None:
+                continue
+            cached = self._terrain.get(column)
+            if cached is None or cached[0] != version or cached[1] != colors:
+                cached = self._bake_terrain(entity_manager, column, version, colors)
+                self._terrain[column] = cached
+            surface, top = cached[2], cached[3]
+            if surface is not None:
+                # 소수 카메라 좌표는 개별 rect를 그릴 때처럼 내림
+                x = math.floor(column * CHUNK_WIDTH - camera_x)
+                self.screen.blit(surface, (x, top))
+                self.draw_calls += 1
+
+    def _bake_terrain(self, entity_manager, column, version, colors):
+        """
+        청크 하나의 정적 지형을 투명색(colorkey) 표면에 그립니다.
+
+        Returns:
+            tuple: (지형 버전, 지형 색, 표면, 표면 위쪽 Y). 그릴 것이 없으면 표면은 None
+        """
+        plat_color, plat_border, spike_color, sea_color = colors
+        left = column * CHUNK_WIDTH
+        right = left + CHUNK_WIDTH
+        area = pygame.Rect(left, 0, CHUNK_WIDTH, SCREEN_HEIGHT)
+
+        def in_chunk(rects):
+            return [r for r in rects if r.right > left and r.left < right]
+
+        platforms = entity_manager.platforms_near(
+            area, margin=0, max_layer=PLATFORM_STATIC
+        )
+        springs = in_chunk(entity_manager.springs)
+        spikes = in_chunk(entity_manager.spikes)
+        corals = in_chunk(entity_manager.corals)
+        seas = in_chunk(entity_manager.seas)
+
+        # 지형이 있는 높이만큼만 표면을 만듦
+        everything = platforms + springs + spikes + corals + seas
+        if not everything:
+            return version, colors, None, 0
+        top = max(0, min(r.top for r in everything))
+        bottom = min(SCREEN_HEIGHT, max(r.bottom for r in everything))
+        if bottom <= top:
+            return version, colors, None, 0
+
+        surface = pygame.Surface((CHUNK_WIDTH, bottom - top), 0, self.screen)
+        surface.fill(TERRAIN_COLORKEY)
+        surface.set_colorkey(TERRAIN_COLORKEY, pygame.RLEACCEL)
+
+        # render_all에서 그리던 순서 그대로 (플랫폼 -> 스프링 -> 가시 -> 산호 -> 바다)
+        for p in platforms:
+            shifted = p.move(-left, -top)
+            pygame.draw.rect(surface, plat_color, shifted)
+            if plat_border:
+                pygame.draw.rect(surface, plat_border, shifted, 2)
+        for s in springs:
+            pygame.draw.rect(surface, GREEN, s.move(-left, -top))
+        for g in spikes:
+            x, y = g.x - left, g.y - top
+            w, h = g.width, g.height
+            points = [(x, y + h), (x + w // 2, y), (x + w, y + h)]
+            pygame.draw.polygon(surface, spike_color, points)
+        for c in corals:
+            pygame.draw.rect(surface, CORAL, c.move(-left, -top))
+        for w in seas:
+            pygame.draw.rect(surface, sea_color, w.move(-left, -top))
+        return version, colors, surface, top
 
     def draw_background(self, camera_x, current_world=1):
-        """그라데이션 배경을 그립니다"""
+        """
+        그라데이션 배경을 그립니다.
+
+        배경은 월드 테마별로 한 번만 그려 둔 표면을 통째로 붙입니다.
+        월드 2의 그리드는 배경에 함께 그려 두고 카메라 위치만큼 밀어서 붙입니다.
+        """
+        background = self._background_surface(current_world)
         if current_world >= 2:
+            # 그리드는 카메라 이동에 따라 움직임
+            offset_x = int(camera_x % BACKGROUND_GRID_SIZE)
+            self.screen.blit(background, (-offset_x, 0))
+        else:
+            self.screen.blit(background, (0, 0))
+
+    def _background_surface(self, current_world):
+        """
+        현재 월드 테마의 배경 표면을 반환합니다 (없으면 새로 그림).
+
+        그라데이션은 가로로 같으므로, 월드 2는 그리드 한 칸만큼 넓게 그려 두고
+        스크롤할 때 왼쪽으로 밀어서 사용합니다.
+        """
+        theme = "cyber" if current_world >= 2 else "sky"
+        width, height = self.screen.get_size()
+        key = (theme, width, height)
+        if self._background_key == key:
+            return self._background
+
+        if theme == "cyber":
             # 월드 2: 네온 사이버 (어두운 보라 -> 더 어두운 보라)
             top_color = CYBER_PURPLE_TOP
             bottom_color = CYBER_PURPLE_BOT
+            width += BACKGROUND_GRID_SIZE
         else:
             # 월드 1: 맑은 하늘
             top_color = (135, 206, 235)
             bottom_color = (200, 230, 255)
 
-        for y in range(SCREEN_HEIGHT):
-            # 선형 보간 (성능 최적화를 위해 캐싱하거나 통이미지로 하는게 낫지만 일단 유지)
-            ratio = y / SCREEN_HEIGHT
+        surface = pygame.Surface((width, height), 0, self.screen)
+        for y in range(height):
+            # 선형 보간
+            ratio = y / height
             r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
             g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
             b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
 
-        # 월드 2 배경 그리드 효과 (선택)
-        if current_world >= 2:
+        # 월드 2 배경 그리드 효과
+        if theme == "cyber":
             grid_color = (40, 20, 60)
-            # 수직선 (카메라 이동에 따라 움직임)
-            offset_x = int(camera_x % 100)
-            for x in range(-offset_x, SCREEN_WIDTH, 100):
-                pygame.draw.line(self.screen, grid_color, (x, 0), (x, SCREEN_HEIGHT))
+            for x in range(0, width, BACKGROUND_GRID_SIZE):
+                pygame.draw.line(surface, grid_color, (x, 0), (x, height))
             # 수평선 (원근감 없이 단순)
-            for y in range(0, SCREEN_HEIGHT, 100):
-                pygame.draw.line(self.screen, grid_color, (0, y), (SCREEN_WIDTH, y))
+            for y in range(0, height, BACKGROUND_GRID_SIZE):
+                pygame.draw.line(surface, grid_color, (0, y), (width, y))
 
-    # ... (draw_health_bar, draw_heart 생략 - 변경 없음)
+        self._background = surface
+        self._background_key = key
+        return surface
 
     def draw_hud(self, score, coins, time_left, players, current_world=1):
         """
         슈퍼 마리오 스타일 HUD를 그립니다.
-        """
-        # ... (라벨 그리기 생략)
-        labels = [("MARIO", 50), ("COINS", 250), ("WORLD", 450), ("TIME", 650)]
-        for text, x in labels:
-            label_surf = self.hud_font.render(text, True, (255, 255, 255))
-            self.screen.blit(label_surf, (x, 10))
-
-        # 값 표시
-        score_text = f"{score:06d}"
-        score_surf = self.font.render(score_text, True, (255, 255, 255))
-        self.screen.blit(score_surf, (50, 35))
-
-        coin_text = f"x {coins:02d}"
-        coin_surf = self.font.render(coin_text, True, (255, 255, 255))
-        self.screen.blit(coin_surf, (250, 35))
 
-        # 월드 표시 업데이트
-        world_text = f"{current_world}-1"
-        world_surf = self.font.render(world_text, True, (255, 255, 255))
-        self.screen.blit(world_surf, (450 + 10, 35))
-
-        # 시간
-        time_text = f"{max(0, int(time_left)):03d}"
-        time_surf = self.font.render(time_text, True, (255, 255, 255))
-        self.screen.blit(time_surf, (650 + 10, 35))
-
-        if len(players) > 0:
-            self.draw_health_bar(players[0].health, is_p1=True)
-        if len(players) > 1:
-            self.draw_health_bar(players[1].health, is_p1=False)
+        값이 바뀌지 않은 프레임에는 캐시해 둔 HUD 패널을 붙이기만 합니다 (hud.Hud).
+        """
+        self._dirty.extend(
+            self.hud.draw(self.screen, score, coins, time_left, players, current_world)
+        )
 
     def render_all(
         self,
@@ -215,31 +353,55 @@ class Renderer:
     ):
         """
         모든 게임 요소를 렌더링합니다.
+
+        엔티티는 EntityManager의 화면 컬링 인덱스로 카메라 화면에 걸친 것만
+        골라 그리므로, 그리는 비용이 월드 크기가 아니라 화면 내용에 비례합니다.
+        같은 스프라이트를 쓰는 엔티티는 종류별로 모아 한 번에 붙입니다.
+        그린 호출 수(모아 붙인 묶음은 1)는 draw_calls에 남습니다.
+
+        RENDER_MODE가 "dirty"이고 카메라와 보이는 지형이 지난 프레임과 같으면
+        배경과 지형을 다시 그리지 않고, 지난 프레임에 움직이는 것을 그린 자리만
+        배경+지형 레이어로 되돌린 뒤 그 위에 다시 그립니다 (present 참고).
         """
-        # 0. 배경
-        self.draw_background(camera_x, current_world)
+        # 이번 프레임에 배경/지형 위에 그린 화면 영역 (지난 프레임 것은 _prev_dirty)
+        self._prev_dirty, self._dirty = self._dirty, self._prev_dirty
+        dirty = self._dirty
+        dirty.clear()
+
+        # 0. 배경과 정적 지형
+        terrain_colors = self.terrain_colors(current_world)
+        self.draw_calls = 0
+        self._still = False
+        if self.mode == "dirty":
+            self._draw_static_layer(entity_manager, camera_x, current_world)
+        else:
+            self.draw_background(camera_x, current_world)
+            self.draw_terrain(entity_manager, camera_x, terrain_colors)
+        self.draw_calls += 1
+        left = camera_x
+        right = camera_x + SCREEN_WIDTH
+        visible = self._visible
+
+        def on_screen(rect):
+            return rect.right > left and rect.left < right
 
         # 테마 색상 설정
+        plat_border = terrain_colors[1]
         if current_world >= 2:
-            plat_color = NEON_BLACK
-            plat_border = NEON_GREEN
             moving_plat_color = NEON_BLACK
             vp_color = NEON_BLACK
             fragile_color = (60, 30, 30)
-            spike_color = NEON_PINK
         else:
-            plat_color = GRAY
-            plat_border = None
             moving_plat_color = DARK
             vp_color = DARK
             fragile_color = BROWN
-            spike_color = ORANGE
 
         # 1. 깃발 (Finish Line) - 기둥과 깃발
-        for f in entity_manager.flags:
+        for f in entity_manager.visible("flags", left, right, visible):
+            self.draw_calls += 2
             # 기둥
             pole_color = (200, 200, 200) if current_world < 2 else (100, 255, 255)
-            self.draw_rect_with_camera(f, pole_color, camera_x)
+            dirty.append(self.draw_rect_with_camera(f, pole_color, camera_x))
             # 깃발 (삼각형)
             tri_points = [
                 (f.x - camera_x, f.y + 20),
@@ -247,93 +409,167 @@ class Renderer:
                 (f.x - camera_x, f.y + 50),
             ]
             flag_color = (255, 50, 50) if current_world < 2 else NEON_GREEN
-            pygame.draw.polygon(self.screen, flag_color, tri_points)
-
-        # 2. 플랫폼들
-        for p in entity_manager.platforms:
-            self.draw_rect_with_camera(p, plat_color, camera_x, plat_border)
-
-        for mp in entity_manager.moving_platforms:
-            self.draw_rect_with_camera(
-                mp["rect"], moving_plat_color, camera_x, plat_border
-            )
-
-        for vp in entity_manager.vertical_platforms:
-            self.draw_rect_with_camera(vp["rect"], vp_color, camera_x, plat_border)
-
-        for fp in entity_manager.fragile_platforms:
-            self.draw_rect_with_camera(fp["rect"], fragile_color, camera_x, plat_border)
-
-        # 3. 객체들
-        for s in entity_manager.springs:
-            self.draw_rect_with_camera(s, GREEN, camera_x)
-
-        for g in entity_manager.spikes:
-            self.draw_spike_with_camera(g, spike_color, camera_x)
-
-        for c in entity_manager.corals:
-            self.draw_rect_with_camera(c, CORAL, camera_x)
-
-        for w in entity_manager.seas:
-            # 바다는 반투명 처리가 안되어 있어서 일단 그대로 그림
-            # 월드 2에서는 물 색도 바꾸면 좋겠지만 일단 기존 유지 또는 약간 어둡게
-            sea_c = SEA if current_world < 2 else (0, 0, 100)
-            self.draw_rect_with_camera(w, sea_c, camera_x)
+            dirty.append(pygame.draw.polygon(self.screen, flag_color, tri_points))
+
+        # 2. 움직이거나 부서지는 플랫폼들
+        for name, color in (
+            ("moving_platforms", moving_plat_color),
+            ("vertical_platforms", vp_color),
+            ("fragile_platforms", fragile_color),
+        ):
+            for plat in entity_manager.visible(name, left, right, visible):
+                if on_screen(plat.rect):
+                    dirty.append(
+                        self.draw_rect_with_camera(
+                            plat.rect, color, camera_x, plat_border
+                        )
+                    )
+                    self.draw_calls += 2 if plat_border else 1
+
+        # 물결은 시간에 따라 움직이므로 매 프레임 그림
+        for w in entity_manager.visible("seas", left, right, visible):
             self.draw_wave(w, camera_x)
 
-        # 4. 스프라이트 엔티티 (적, 아이템 등)
-        # ... (이하 동일, 적 이미지는 그대로 사용) ...
+        # 3. 스프라이트 엔티티 (적, 아이템 등) - 종류별로 모아서 붙임
         # (만약 적 색상도 바꾸고 싶다면 스프라이트 재생성이 필요하지만 여기선 생략)
-
-        for e in entity_manager.enemies:
-            if e["alive"]:
-                self.screen.blit(self.enemy_img, (e["rect"].x - camera_x, e["rect"].y))
-
-        for f in entity_manager.fish_enemies:
-            if f["alive"]:
-                self.screen.blit(self.fish_img, (f["rect"].x - camera_x, f["rect"].y))
-
-        for t in entity_manager.turtle_enemies:
-            if t["alive"]:
-                self.screen.blit(self.turtle_img, (t["rect"].x - camera_x, t["rect"].y))
-
-        for j in entity_manager.jellies:
-            if j["alive"]:
+        batch = self._batch
+
+        def blit_visible(name, image):
+            batch.clear()
+            for e in entity_manager.visible(name, left, right, visible):
+                if e.alive and on_screen(e.rect):
+                    batch.append((image, (e.rect.x - camera_x, e.rect.y)))
+            self._blit_batch(batch)
+
+        blit_visible("enemies", self.enemy_img)
+        blit_visible("fish_enemies", self.fish_img)
+        blit_visible("turtle_enemies", self.turtle_img)
+
+        for j in entity_manager.visible("jellies", left, right, visible):
+            if j.alive and on_screen(j.rect):
+                self.draw_calls += 1
                 color = JELLY if current_world < 2 else (200, 100, 255)
-                pygame.draw.ellipse(
-                    self.screen,
-                    color,
-                    (
-                        j["rect"].x - camera_x,
-                        j["rect"].y,
-                        j["rect"].width,
-                        j["rect"].height,
-                    ),
+                dirty.append(
+                    pygame.draw.ellipse(
+                        self.screen,
+                        color,
+                        (
+                            j.rect.x - camera_x,
+                            j.rect.y,
+                            j.rect.width,
+                            j.rect.height,
+                        ),
+                    )
                 )
 
-        for m in entity_manager.mushrooms:
-            if m["alive"]:
-                self.screen.blit(
-                    self.mushroom_img, (m["rect"].x - camera_x, m["rect"].y)
-                )
+        blit_visible("mushrooms", self.mushroom_img)
 
+        # 불똥은 발사할 때만 잠깐 생기므로 인덱스 없이 화면 안만 확인
+        batch.clear()
         for fb in entity_manager.fireballs:
-            if fb["alive"]:
-                self.screen.blit(
-                    self.fireball_img, (fb["rect"].x - camera_x, fb["rect"].y)
+            if fb.alive and on_screen(fb.rect):
+                batch.append((self.fireball_img, (fb.rect.x - camera_x, fb.rect.y)))
+        self._blit_batch(batch)
+
+        for c in entity_manager.visible("coins", left, right, visible):
+            if on_screen(c):
+                center_pos = (c.centerx - camera_x, c.centery)
+                dirty.append(
+                    pygame.draw.circle(self.screen, GOLD, center_pos, c.width // 2)
                 )
+                self.draw_calls += 1
 
-        for c in entity_manager.coins:
-            center_pos = (c.centerx - camera_x, c.centery)
-            pygame.draw.circle(self.screen, GOLD, center_pos, c.width // 2)
-
-        for car in entity_manager.cars:
-            if car["alive"]:
-                self.screen.blit(
-                    self.car_img, (car["rect"].x - camera_x, car["rect"].y)
-                )
+        blit_visible("cars", self.car_img)
 
         for p in players:
-            p.draw(self.screen, camera_x)
+            dirty.append(p.draw(self.screen, camera_x))
+        self.draw_calls += len(players)
 
         self.draw_hud(score, coins, time_left, players, current_world)
+
+    def _blit_batch(self, batch):
+        """
+        (표면, 위치) 묶음을 한 번에 화면에 붙입니다.
+
+        dirty 모드에서는 붙인 영역이 필요하므로 blits로, 아니면 영역을 돌려받지
+        않는 fblits(pygame 2.6+, 없으면 blits)로 붙입니다.
+        """
+        if not batch:
+            return
+        if self.mode == "dirty":
+            self._dirty.extend(self.screen.blits(batch))
+        elif hasattr(self.screen, "fblits"):
+            self.screen.fblits(batch)
+        else:
+            self.screen.blits(batch, False)
+        self.draw_calls += 1
+
+    def _draw_static_layer(self, entity_manager, camera_x, current_world):
+        """
+        dirty 모드의 배경과 정적 지형을 그립니다.
+
+        카메라 위치, 월드, 화면에 걸친 청크의 지형 버전이 지난 프레임과 다르면
+        full 모드처럼 화면에 바로 그립니다. 같으면(_still) 지난 프레임에 움직이는
+        것을 그린 자리만 배경+지형 레이어에서 되돌립니다. 레이어는 카메라가 멈춘
+        첫 프레임에 그려서 화면 전체에 붙입니다.
+        """
+        versions = entity_manager.terrain_versions
+        first = int(camera_x) // CHUNK_WIDTH
+        last = int(camera_x + SCREEN_WIDTH) // CHUNK_WIDTH
+        key = (
+            camera_x,
+            current_world,
+            entity_manager,
+            tuple(versions.get(c) for c in range(first, last + 1)),
+        )
+        if key != self._last_key:
+            self._last_key = key
+            self.draw_background(camera_x, current_world)
+            self.draw_terrain(
+                entity_manager, camera_x, self.terrain_colors(current_world)
+            )
+            return
+
+        self._still = True
+        if key == self._static_key:
+            screen_rect = self.screen.get_rect()
+            static = self._static
+            self.screen.blits(
+                [(static, r, r) for r in map(screen_rect.clip, self._prev_dirty)],
+                False,
+            )
+            return
+
+        if self._static is None or self._static.get_size() != self.screen.get_size():
+            self._static = self.screen.copy()
+        # 배경과 지형을 레이어에 그리도록 잠시 화면을 바꿔 끼움
+        screen, self.screen = self.screen, self._static
+        try:
+            self.draw_background(camera_x, current_world)
+            self.draw_terrain(
+                entity_manager, camera_x, self.terrain_colors(current_world)
+            )
+        finally:
+            self.screen = screen
+        self.screen.blit(self._static, (0, 0))
+        self._static_key = key
+
+    def mark_dirty(self, rect):
+        """
+        render_all 밖에서 화면에 그린 영역을 알려 줍니다 (프로파일러 오버레이 등).
+        dirty 모드에서 다음 프레임에 이 자리도 배경으로 되돌리고 내보냅니다.
+        """
+        self._dirty.append(rect)
+
+    def present(self):
+        """
+        그린 화면을 창에 내보냅니다.
+
+        dirty 모드에서 배경을 되돌려 그린 프레임(카메라가 멈춰 있던 프레임)은
+        지난 프레임과 이번 프레임에 움직이는 것을 그린 영역만 display.update로
+        내보내고, 그 밖에는 display.flip으로 화면 전체를 내보냅니다.
+        """
+        if self._still:
+            pygame.display.update(self._prev_dirty + self._dirty)
+        else:
+            pygame.display.flip()
@@ -0,0 +1,291 @@
+"""
+입력 기록과 결정론적 재생
+
+게임 상태는 월드 시드와 시뮬레이션 스텝마다 읽은 키 입력만으로 정해지므로
+(레벨 생성과 적의 난수는 시드로, 남은 시간은 스텝 수로 셈), 스텝마다
+handle_input이 읽는 키를 비트마스크로 기록해 두면 같은 진행을 그대로 다시
+만들 수 있습니다. 기록할 때와 재생할 때 REPLAY_HASH_INTERVAL 스텝마다 게임
+상태 해시를 계산해서 비교하므로, 재생이 어긋나면 처음 어긋난 스텝을 알 수
+있습니다.
+
+    python game.py --record session.rep        # 플레이하면서 기록
+    python game.py --replay session.rep        # 화면에 그리며 재생
+    python game.py --replay session.rep --headless   # 최대 속도로 검증
+
+기록 파일: 헤더(매직, 버전, 해시 간격, 스텝 수, 시드) 뒤에 스텝별 16비트 키
+마스크와 8바이트 해시들을 zlib으로 압축해 붙입니다.
+"""
+
+import hashlib
+import struct
+import sys
+import zlib
+from array import array
+
+import pygame
+
+from constants import *
+from entities import ENTITY_LISTS
+from headless import KeyState
+
+# handle_input과 Player가 읽는 키 (순서가 비트 번호)
+REPLAY_KEYS = (
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_UP,
+    pygame.K_DOWN,
+    pygame.K_SPACE,
+    pygame.K_LSHIFT,
+    pygame.K_RSHIFT,
+    pygame.K_a,
+    pygame.K_d,
+    pygame.K_w,
+    pygame.K_e,
+    pygame.K_g,
+)
+
+_MAGIC = b"MREP"
+_VERSION = 2  # 2: 해시에 dinos 포함
+# 매직, 버전, 해시 간격, 스텝 수, 시드 글자 길이
+_HEADER = struct.Struct("<4sBHIB")
+_HASH_SIZE = 8
+
+
+class ReplayDivergence(Exception):
+    """재생한 게임 상태가 기록과 다를 때 발생하는 예외"""
+
+    def __init__(self, frame):
+        super().__init__(f"replay diverged at step {frame}")
+        self.frame = frame
+
+
+def key_mask(keys):
+    """키 상태(pygame.key.get_pressed 결과 등)를 REPLAY_KEYS 비트마스크로 바꿉니다"""
+    mask = 0
+    for bit, key in enumerate(REPLAY_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_keys(mask):
+    """비트마스크를 handle_input에 넘길 KeyState로 바꿉니다"""
+    return KeyState(key for bit, key in enumerate(REPLAY_KEYS) if mask >> bit & 1)
+
+
+def state_hash(game):
+    """
+    재생 검증용 게임 상태 해시
+
+    플레이어, 점수/시간/월드, 모든 엔티티의 위치와 생사, 엔티티 난수 상태를
+    담습니다.
+
+    Returns:
+        bytes: 8바이트 해시
+    """
+    h = hashlib.blake2b(digest_size=_HASH_SIZE)
+    for p in game.players:
+        h.update(
+            repr(
+                (
+                    tuple(p.rect),
+                    p.velocity_y,
+                    p.health,
+                    p.is_big,
+                    p.on_car,
+                    p.invincible_timer,
+                )
+            ).encode()
+        )
+    h.update(
+        repr(
+            (
+                game.sim_frame,
+                game.score,
+                game.coins,
+                game.time_left,
+                game.current_world,
+                game.camera_x,
+            )
+        ).encode()
+    )
+    entity_manager = game.entity_manager
+    for name in ENTITY_LISTS:
+        h.update(name.encode())
+        for obj in getattr(entity_manager, name):
+            rect = getattr(obj, "rect", obj)
+            h.update(repr((tuple(rect), getattr(obj, "alive", True))).encode())
+    h.update(repr(entity_manager.rng.getstate()).encode())
+    return h.digest()
+
+
+class Replay:
+    """기록 파일 내용 (시드, 스텝별 키 마스크, 해시)"""
+
+    def __init__(self, seed, interval=REPLAY_HASH_INTERVAL):
+        """
+        Args:
+            seed: 월드 시드
+            interval: 상태 해시를 남기는 스텝 간격
+        """
+        self.seed = seed
+        self.interval = interval
+        self.masks = array("H")
+        # interval, 2 * interval, ... 스텝을 마친 뒤의 상태 해시
+        self.hashes = []
+        # 마지막 스텝을 마친 뒤의 상태 해시
+        self.final_hash = b""
+
+    def __len__(self):
+        return len(self.masks)
+
+    def save(self, path):
+        """기록을 파일로 저장합니다"""
+        seed = str(self.seed).encode()
+        masks = array("H", self.masks)
+        if sys.byteorder == "big":
+            masks.byteswap()
+        body = masks.tobytes() + b"".join(self.hashes) + self.final_hash
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(_MAGIC, _VERSION, self.interval, len(masks), len(seed))
+            )
+            f.write(seed)
+            f.write(zlib.compress(body, 9))
+
+    @classmethod
+    def load(cls, path):
+        """
+        파일에서 기록을 읽습니다.
+
+        Raises:
+            ValueError: 기록 파일 형식이 아니거나 버전이 다른 경우
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, interval, frames, seed_len = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"{path}: 기록 파일이 아닙니다")
+        if version != _VERSION:
+            raise ValueError(f"{path}: 지원하지 않는 기록 파일 버전입니다 ({version})")
+        offset = _HEADER.size
+        replay = cls(int(data[offset : offset + seed_len]), interval)
+        body = zlib.decompress(data[offset + seed_len :])
+
+        replay.masks.frombytes(body[: frames * 2])
+        if sys.byteorder == "big":
+            replay.masks.byteswap()
+        hashes = body[frames * 2 :]
+        replay.final_hash = hashes[-_HASH_SIZE:]
+        replay.hashes = [
+            hashes[i : i + _HASH_SIZE]
+            for i in range(0, len(hashes) - _HASH_SIZE, _HASH_SIZE)
+        ]
+        return replay
+
+
+class InputRecorder:
+    """
+    입력 소스를 감싸서 스텝마다 읽은 키를 기록하는 입력 소스
+
+    Game.simulate_step이 스텝마다 한 번 부르므로, 부를 때의 게임 상태는
+    지금까지 진행한 스텝 수(frame)만큼 진행한 상태입니다.
+    """
+
+    def __init__(self, game, source, interval=REPLAY_HASH_INTERVAL):
+        """
+        Args:
+            game: 기록할 Game 인스턴스
+            source: 실제 입력 소스 (예: pygame.key.get_pressed)
+            interval: 상태 해시를 남기는 스텝 간격
+        """
+        self.game = game
+        self.source = source
+        self.replay = Replay(game.seed, interval)
+        self.frame = 0
+
+    def __call__(self):
+        replay = self.replay
+        if self.frame and self.frame % replay.interval == 0:
+            replay.hashes.append(state_hash(self.game))
+        keys = self.source()
+        replay.masks.append(key_mask(keys))
+        self.frame += 1
+        return keys
+
+    def save(self, path):
+        """지금까지의 기록을 마지막 상태 해시와 함께 저장합니다"""
+        self.replay.final_hash = state_hash(self.game)
+        self.replay.save(path)
+
+
+class ReplayInput:
+    """
+    기록한 키를 스텝마다 그대로 돌려주면서 상태 해시를 비교하는 입력 소스
+
+    기록이 끝나면 마지막 상태 해시를 비교하고 finished를 True로 바꾼 뒤
+    아무 키도 누르지 않은 상태를 돌려주며, 화면 모드에서는 QUIT 이벤트를 넣어
+    Game.run을 끝냅니다.
+    """
+
+    def __init__(self, game, replay, strict=True):
+        """
+        Args:
+            game: 재생할 Game 인스턴스 (replay.seed로 만든 것)
+            replay: Replay
+            strict: True면 해시가 다를 때 ReplayDivergence를 발생시킴
+        """
+        self.game = game
+        self.replay = replay
+        self.strict = strict
+        self.frame = 0
+        self.verified = 0
+        # 처음 어긋난 스텝 (없으면 None)
+        self.diverged_at = None
+        self.finished = False
+
+    def _check(self, expected):
+        if state_hash(self.game) == expected:
+            self.verified += 1
+            return
+        if self.diverged_at is None:
+            self.diverged_at = self.frame
+        if self.strict:
+            raise ReplayDivergence(self.frame)
+
+    def __call__(self):
+        replay = self.replay
+        frame = self.frame
+        if frame >= len(replay):
+            if not self.finished:
+                self.finished = True
+                self._check(replay.final_hash)
+                if not self.game.headless:
+                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+            return KeyState()
+        if frame and frame % replay.interval == 0:
+            self._check(replay.hashes[frame // replay.interval - 1])
+        self.frame += 1
+        return mask_keys(replay.masks[frame])
+
+
+def run_headless(game, replay):
+    """
+    기록을 화면 없이 최대 속도로 재생하고 검증합니다.
+
+    Args:
+        game: Game(headless=True, seed=replay.seed)로 만든 게임
+        replay: Replay
+
+    Returns:
+        ReplayInput: 결과 (verified, diverged_at)
+
+    Raises:
+        ReplayDivergence: 상태 해시가 기록과 다른 경우
+    """
+    source = ReplayInput(game, replay)
+    game.input_source = source
+    game.step(len(replay))
+    # 마지막 스텝 뒤 상태를 비교하도록 한 번 더 읽음
+    source()
+    return source
@@ -0,0 +1,327 @@
+"""
+플랫폼 공간 인덱스 (청크 열 단위 균일 격자)
+"""
+
+import pygame
+from constants import CHUNK_WIDTH
+
+# 플랫폼 층 (query의 max_layer 이하만 후보로 반환)
+PLATFORM_STATIC = 0  # 고정 플랫폼
+PLATFORM_MOVING = 1  # 좌우/수직으로 움직이는 플랫폼
+PLATFORM_FRAGILE = 2  # 부서지는 플랫폼
+
+
+class PlatformGrid:
+    """
+    플랫폼 rect를 x축 청크 열(column) 단위 버킷에 담아 두는 균일 격자
+
+    레벨은 가로로만 길어지므로 x축으로만 나눕니다. 충돌 검사는 물체 주변
+    열에 들어 있는 후보만 받아서 수행하므로, 생성된 구간이 늘어나도
+    프레임당 검사 비용이 일정하게 유지됩니다.
+    """
+
+    def __init__(self, cell_width: int = CHUNK_WIDTH) -> None:
+        """
+        격자 초기화
+
+        Args:
+            cell_width: 열 하나의 가로 길이 (기본값: 청크 너비)
+        """
+        self.cell_width = cell_width
+        # 열 번호 -> {id(rect): (rect, 첫 열, 층)}
+        self._cells: dict[int, dict[int, tuple[pygame.Rect, int, int]]] = {}
+        # id(rect) -> (첫 열, 마지막 열, 층)
+        self._spans: dict[int, tuple[int, int, int]] = {}
+        # id(rect) -> rect (추가된 순서 유지, 전체 플랫폼 뷰)
+        self._rects: dict[int, pygame.Rect] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, rect: pygame.Rect) -> bool:
+        return id(rect) in self._spans
+
+    def _columns(self, left: int, right: int) -> tuple[int, int]:
+        """x 구간 [left, right)가 걸치는 첫 열과 마지막 열"""
+        return left // self.cell_width, (max(right, left + 1) - 1) // self.cell_width
+
+    def rects(self):
+        """
+        격자에 있는 모든 플랫폼의 읽기 전용 뷰를 반환합니다.
+
+        새 리스트를 만들지 않고 내부 dict의 values 뷰를 그대로 돌려주므로,
+        플랫폼이 추가/제거되면 뷰에도 바로 반영됩니다.
+        """
+        return self._rects.values()
+
+    def clear(self) -> None:
+        """모든 플랫폼을 제거합니다"""
+        self._cells.clear()
+        self._spans.clear()
+        self._rects.clear()
+
+    def add(self, rect: pygame.Rect, layer: int = PLATFORM_STATIC) -> None:
+        """
+        플랫폼을 격자에 추가합니다.
+
+        Args:
+            rect: 플랫폼 rect (같은 객체를 계속 갱신해서 사용)
+            layer: 플랫폼 층 (PLATFORM_STATIC / PLATFORM_MOVING / PLATFORM_FRAGILE)
+        """
+        if id(rect) in self._spans:
+            self.remove(rect)
+        self._rects[id(rect)] = rect
+        self._bucket(rect, layer)
+
+    def remove(self, rect: pygame.Rect) -> None:
+        """플랫폼을 격자에서 제거합니다 (없으면 무시)"""
+        if self._rects.pop(id(rect), None) is not None:
+            self._unbucket(rect)
+
+    def update(self, rect: pygame.Rect) -> None:
+        """
+        움직인 플랫폼의 버킷을 갱신합니다.
+
+        걸치는 열이 그대로면 아무것도 하지 않으므로 매 프레임 호출해도 됩니다.
+        """
+        span = self._spans.get(id(rect))
+        if span is None:
+            return
+        first, last = self._columns(rect.left, rect.right)
+        if first != span[0] or last != span[1]:
+            # 열 버킷만 옮기고 전체 뷰의 순서는 그대로 유지
+            self._unbucket(rect)
+            self._bucket(rect, span[2])
+
+    def _bucket(self, rect: pygame.Rect, layer: int) -> None:
+        """rect가 걸치는 모든 열 버킷에 등록합니다"""
+        key = id(rect)
+        first, last = self._columns(rect.left, rect.right)
+        self._spans[key] = (first, last, layer)
+        entry = (rect, first, layer)
+        for column in range(first, last + 1):
+            self._cells.setdefault(column, {})[key] = entry
+
+    def _unbucket(self, rect: pygame.Rect) -> None:
+        """등록 당시의 열 버킷에서 rect를 뺍니다"""
+        key = id(rect)
+        first, last, _ = self._spans.pop(key)
+        for column in range(first, last + 1):
+            cell = self._cells.get(column)
+            if cell is None:
+                continue
+            cell.pop(key, None)
+            if not cell:
+                del self._cells[column]
+
+    def drop_before(self, column: int, layer: int = PLATFORM_STATIC) -> list:
+        """
+        layer 층 플랫폼 중 마지막 열이 column보다 왼쪽인 것을 모두 빼서 반환합니다.
+
+        column 왼쪽 열의 버킷만 보므로, 비용이 빠지는 열에 든 플랫폼 수에
+        비례합니다 (다른 층 플랫폼은 각자의 엔티티 인덱스로 정리).
+
+        Args:
+            column: 이 열부터는 남길 첫 열 번호
+            layer: 뺄 플랫폼 층
+
+        Returns:
+            list[pygame.Rect]: 뺀 플랫폼 (추가된 순서와 무관)
+        """
+        dropped = []
+        for c in sorted(c for c in self._cells if c < column):
+            cell = self._cells.get(c)
+            if not cell:
+                continue
+            for key, (rect, _, rect_layer) in list(cell.items()):
+                if rect_layer == layer and self._spans[key][1] < column:
+                    dropped.append(rect)
+                    self.remove(rect)
+        return dropped
+
+    def query(
+        self,
+        rect: pygame.Rect,
+        margin: int = 0,
+        max_layer: int = PLATFORM_FRAGILE,
+        out: list[pygame.Rect] | None = None,
+    ) -> list[pygame.Rect]:
+        """
+        rect 주변 열에 있는 플랫폼 후보를 반환합니다.
+
+        Args:
+            rect: 검사할 물체의 rect
+            margin: 좌우로 넓혀서 볼 여유 (이번 프레임 이동량)
+            max_layer: 포함할 최대 플랫폼 층
+            out: 결과를 담을 재사용 리스트 (비운 뒤 채움). None이면 새로 만듦
+
+        Returns:
+            list[pygame.Rect]: 충돌 후보 플랫폼 (중복 없음)
+        """
+        first, last = self._columns(rect.left - margin, rect.right + margin)
+        if out is None:
+            found = []
+        else:
+            found = out
+            found.clear()
+        for column in range(first, last + 1):
+            cell = self._cells.get(column)
+            if not cell:
+                continue
+            for p, p_first, layer in cell.values():
+                if layer > max_layer:
+                    continue
+                # 여러 열에 걸친 플랫폼은 처음 만나는 열에서만 반환
+                if column > first and p_first < column:
+                    continue
+                found.append(p)
+        return found
+
+
+class RenderIndex:
+    """
+    화면 컬링용 x 구간 인덱스 (청크 열 단위 버킷)
+
+    객체가 그려질 수 있는 x 구간이 걸치는 열에 객체를 담아 두고, 카메라
+    화면이 걸치는 열의 객체만 돌려줍니다. 순찰 구간이 정해진 엔티티는 구간
+    전체로 한 번만 등록하고, 자유롭게 움직이는 엔티티는 움직인 뒤 update로
+    옮깁니다. 그리는 비용이 월드 크기가 아니라 화면에 보이는 양에 비례합니다.
+    """
+
+    def __init__(self, cell_width: int = CHUNK_WIDTH) -> None:
+        """
+        인덱스 초기화
+
+        Args:
+            cell_width: 열 하나의 가로 길이 (기본값: 청크 너비)
+        """
+        self.cell_width = cell_width
+        # 열 번호 -> {id(객체): (객체, 첫 열)}
+        self._cells: dict[int, dict[int, tuple[object, int]]] = {}
+        # id(객체) -> (첫 열, 마지막 열)
+        self._spans: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, obj: object) -> bool:
+        return id(obj) in self._spans
+
+    def _columns(self, left: int, right: int) -> tuple[int, int]:
+        """x 구간 [left, right)가 걸치는 첫 열과 마지막 열"""
+        return left // self.cell_width, (max(right, left + 1) - 1) // self.cell_width
+
+    def clear(self) -> None:
+        """모든 객체를 제거합니다"""
+        self._cells.clear()
+        self._spans.clear()
+
+    def add(self, obj: object, left: int, right: int) -> None:
+        """
+        객체를 x 구간 [left, right)로 등록합니다 (이미 있으면 구간만 바꿈).
+
+        Args:
+            obj: 등록할 객체
+            left: 그려질 수 있는 가장 왼쪽 X
+            right: 그려질 수 있는 가장 오른쪽 X
+        """
+        if id(obj) in self._spans:
+            self.update(obj, left, right)
+        else:
+            self._bucket(obj, *self._columns(left, right))
+
+    def update(self, obj: object, left: int, right: int) -> None:
+        """
+        움직인 객체의 버킷을 갱신합니다.
+
+        걸치는 열이 그대로면 아무것도 하지 않으므로 매 프레임 호출해도 됩니다.
+        등록되지 않은 객체는 무시합니다.
+        """
+        span = self._spans.get(id(obj))
+        if span is None:
+            return
+        columns = self._columns(left, right)
+        if columns != span:
+            self._unbucket(obj)
+            self._bucket(obj, *columns)
+
+    def remove(self, obj: object) -> None:
+        """객체를 제거합니다 (없으면 무시)"""
+        if id(obj) in self._spans:
+            self._unbucket(obj)
+
+    def _bucket(self, obj: object, first: int, last: int) -> None:
+        """객체를 first~last 열 버킷에 등록합니다"""
+        key = id(obj)
+        self._spans[key] = (first, last)
+        entry = (obj, first)
+        for column in range(first, last + 1):
+            self._cells.setdefault(column, {})[key] = entry
+
+    def _unbucket(self, obj: object) -> None:
+        """등록 당시의 열 버킷에서 객체를 뺍니다"""
+        key = id(obj)
+        first, last = self._spans.pop(key)
+        for column in range(first, last + 1):
+            cell = self._cells.get(column)
+            if cell is None:
+                continue
+            cell.pop(key, None)
+            if not cell:
+                del self._cells[column]
+
+    def drop_before(self, column: int) -> list:
+        """
+        마지막 열이 column보다 왼쪽인 객체를 모두 빼서 반환합니다.
+
+        column 왼쪽 열의 버킷만 보므로, 비용이 빠지는 열에 든 객체 수에
+        비례합니다. 움직이는 객체는 update로 버킷이 옮겨져 있어야 합니다.
+
+        Args:
+            column: 이 열부터는 남길 첫 열 번호
+
+        Returns:
+            list: 뺀 객체 (추가된 순서와 무관)
+        """
+        dropped = []
+        for c in sorted(c for c in self._cells if c < column):
+            cell = self._cells.get(c)
+            if not cell:
+                continue
+            for key, (obj, _) in list(cell.items()):
+                if self._spans[key][1] < column:
+                    dropped.append(obj)
+                    self._unbucket(obj)
+        return dropped
+
+    def query(self, left: float, right: float, out: list | None = None) -> list:
+        """
+        x 구간 [left, right)가 걸치는 열에 있는 객체를 반환합니다.
+
+        열 단위로 고르므로 구간 밖의 객체가 섞일 수 있습니다.
+        그리기 직전에 rect로 한 번 더 확인하세요.
+
+        Args:
+            left: 화면 왼쪽 X
+            right: 화면 오른쪽 X
+            out: 결과를 담을 재사용 리스트 (비운 뒤 채움). None이면 새로 만듦
+
+        Returns:
+            list: 후보 객체 (중복 없음)
+        """
+        first, last = self._columns(int(left), int(right) + 1)
+        if out is None:
+            found = []
+        else:
+            found = out
+            found.clear()
+        for column in range(first, last + 1):
+            cell = self._cells.get(column)
+            if not cell:
+                continue
+            for obj, obj_first in cell.values():
+                # 여러 열에 걸친 객체는 처음 만나는 열에서만 반환
+                if column > first and obj_first < column:
+                    continue
+                found.append(obj)
+        return found
@@ -189,3 +189,112 @@ def make_car_sprite(w: int, h: int) -> pygame.Surface:
     pygame.draw.rect(s, (255, 255, 100), (w - 6, h // 2, 4, 4))
 
     return s
+
+
+def make_heart_sprite(filled: bool = True) -> pygame.Surface:
+    """
+    체력 하트 스프라이트를 생성합니다 (24x24, 하트 중심이 표면 중심).
+
+    Args:
+        filled: 채워진 하트인지 여부 (False면 빈 하트)
+
+    Returns:
+        pygame.Surface: 생성된 하트 스프라이트
+    """
+    s = pygame.Surface((24, 24), pygame.SRCALPHA)
+    heart_color = (255, 50, 50) if filled else (100, 100, 100)
+    outline_color = (200, 30, 30) if filled else (80, 80, 80)
+
+    # 하트 좌표 (크기: 약 20x20)
+    x, y = 12, 12
+    scale = 1.2
+    points = [
+        (x, y + 8 * scale),  # 아래 중앙
+        (x - 8 * scale, y),  # 왼쪽 위
+        (x - 8 * scale, y - 4 * scale),  # 왼쪽 상단
+        (x - 4 * scale, y - 8 * scale),  # 왼쪽 꼭대기
+        (x, y - 6 * scale),  # 중앙 상단
+        (x + 4 * scale, y - 8 * scale),  # 오른쪽 꼭대기
+        (x + 8 * scale, y - 4 * scale),  # 오른쪽 상단
+        (x + 8 * scale, y),  # 오른쪽 위
+    ]
+    if filled:
+        pygame.draw.polygon(s, heart_color, points)
+    pygame.draw.polygon(s, outline_color, points, 3)
+    return s
+
+
+# 스프라이트 종류 -> (가로, 세로, 색)으로 표면을 만드는 함수
+_SPRITE_BUILDERS = {
+    "player": make_player_sprite,
+    "enemy": lambda w, h, color: make_enemy_sprite(w, h),
+    "mushroom": lambda w, h, color: make_mushroom_sprite(w, h),
+    "fish": lambda w, h, color: make_fish_sprite(w, h),
+    "turtle": lambda w, h, color: make_turtle_sprite(w, h),
+    "fireball": lambda w, h, color: make_fireball_sprite(w // 2),
+    "car": lambda w, h, color: make_car_sprite(w, h),
+}
+
+
+class SpriteCache:
+    """
+    (종류, 크기, 색) -> 스프라이트 표면 캐시
+
+    같은 스프라이트는 한 번만 그리고, 화면(set_mode)이 있으면 바로
+    convert_alpha()로 화면 픽셀 형식에 맞춰 둡니다. 화면이 생기기 전에 만든
+    표면은 convert()를 부를 때 한꺼번에 바꿉니다. 표면은 여러 곳(렌더러,
+    플레이어)이 함께 쓰므로 받은 쪽에서 고쳐 그리면 안 됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._surfaces: dict[tuple, pygame.Surface] = {}
+        # 아직 화면 픽셀 형식으로 바꾸지 않은 키
+        self._pending: set[tuple] = set()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(
+        self,
+        kind: str,
+        size: tuple[int, int],
+        color: tuple[int, int, int] | None = None,
+    ) -> pygame.Surface:
+        """
+        스프라이트를 캐시에서 꺼냅니다 (없으면 그려서 넣음).
+
+        Args:
+            kind: 스프라이트 종류 ("player", "enemy", "fireball" 등)
+            size: (가로, 세로) 크기
+            color: 색상 (플레이어처럼 색이 바뀌는 종류만)
+
+        Returns:
+            pygame.Surface: 공유되는 스프라이트 표면
+        """
+        key = (kind, tuple(size), color)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = _SPRITE_BUILDERS[kind](*key[1], color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            else:
+                self._pending.add(key)
+            self._surfaces[key] = surface
+        return surface
+
+    def convert(self) -> None:
+        """화면이 생기기 전에 만든 표면을 화면 픽셀 형식으로 바꿉니다 (set_mode 뒤에 호출)"""
+        if pygame.display.get_surface() is None:
+            return
+        for key in self._pending:
+            self._surfaces[key] = self._surfaces[key].convert_alpha()
+        self._pending.clear()
+
+    def clear(self) -> None:
+        """캐시를 비웁니다"""
+        self._surfaces.clear()
+        self._pending.clear()
+
+
+# 렌더러와 플레이어가 함께 쓰는 스프라이트 캐시
+sprite_cache = SpriteCache()
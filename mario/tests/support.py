@@ -0,0 +1,33 @@
+"""
+테스트 공용 도우미 (테스트 모듈은 pygame보다 먼저 이 모듈을 import합니다)
+
+    python -m unittest discover tests
+"""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+from game import Game
+
+SEED = 11
+
+
+def make_game(patrol_backend=None, seed=SEED, input_source=None):
+    """
+    창 없이 도는 테스트용 게임을 만듭니다.
+
+    Args:
+        patrol_backend: 순찰형 엔티티 업데이트 방식 (기본값: constants.PATROL_BACKEND)
+        seed: 월드 시드
+        input_source: 키 상태를 반환하는 함수 (기본값: 아무 키도 누르지 않음)
+
+    Returns:
+        Game: 헤드리스 게임
+    """
+    return Game(
+        headless=True,
+        input_source=input_source,
+        seed=seed,
+        patrol_backend=patrol_backend,
+    )
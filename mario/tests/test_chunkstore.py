@@ -0,0 +1,70 @@
+"""버린 청크 열을 보관소에 넣었다가 되살리는 왕복을 두 순찰 백엔드에서 확인합니다"""
+
+import unittest
+
+from support import make_game
+
+from constants import CHUNK_WIDTH
+from entities import _STORE_SPANS
+from patrol import NUMPY_AVAILABLE
+
+DROP_COLUMN = 6
+
+
+def _summary(lists):
+    """리스트 이름 -> 엔티티 묶음의 살아 있는 엔티티 (리스트 이름, rect) 목록"""
+    return sorted(
+        (name, tuple(getattr(obj, "rect", obj)))
+        for name, objs in lists.items()
+        for obj in objs
+        if getattr(obj, "alive", True)
+    )
+
+
+def _living(entity_manager):
+    return _summary({name: getattr(entity_manager, name) for name in _STORE_SPANS})
+
+
+def _round_trip(patrol_backend):
+    """
+    DROP_COLUMN 왼쪽을 버렸다가 되살립니다.
+
+    Returns:
+        tuple: (버리기 전 엔티티, 보관소 열 -> 엔티티, 되살린 뒤 엔티티)
+    """
+    g = make_game(patrol_backend)
+    entity_manager = g.entity_manager
+    for _ in range(DROP_COLUMN + 4):
+        g.level_generator.generate_next_chunk()
+    g.step(120)
+
+    before = _living(entity_manager)
+    entity_manager.cleanup_offscreen(DROP_COLUMN * CHUNK_WIDTH)
+    store = entity_manager.chunk_store
+    stored = {}
+    for column in range(DROP_COLUMN):
+        items = store.pop(column)
+        if items:
+            stored[column] = _summary(items)
+            store.put(column, items)
+    entity_manager.cleanup_offscreen(0)
+    return before, stored, _living(entity_manager)
+
+
+class ChunkStoreRoundTripTest(unittest.TestCase):
+    def test_python_backend_round_trip(self):
+        before, stored, after = _round_trip("python")
+        self.assertTrue(stored)
+        self.assertEqual(before, after)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy가 설치되어 있지 않습니다")
+    def test_numpy_backend_stores_the_same_columns(self):
+        python_before, python_stored, _ = _round_trip("python")
+        before, stored, after = _round_trip("numpy")
+        self.assertEqual(before, after)
+        self.assertEqual(python_before, before)
+        self.assertEqual(python_stored, stored)
+
+
+if __name__ == "__main__":
+    unittest.main()
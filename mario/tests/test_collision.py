@@ -0,0 +1,49 @@
+"""후보 검색 여유(PLATFORM_QUERY_MARGIN)보다 크게 움직여도 벽에서 멈추는지 확인합니다"""
+
+import unittest
+
+from support import make_game
+
+import pygame
+
+from constants import CHUNK_WIDTH, GROUND_TOP_Y, PLATFORM_QUERY_MARGIN
+from entities import EntityManager
+from models import Enemy
+
+# 여유보다 큰 한 프레임 이동량
+FAST = PLATFORM_QUERY_MARGIN + 28
+# 첫 청크 열 경계 바로 오른쪽의 벽 (여유만큼 넓혀 찾아도 다음 열은 안 보이는 위치에서 출발)
+WALL = pygame.Rect(CHUNK_WIDTH, GROUND_TOP_Y - 200, 20, 200)
+START_RIGHT = CHUNK_WIDTH - PLATFORM_QUERY_MARGIN - 8
+
+
+class FastMoveTest(unittest.TestCase):
+    def test_player_stops_at_wall_beyond_margin(self):
+        game = make_game(seed=1)
+        game.entity_manager.add_platform(WALL.copy())
+        player = game.players[0]
+        player.speed = FAST
+        player.rect.right = START_RIGHT
+        player.rect.bottom = GROUND_TOP_Y
+
+        idle = (0, False, False, False, False)
+        game.update_players([(1, False, False, False, False), idle], None)
+
+        self.assertEqual(player.rect.right, WALL.left)
+
+    def test_enemy_stops_at_wall_beyond_margin(self):
+        entity_manager = EntityManager(seed=1)
+        entity_manager.add_platform(WALL.copy())
+        enemy = Enemy(pygame.Rect(0, 0, 28, 28), vx=FAST)
+        enemy.rect.right = START_RIGHT
+        enemy.rect.bottom = GROUND_TOP_Y
+        entity_manager.add_enemy(enemy)
+
+        entity_manager.update_enemies()
+
+        self.assertEqual(enemy.rect.right, WALL.left)
+        self.assertLess(enemy.vx, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
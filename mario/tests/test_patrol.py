@@ -0,0 +1,46 @@
+"""NumPy 순찰 백엔드가 파이썬 백엔드와 같은 월드를 시뮬레이션하는지 확인합니다"""
+
+import unittest
+
+from support import make_game
+
+import pygame
+
+from headless import ScriptedInput
+from patrol import NUMPY_AVAILABLE
+from replay import state_hash
+
+STEPS = 1200
+
+
+def _script(frame):
+    """오른쪽으로 달리며 두 플레이어가 번갈아 점프하는 입력"""
+    keys = {pygame.K_RIGHT, pygame.K_d}
+    if frame % 40 < 20:
+        keys.add(pygame.K_SPACE)
+    if frame % 50 < 25:
+        keys.add(pygame.K_w)
+    return keys
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy가 설치되어 있지 않습니다")
+class PatrolBackendTest(unittest.TestCase):
+    def test_despawn_matches_python_backend(self):
+        python_game = make_game("python", input_source=ScriptedInput(_script))
+        numpy_game = make_game("numpy", input_source=ScriptedInput(_script))
+        self.assertIsNotNone(numpy_game.entity_manager.patrols)
+
+        despawned = 0
+        for step in range(1, STEPS + 1):
+            python_game.step(1)
+            numpy_game.step(1)
+            self.assertEqual(
+                state_hash(python_game), state_hash(numpy_game), f"step {step}"
+            )
+            despawned = max(despawned, python_game.entity_manager.despawned_column)
+        # 청크 열을 버리는 구간을 지나야 의미 있는 비교
+        self.assertGreater(despawned, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()